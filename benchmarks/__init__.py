@@ -0,0 +1,3 @@
+"""
+Offline benchmark suite for Outris CLI hot paths
+"""
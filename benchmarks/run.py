@@ -0,0 +1,291 @@
+"""
+Run the Outris benchmark suite
+
+    python -m benchmarks.run                       # write .benchmarks/latest.json
+    python -m benchmarks.run --baseline base.json  # compare and fail on regressions
+    python -m benchmarks.run --quick -k render     # fewer repeats, only matching cases
+
+Everything runs offline: network benchmarks use the local stand-in server
+from outris.mock_server and the CLI runs against the mock backend with a
+throwaway HOME.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = REPO_ROOT / ".benchmarks" / "latest.json"
+
+BENCHMARKS: Dict[str, Callable[[int], List[float]]] = {}
+
+def benchmark(name: str):
+    """Register fn(repeat) -> list of per-run timings in ms"""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+def _time_calls(fn: Callable[[], None], repeat: int, number: int = 1) -> List[float]:
+    """Time `number` calls of fn, `repeat` times, returning ms per call"""
+    fn()  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) * 1000 / number)
+    return timings
+
+def _big_result(rows: int) -> dict:
+    return {
+        "result": {"data": [{"id": i, "name": f"item {i}", "price": i * 1.5, "tags": ["a", "b"]}
+                            for i in range(rows)]},
+        "api_used": "Bench API",
+        "execution_time_ms": 42,
+        "cost": 0.001,
+    }
+
+def _big_spec(paths: int) -> dict:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Bench API", "version": "1.0"},
+        "paths": {
+            f"/resources{i}/{{id}}": {
+                "get": {
+                    "operationId": f"getResource{i}",
+                    "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                    "responses": {"200": {"description": "OK", "content": {"application/json": {
+                        "schema": {"$ref": f"#/components/schemas/Resource{i}"}}}}},
+                }
+            }
+            for i in range(paths)
+        },
+        "components": {"schemas": {
+            f"Resource{i}": {"type": "object", "properties": {
+                "id": {"type": "string"}, "name": {"type": "string"}, "size": {"type": "integer"}}}
+            for i in range(paths)
+        }},
+    }
+
+# --- CLI cold start ------------------------------------------------------
+
+def _cli_timings(args: List[str], repeat: int) -> List[float]:
+    env = dict(os.environ, OUTRIS_USE_MOCK="true", PYTHONPATH=str(REPO_ROOT), HOME=tempfile.mkdtemp())
+    command = [sys.executable, "-c", "from outris.main import app; app()", *args]
+    return _time_calls(
+        lambda: subprocess.run(command, env=env, capture_output=True, check=True), repeat
+    )
+
+@benchmark("cli.cold_start.help")
+def bench_cli_help(repeat: int) -> List[float]:
+    return _cli_timings(["--help"], repeat)
+
+@benchmark("cli.cold_start.ask")
+def bench_cli_ask(repeat: int) -> List[float]:
+    return _cli_timings(["ask", "get weather in SF", "--output", "json"], repeat)
+
+# --- Client --------------------------------------------------------------
+
+@benchmark("client.request_overhead")
+def bench_request_overhead(repeat: int) -> List[float]:
+    from outris.client import RealBackendClient
+    from outris.mock_server import MockServer
+
+    server = MockServer().start()
+    try:
+        with RealBackendClient(base_url=server.url) as client:
+            return _time_calls(client.list_team, repeat, number=50)
+    finally:
+        server.stop()
+
+@benchmark("client.batch_throughput")
+def bench_batch_throughput(repeat: int) -> List[float]:
+    """ms per query for 200 queries on 16 workers against a 20ms backend"""
+    from outris.client import RealBackendClient
+    from outris.mock_server import MockServer, MockServerConfig
+    from outris.utils.concurrency import bounded_map
+
+    server = MockServer(config=MockServerConfig(latency="20")).start()
+    try:
+        with RealBackendClient(base_url=server.url, pool_maxsize=16) as client:
+            queries = [f"query {i}" for i in range(200)]
+            run = lambda: list(bounded_map(client.query, queries, workers=16))
+            return [t / len(queries) for t in _time_calls(run, max(1, repeat // 3))]
+    finally:
+        server.stop()
+
+# --- Rendering -----------------------------------------------------------
+
+def _render_timings(render: Callable[[dict], None], module, result: dict, repeat: int) -> List[float]:
+    from rich.console import Console
+
+    original = module.console
+    module.console = Console(file=io.StringIO(), width=120, force_terminal=True)
+    try:
+        return _time_calls(lambda: render(result), repeat)
+    finally:
+        module.console = original
+
+@benchmark("render.pretty.small")
+def bench_render_pretty_small(repeat: int) -> List[float]:
+    from outris.client import MockBackendClient
+    from outris.commands import query
+    return _render_timings(query._render_pretty, query, MockBackendClient().query("bench"), repeat)
+
+@benchmark("render.pretty.huge")
+def bench_render_pretty_huge(repeat: int) -> List[float]:
+    from outris.commands import query
+    return _render_timings(query._render_pretty, query, _big_result(5000), repeat)
+
+@benchmark("render.table.small")
+def bench_render_table_small(repeat: int) -> List[float]:
+    from outris.client import MockBackendClient
+    from outris.commands import query
+    return _render_timings(query._render_table, query, MockBackendClient().query("bench"), repeat)
+
+@benchmark("render.table.huge")
+def bench_render_table_huge(repeat: int) -> List[float]:
+    from outris.commands import query
+    result = {"result": {f"field_{i}": f"value {i}" for i in range(5000)}}
+    return _render_timings(query._render_table, query, result, repeat)
+
+@benchmark("render.format_table.small")
+def bench_format_table_small(repeat: int) -> List[float]:
+    from outris.utils import formatters
+    rows = _big_result(10)["result"]["data"]
+    return _render_timings(lambda r: formatters.format_table(r), formatters, rows, repeat)
+
+@benchmark("render.format_table.huge")
+def bench_format_table_huge(repeat: int) -> List[float]:
+    from outris.utils import formatters
+    rows = _big_result(5000)["result"]["data"]
+    return _render_timings(lambda r: formatters.format_table(r), formatters, rows, repeat)
+
+# --- Spec loading --------------------------------------------------------
+
+def _spec_timings(suffix: str, repeat: int) -> List[float]:
+    from outris.spec import load_spec
+
+    spec = _big_spec(3000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"spec{suffix}"
+        if suffix == ".json":
+            path.write_text(json.dumps(spec))
+        else:
+            import yaml
+            path.write_text(yaml.safe_dump(spec, sort_keys=False))
+        return _time_calls(lambda: load_spec(path), repeat)
+
+@benchmark("spec.load.json")
+def bench_spec_json(repeat: int) -> List[float]:
+    return _spec_timings(".json", repeat)
+
+@benchmark("spec.load.yaml")
+def bench_spec_yaml(repeat: int) -> List[float]:
+    return _spec_timings(".yaml", max(1, repeat // 3))
+
+# --- Config --------------------------------------------------------------
+
+def _with_temp_config(fn: Callable[[], List[float]]) -> List[float]:
+    from outris import config
+
+    saved = (config.CONFIG_DIR, config.CONFIG_FILE)
+    with tempfile.TemporaryDirectory() as tmp:
+        config.CONFIG_DIR = Path(tmp)
+        config.CONFIG_FILE = Path(tmp) / "config.json"
+        config._set_cache(None, {})
+        try:
+            config.save_config({"api_key": "sk_outris_bench_key_0000", "org_id": "org_bench"})
+            return fn()
+        finally:
+            config.CONFIG_DIR, config.CONFIG_FILE = saved
+            config._set_cache(None, {})
+
+@benchmark("config.load")
+def bench_config_load(repeat: int) -> List[float]:
+    from outris import config
+    return _with_temp_config(lambda: _time_calls(config.get_api_key, repeat, number=200))
+
+@benchmark("config.save")
+def bench_config_save(repeat: int) -> List[float]:
+    from outris import config
+    data = {"api_key": "sk_outris_bench_key_0000", "org_id": "org_bench"}
+    return _with_temp_config(lambda: _time_calls(lambda: config.save_config(data), repeat, number=20))
+
+# --- Runner --------------------------------------------------------------
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "min_ms": round(min(timings), 4),
+        "mean_ms": round(statistics.fmean(timings), 4),
+        "runs": len(timings),
+    }
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Return names of benchmarks whose median regressed by more than threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        change = current["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0.0
+        current["change"] = round(change, 4)
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write results JSON")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="Allowed median slowdown (0.20 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=15, help="Timed runs per benchmark")
+    parser.add_argument("--quick", action="store_true", help="Only 3 runs per benchmark")
+    parser.add_argument("-k", dest="pattern", default="", help="Only run benchmarks containing this text")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(REPO_ROOT))
+    repeat = 3 if args.quick else args.repeat
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if args.pattern and args.pattern not in name:
+            continue
+        results[name] = summarize(fn(repeat))
+        print(f"{name:32} {results[name]['median_ms']:>10.3f} ms", flush=True)
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        for name, current in results.items():
+            if "change" in current:
+                flag = "  REGRESSION" if name in regressions else ""
+                print(f"{name:32} {current['change']:>+9.1%}{flag}")
+        status = 1 if regressions else 0
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps({
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }, indent=2))
+    print(f"\nResults written to {args.output}")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+On-disk query result cache stored in ~/.outris/cache.db
+
+Caching is opt-in per API: results are only stored when the API that
+answered the query has a TTL configured (`outris query cache enable <api>`),
+so mutating queries against other APIs are never served from cache.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from outris import config
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+def normalize_query(query_text: str) -> str:
+    """Case- and whitespace-insensitive form of a query"""
+    return " ".join(query_text.lower().split())
+
+def get_cache_ttls() -> Dict[str, int]:
+    """API name -> TTL in seconds for APIs whose results may be cached"""
+    return config.load_config().get("cache_ttls", {})
+
+def set_cache_ttl(api_name: str, ttl: Optional[int]):
+    """Enable caching for an API with the given TTL, or disable it with None"""
+    ttls = dict(get_cache_ttls())
+    if ttl:
+        ttls[api_name] = ttl
+    else:
+        ttls.pop(api_name, None)
+    config.update_config({"cache_ttls": ttls})
+
+
+class QueryCache:
+    """SQLite-backed result cache with per-entry TTL and LRU eviction by size"""
+
+    def __init__(self, path: Path = None, max_bytes: int = None):
+        self.path = path or config.CONFIG_DIR / "cache.db"
+        self.max_bytes = max_bytes or int(os.getenv("OUTRIS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.path.parent.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                api TEXT,
+                result TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+            CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        """)
+
+    @staticmethod
+    def key(query_text: str, org_id: Optional[str]) -> str:
+        """Cache key for a query within an org"""
+        raw = f"{org_id or ''}\0{normalize_query(query_text)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _bump(self, name: str):
+        self._db.execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,)
+        )
+
+    def get(self, query_text: str, org_id: Optional[str], apis: Iterable[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached result, or None on a miss; with apis, only results from those APIs"""
+        key = self.key(query_text, org_id)
+        now = time.time()
+        sql, params = "SELECT result FROM entries WHERE key = ? AND expires_at > ?", [key, now]
+        if apis is not None:
+            apis = list(apis)
+            sql += f" AND api IN ({', '.join('?' * len(apis))})"
+            params += apis
+        with self._lock:
+            row = self._db.execute(sql, params).fetchone()
+            if row is None:
+                self._bump("misses")
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._bump("hits")
+        return json.loads(row[0])
+
+    def put(self, query_text: str, org_id: Optional[str], result: Dict[str, Any], ttl: int):
+        """Store a result for ttl seconds, evicting least recently used entries over the size cap"""
+        payload = json.dumps(result)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, api, result, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(query_text, org_id), result.get('api_used'), payload,
+                 len(payload), now + ttl, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then LRU entries until under max_bytes"""
+        self._db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._bump("evictions")
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            counters = dict(self._db.execute("SELECT name, value FROM stats").fetchall())
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def purge_api(self, api_name: str) -> int:
+        """Remove every entry answered by an API, returning how many were dropped"""
+        with self._lock:
+            return self._db.execute("DELETE FROM entries WHERE api = ?", (api_name,)).rowcount
+
+    def clear(self):
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM stats")
+
+    def close(self):
+        self._db.close()
+
+
+def cached_query(
+    client,
+    query_text: str,
+    cache: Optional[QueryCache],
+    refresh: bool = False,
+    read_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run client.query through the result cache
+
+    Pass cache=None to bypass caching. With refresh=True the cache is not
+    consulted but a fresh result is still stored. read_only is passed on to
+    client.query to allow hedging.
+    """
+    ttls = get_cache_ttls()
+    if cache is None or not ttls:
+        return client.query(query_text, read_only=read_only)
+
+    org_id = config.get_org_id()
+    if not refresh:
+        # Only APIs still opted in are served, even if older entries remain
+        hit = cache.get(query_text, org_id, apis=ttls)
+        if hit is not None:
+            hit["cached"] = True
+            return hit
+
+    result = client.query(query_text, read_only=read_only)
+    ttl = ttls.get(result.get('api_used'))
+    if ttl:
+        cache.put(query_text, org_id, result, ttl)
+    return result
@@ -0,0 +1,92 @@
+"""
+Local API catalog index persisted in ~/.outris/catalog.json
+
+Keeps the last `list_apis` response per scope along with its ETag (or the
+server's version stamp) so the client can revalidate with If-None-Match and
+resolve API names to ids without downloading the full list.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from outris import config
+
+
+class ApiCatalog:
+    """Name -> API entry index with per-scope revalidation tokens"""
+
+    def __init__(self, path: Path = None):
+        self.path = path or config.CONFIG_DIR / "catalog.json"
+        self._lock = threading.Lock()
+        self._org_id = config.get_org_id()
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._load()
+
+    @property
+    def org_id(self) -> Optional[str]:
+        """The org this catalog indexes"""
+        return self._org_id
+
+    def _load(self):
+        """Read the persisted catalog, ignoring it if it belongs to another org"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("org_id") != self._org_id:
+            return
+        for scope, entry in data.get("scopes", {}).items():
+            self._set_scope(scope, entry["payload"], entry.get("etag"))
+
+    def _save(self):
+        config.ensure_config_dir()
+        config.write_json_atomic(
+            self.path, {"org_id": self._org_id, "scopes": self._scopes}, indent=None
+        )
+
+    def _set_scope(self, scope: str, payload: Dict[str, Any], etag: Optional[str]):
+        self._scopes[scope] = {"etag": etag, "payload": payload}
+        self._index[scope] = {api['name']: api for api in payload.get('apis', [])}
+
+    def etag(self, scope: str) -> Optional[str]:
+        """Revalidation token for a scope, if one is cached"""
+        entry = self._scopes.get(scope)
+        return entry["etag"] if entry else None
+
+    def payload(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Cached list_apis response for a scope"""
+        entry = self._scopes.get(scope)
+        return entry["payload"] if entry else None
+
+    def store(self, scope: str, payload: Dict[str, Any], etag: Optional[str]):
+        """Replace a scope with a fresh list_apis response"""
+        with self._lock:
+            self._set_scope(scope, payload, etag)
+            self._save()
+
+    def lookup(self, name: str, scope: str = "org") -> Optional[Dict[str, Any]]:
+        """Find an API by name in O(1)"""
+        return self._index.get(scope, {}).get(name)
+
+    def upsert(self, api: Dict[str, Any], scope: str = "org"):
+        """Add or replace one API locally, e.g. after register or install
+
+        The scope's revalidation token is dropped so the next list is a full fetch.
+        """
+        with self._lock:
+            payload = self._scopes.get(scope, {}).get("payload") or {"count": 0, "apis": []}
+            apis = [a for a in payload['apis'] if a['name'] != api['name']] + [api]
+            self._set_scope(scope, {**payload, "count": len(apis), "apis": apis}, None)
+            self._save()
+
+    def invalidate(self, scope: str = None):
+        """Forget one scope, or the whole catalog"""
+        with self._lock:
+            for name in ([scope] if scope else list(self._scopes)):
+                self._scopes.pop(name, None)
+                self._index.pop(name, None)
+            self._save()
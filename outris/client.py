@@ -2,10 +2,44 @@
 Backend API client - supports mock and real backends
 """
 
+import asyncio
+import contextvars
+import json
 import os
-import requests
-from typing import Dict, Any, Protocol
-from outris.config import get_api_key
+import socket
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Dict, Any, Iterator, Optional, Protocol, Tuple
+from outris import profiling
+from outris.catalog import ApiCatalog
+from outris.coalescing import SingleFlight
+from outris.compression import accept_encoding, choose_encoding, compress
+from outris.config import get_api_key, get_org_id
+from outris.hedging import Hedger
+from outris.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from outris.scheduler import AdaptiveScheduler
+from outris.streaming import QueryEvent, parse_ndjson, parse_sse
+
+DEFAULT_API_URL = "https://outris-api.railway.app"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Statistics of the command running in this context, when it has its own (see command_stats)
+_command_stats: contextvars.ContextVar = contextvars.ContextVar("outris_command_stats", default=None)
+
+# Statuses servers and proxies return for a request body they can't decode
+REJECTED_ENCODING_STATUSES = (400, 413, 415, 422)
+
+# List endpoints that can be saved to a file without parsing
+EXPORT_PATHS = {
+    "apis": "/api/v1/apis",
+    "team": "/api/v1/team/members",
+    "marketplace": "/api/v1/marketplace",
+}
 
 class BackendClient(Protocol):
     """Interface for backend clients"""
@@ -13,15 +47,21 @@ class BackendClient(Protocol):
     def verify_otp(self, email: str, otp: str) -> Dict[str, Any]: ...
     def login(self, email: str) -> Dict[str, Any]: ...
     def register_api(self, spec: Dict, name: str, visibility: str) -> Dict[str, Any]: ...
+    def update_api_spec(self, api_id: str, patch: Dict[str, Any]) -> Dict[str, Any]: ...
     def add_secret(self, api_name: str, key_name: str, value: str) -> Dict[str, Any]: ...
     def list_apis(self, scope: str = "all") -> Dict[str, Any]: ...
-    def query(self, query_text: str) -> Dict[str, Any]: ...
-    def get_history(self, limit: int = 10) -> Dict[str, Any]: ...
+    def query(self, query_text: str, read_only: bool = False) -> Dict[str, Any]: ...
+    def query_stream(self, query_text: str) -> Iterator[QueryEvent]: ...
+    def get_history(self, limit: int = 10, since: Optional[str] = None,
+                    until: Optional[str] = None) -> Dict[str, Any]: ...
     def invite_member(self, email: str, role: str) -> Dict[str, Any]: ...
     def accept_invitation(self, token: str, email: str, otp: str) -> Dict[str, Any]: ...
     def list_team(self) -> Dict[str, Any]: ...
     def get_marketplace(self) -> Dict[str, Any]: ...
     def install_from_marketplace(self, api_name: str) -> Dict[str, Any]: ...
+    def query_to_file(self, query_text: str, dest: Path, decompress: bool = True) -> Dict[str, Any]: ...
+    def export_to_file(self, resource: str, dest: Path, params: Dict[str, Any] = None,
+                       decompress: bool = True) -> Dict[str, Any]: ...
 
 
 class MockBackendClient:
@@ -56,6 +96,15 @@ class MockBackendClient:
             "visibility": visibility
         }
     
+    def update_api_spec(self, api_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+        changed = sum(len(item) for item in patch.get("paths", {}).values()) + len(patch.get("removed", []))
+        return {
+            "api_id": api_id,
+            "name": patch["name"],
+            "intent_mappings": changed,
+            "visibility": patch["visibility"]
+        }
+    
     def add_secret(self, api_name: str, key_name: str, value: str) -> Dict[str, Any]:
         return {
             "message": f"Secret {key_name} stored (MOCKED)"
@@ -65,13 +114,13 @@ class MockBackendClient:
         return {
             "count": 3,
             "apis": [
-                {"name": "Mock Weather API", "visibility": "public", "endpoints": 5},
-                {"name": "Mock Payment API", "visibility": "org", "endpoints": 12},
-                {"name": "Mock Analytics API", "visibility": "private", "endpoints": 8},
+                {"api_id": "api_mock_weather", "name": "Mock Weather API", "visibility": "public", "endpoints": 5},
+                {"api_id": "api_mock_payment", "name": "Mock Payment API", "visibility": "org", "endpoints": 12},
+                {"api_id": "api_mock_analytics", "name": "Mock Analytics API", "visibility": "private", "endpoints": 8},
             ]
         }
     
-    def query(self, query_text: str) -> Dict[str, Any]:
+    def query(self, query_text: str, read_only: bool = False) -> Dict[str, Any]:
         return {
             "result": {
                 "message": f"Mock result for: {query_text}",
@@ -82,13 +131,28 @@ class MockBackendClient:
             "cost": 0.001
         }
     
-    def get_history(self, limit: int = 10) -> Dict[str, Any]:
+    def query_stream(self, query_text: str) -> Iterator[QueryEvent]:
+        result = self.query(query_text)
+        yield QueryEvent("stage", {"stage": "intent_resolved", "message": f"Weather lookup: {query_text}"})
+        yield QueryEvent("stage", {"stage": "api_selected", "message": result["api_used"]})
+        yield QueryEvent("stage", {"stage": "request_sent", "message": "GET /weather"})
+        yield QueryEvent("partial", {"data": result["result"]["data"]})
+        yield QueryEvent("result", result)
+    
+    def get_history(self, limit: int = 10, since: Optional[str] = None,
+                    until: Optional[str] = None) -> Dict[str, Any]:
+        """Latest entries first: newer than since, no newer than until"""
+        queries = [
+            {"query": "get weather in SF", "api": "Mock Weather", "timestamp": "2025-11-09T10:30:00Z"},
+            {"query": "create charge $50", "api": "Mock Payment", "timestamp": "2025-11-09T09:15:00Z"},
+        ]
+        if since:
+            queries = [q for q in queries if q["timestamp"] > since]
+        if until:
+            queries = [q for q in queries if q["timestamp"] <= until]
         return {
-            "count": 2,
-            "queries": [
-                {"query": "get weather in SF", "api": "Mock Weather", "timestamp": "2025-11-09T10:30:00Z"},
-                {"query": "create charge $50", "api": "Mock Payment", "timestamp": "2025-11-09T09:15:00Z"},
-            ]
+            "count": len(queries[:limit]),
+            "queries": queries[:limit]
         }
     
     def invite_member(self, email: str, role: str) -> Dict[str, Any]:
@@ -128,30 +192,282 @@ class MockBackendClient:
             "message": f"{api_name} added to your org (MOCKED)",
             "api_id": "api_marketplace_123"
         }
+    
+    def _write(self, payload: Dict[str, Any], dest: Path) -> Dict[str, Any]:
+        start = time.perf_counter()
+        with open(dest, 'w') as f:
+            json.dump(payload, f)
+        size = Path(dest).stat().st_size
+        return {"bytes_written": size, "bytes_received": size, "content_encoding": None,
+                "elapsed_ms": (time.perf_counter() - start) * 1000}
+    
+    def query_to_file(self, query_text: str, dest: Path, decompress: bool = True) -> Dict[str, Any]:
+        return self._write(self.query(query_text), dest)
+    
+    def export_to_file(self, resource: str, dest: Path, params: Dict[str, Any] = None,
+                       decompress: bool = True) -> Dict[str, Any]:
+        method = {"apis": self.list_apis, "team": self.list_team, "marketplace": self.get_marketplace}[resource]
+        return self._write(method(**(params or {})), dest)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment"""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _never_sent(error: Exception) -> bool:
+    """True if a request failed before any of it reached the server"""
+    import requests
+    from urllib3.exceptions import NewConnectionError
+    
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def _keepalive_adapter(pool_connections: int, pool_maxsize: int):
+    """HTTPAdapter that enables TCP keep-alive and disables Nagle on pooled sockets"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            options = list(HTTPConnection.default_socket_options)
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            kwargs.setdefault('socket_options', options)
+            super().init_poolmanager(*args, **kwargs)
+            # Connections report dns/connect/tls spans when profiling is on
+            self.poolmanager.pool_classes_by_scheme = profiling.timed_pool_classes()
+    
+    return KeepAliveAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
+    )
 
 
 class RealBackendClient:
-    """Real HTTP client for deployed backend"""
+    """Real HTTP client for deployed backend
+    
+    Every call goes through one long-lived ``requests.Session`` so TCP and TLS
+    connections are reused across requests. Pool sizes and timeouts can be set
+    with arguments or with the ``OUTRIS_POOL_*`` / ``OUTRIS_*_TIMEOUT`` env vars.
+    
+    JSON bodies above ``compress_min_bytes`` are sent gzip/zstd-compressed;
+    byte counts are kept in ``stats``.
+    
+    Transient failures are retried according to ``retry_policy`` and a
+    ``CircuitBreaker`` fails fast while the backend is down. POSTs are only
+    resent after a 5xx or timeout when they carry an ``Idempotency-Key``, either
+    supplied by the caller or generated with ``OUTRIS_IDEMPOTENCY_KEYS=true``
+    (for backends that dedupe on it); retry counts and wait time are kept in
+    ``stats``.
+    
+    ``query(..., read_only=True)`` hedges slow queries through ``hedger``.
+    """
     
-    def __init__(self, base_url: str = None):
-        self.base_url = base_url or os.getenv(
-            "OUTRIS_API_URL",
-            "https://outris-api.railway.app"
+    def __init__(
+        self,
+        base_url: str = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        compression: str = None,
+        compress_min_bytes: int = None,
+        retry_policy: RetryPolicy = None,
+        breaker: CircuitBreaker = None,
+    ):
+        self.base_url = base_url or os.getenv("OUTRIS_API_URL", DEFAULT_API_URL)
+        self.compression = choose_encoding(compression or os.getenv("OUTRIS_COMPRESSION", "auto"))
+        self.compress_min_bytes = compress_min_bytes or _env_int("OUTRIS_COMPRESS_MIN_BYTES", 64 * 1024)
+        self._stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        self.pool_connections = pool_connections or _env_int("OUTRIS_POOL_CONNECTIONS", 10)
+        self.pool_maxsize = pool_maxsize or _env_int("OUTRIS_POOL_MAXSIZE", 10)
+        self.timeout: Tuple[float, float] = (
+            connect_timeout or _env_float("OUTRIS_CONNECT_TIMEOUT", 5.0),
+            read_timeout or _env_float("OUTRIS_READ_TIMEOUT", 60.0),
         )
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.breaker = breaker or CircuitBreaker()
+        self.idempotency_keys = os.getenv("OUTRIS_IDEMPOTENCY_KEYS", "false").lower() == "true"
+        self.hedger = Hedger(max_workers=self.pool_maxsize * 2, count=self._count)
+        self.inflight = SingleFlight(count=self._count)
+        self.scheduler = AdaptiveScheduler()
+        self.session = self._build_session()
+        self._catalog = None
+        # Close pooled sockets when the client is garbage collected or at exit
+        self._finalizer = weakref.finalize(self, self.session.close)
     
-    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request with auth"""
+    def _build_session(self) -> "requests.Session":
+        """Create the pooled keep-alive session shared by all requests"""
+        # Imported here so commands that never touch the network skip loading requests
+        import requests
+        
+        session = requests.Session()
+        adapter = _keepalive_adapter(self.pool_connections, self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        session.headers["Accept-Encoding"] = accept_encoding()
+        return session
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.hedger.close()
+        self._finalizer()
+    
+    def __enter__(self) -> "RealBackendClient":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def catalog(self) -> ApiCatalog:
+        """Local API catalog index, loaded on first use and reloaded when the org changes"""
+        if self._catalog is None or self._catalog.org_id != get_org_id():
+            self._catalog = ApiCatalog()
+        return self._catalog
+    
+    @property
+    def stats(self) -> Counter:
+        """Statistics of the current command, or of the client's whole lifetime"""
+        scoped = _command_stats.get()
+        return self._stats if scoped is None else scoped
+    
+    def _count(self, name: str, amount: float = 1):
+        """Increment a client statistic"""
+        scoped = _command_stats.get()
+        with self._stats_lock:
+            self._stats[name] += amount
+            if scoped is not None:
+                scoped[name] += amount
+    
+    def _encode_body(self, kwargs: Dict[str, Any]) -> bytes:
+        """Serialize a json= body, compressing it above the size threshold
+        
+        Returns the uncompressed body so the request can be resent without
+        compression if the server rejects it.
+        """
+        raw = json.dumps(kwargs.pop('json'), separators=(',', ':')).encode()
+        kwargs['headers']['Content-Type'] = 'application/json'
+        body = raw
+        if self.compression and len(raw) >= self.compress_min_bytes:
+            body = compress(raw, self.compression)
+            kwargs['headers']['Content-Encoding'] = self.compression
+        kwargs['data'] = body
+        self._count("bytes_uncompressed", len(raw))
+        self._count("bytes_sent", len(body))
+        return raw
+    
+    def _send(self, method: str, path: str, **kwargs) -> "requests.Response":
+        """Make HTTP request with auth and retries, returning the raw response"""
+        import requests
+        
         url = f"{self.base_url}{path}"
+        kwargs['headers'] = dict(kwargs.get('headers') or {})
         
         # Add API key header if available
         api_key = get_api_key()
         if api_key:
-            kwargs.setdefault('headers', {})
             kwargs['headers']['X-API-Key'] = api_key
+        if method in ('POST', 'PATCH') and self.idempotency_keys:
+            # One key per logical call, reused by every retry, so the server can dedupe
+            kwargs['headers'].setdefault('Idempotency-Key', uuid.uuid4().hex)
         
-        response = requests.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        kwargs.setdefault('timeout', self.timeout)
+        raw_body = self._encode_body(kwargs) if 'json' in kwargs else None
+        stream = kwargs.pop('stream', False)
+        
+        endpoint = f"{method} {path.split('?')[0]}"
+        attempt = 1
+        while True:
+            self.breaker.before_call()
+            self.scheduler.before_request(endpoint)
+            try:
+                response = self._attempt(method, url, path, raw_body, stream, kwargs)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if self.breaker.record_failure():
+                    self._count("circuit_opened")
+                retryable = _never_sent(e) or self.retry_policy.is_idempotent(method, kwargs['headers'])
+                if not retryable or attempt >= self.retry_policy.max_attempts:
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+            except BaseException:
+                # Any other error (undecodable body, bad URL, Ctrl-C) must still end a half-open trial
+                self.breaker.release()
+                raise
+            else:
+                status = response.status_code
+                self.scheduler.after_response(endpoint, status, response.headers)
+                if status >= 500:
+                    if self.breaker.record_failure():
+                        self._count("circuit_opened")
+                else:
+                    self.breaker.record_success()
+                if (attempt >= self.retry_policy.max_attempts
+                        or not self.retry_policy.should_retry_status(status, method, kwargs['headers'])):
+                    response.raise_for_status()
+                    return response
+                delay = self.retry_policy.backoff(attempt, parse_retry_after(response.headers.get('Retry-After')))
+                response.close()
+            
+            self._count("retries")
+            self._count("retry_wait_s", delay)
+            with profiling.span("retry.wait", path=path, attempt=attempt):
+                time.sleep(delay)
+            attempt += 1
+    
+    def _attempt(self, method: str, url: str, path: str, raw_body: Optional[bytes], stream: bool,
+                 kwargs: Dict[str, Any]) -> "requests.Response":
+        """Send one attempt, downloading the body unless streaming"""
+        with profiling.span("http.request", method=method, path=path):
+            response = self._timed_request(method, url, **kwargs)
+            
+            if response.status_code in REJECTED_ENCODING_STATUSES and kwargs['headers'].pop('Content-Encoding', None):
+                # The server or a proxy may not decode compressed bodies: resend once as plain JSON
+                response.close()
+                kwargs['data'] = raw_body
+                self._count("bytes_sent", len(raw_body))
+                response = self._timed_request(method, url, **kwargs)
+                if response.status_code not in REJECTED_ENCODING_STATUSES:
+                    # It was the encoding; stop compressing for this session
+                    self.compression = None
+            
+            if not stream:
+                with profiling.span("http.download", path=path):
+                    content = response.content
+                self._count("bytes_decoded", len(content))
+                self._count("bytes_received", response.raw.tell() or len(content))
+        return response
+    
+    def _timed_request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request and return once headers arrive (time to first byte)"""
+        with profiling.span("http.ttfb", method=method):
+            return self.session.request(method, url, stream=True, **kwargs)
+    
+    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with auth; concurrent identical GETs share one call"""
+        def send():
+            response = self._send(method, path, **kwargs)
+            with profiling.span("json.decode", path=path):
+                return response.json()
+        if method == 'GET':
+            return self._coalesced(method, path, send, params=kwargs.get('params'))
+        return send()
+    
+    def _coalesced(self, method: str, path: str, call, body: Any = None, params: Any = None) -> Any:
+        """Run call, or join an identical one already in flight for this org"""
+        key = (method, path, json.dumps(body, sort_keys=True), json.dumps(params, sort_keys=True), get_org_id())
+        return self.inflight.do(key, call)
     
     def signup(self, email: str, org_name: str) -> Dict[str, Any]:
         return self._request('POST', '/api/v1/auth/signup', json={
@@ -171,35 +487,112 @@ class RealBackendClient:
         })
     
     def register_api(self, spec: Dict, name: str, visibility: str) -> Dict[str, Any]:
-        return self._request('POST', '/api/v1/apis/register', json={
+        result = self._request('POST', '/api/v1/apis/register', json={
             "spec": spec,
             "name": name,
             "visibility": visibility
         })
+        if 'api_id' in result:
+            self.catalog.upsert(result, scope="org")
+        return result
+    
+    def update_api_spec(self, api_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply added/modified/removed operations to a registered spec"""
+        result = self._request('PATCH', f'/api/v1/apis/{api_id}/spec', json=patch)
+        if 'api_id' in result:
+            self.catalog.upsert(result, scope="org")
+        return result
+    
+    def _resolve_api_id(self, api_name: str, refresh: bool = False) -> Optional[str]:
+        """Look up an API id in the local catalog, revalidating it on a miss"""
+        api = None if refresh else self.catalog.lookup(api_name, scope="org")
+        if api is None:
+            self.list_apis(scope="org")
+            api = self.catalog.lookup(api_name, scope="org")
+        return api['api_id'] if api else None
     
     def add_secret(self, api_name: str, key_name: str, value: str) -> Dict[str, Any]:
-        # First get API ID from name
-        apis = self.list_apis(scope="org")
-        api_id = next((a['api_id'] for a in apis['apis'] if a['name'] == api_name), None)
+        import requests
         
+        body = {"key_name": key_name, "value": value}
+        api_id = self._resolve_api_id(api_name)
         if not api_id:
             raise ValueError(f"API '{api_name}' not found")
         
-        return self._request('POST', f'/api/v1/apis/{api_id}/secrets', json={
-            "key_name": key_name,
-            "value": value
-        })
+        try:
+            return self._request('POST', f'/api/v1/apis/{api_id}/secrets', json=body)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+        
+        # Stale catalog entry (API deleted or re-registered): refetch and retry once
+        api_id = self._resolve_api_id(api_name, refresh=True)
+        if not api_id:
+            raise ValueError(f"API '{api_name}' not found")
+        return self._request('POST', f'/api/v1/apis/{api_id}/secrets', json=body)
     
     def list_apis(self, scope: str = "all") -> Dict[str, Any]:
-        return self._request('GET', f'/api/v1/apis?scope={scope}')
+        headers = {}
+        etag = self.catalog.etag(scope)
+        if etag:
+            headers['If-None-Match'] = etag
+        
+        def fetch():
+            response = self._send('GET', f'/api/v1/apis?scope={scope}', headers=headers)
+            if response.status_code == 304:
+                return self.catalog.payload(scope)
+            
+            result = response.json()
+            # Prefer the ETag header; fall back to a version stamp in the body
+            etag = response.headers.get('ETag') or result.get('version')
+            self.catalog.store(scope, result, str(etag) if etag is not None else None)
+            return result
+        return self._coalesced('GET', f'/api/v1/apis?scope={scope}', fetch)
     
-    def query(self, query_text: str) -> Dict[str, Any]:
-        return self._request('POST', '/api/v1/query', json={
-            "query": query_text
-        })
+    def query(self, query_text: str, read_only: bool = False) -> Dict[str, Any]:
+        """Run a query; read-only queries share identical in-flight calls and are hedged when slow"""
+        body = {"query": query_text}
+        send = lambda: self._request('POST', '/api/v1/query', json=body)
+        if read_only:
+            # Bulk runs (-j) may have more queries in flight than the default pool
+            self.hedger.reserve(self.scheduler.max_concurrency)
+            return self._coalesced('POST', '/api/v1/query', lambda: self.hedger.run(send), body=body)
+        return send()
     
-    def get_history(self, limit: int = 10) -> Dict[str, Any]:
-        return self._request('GET', f'/api/v1/history?limit={limit}')
+    def query_stream(self, query_text: str) -> Iterator[QueryEvent]:
+        """Run a query, yielding stage, partial and result events as they arrive
+        
+        Closing the generator aborts the request. Backends without the
+        streaming endpoint get a plain query, reported as a single result event.
+        """
+        import requests
+        
+        try:
+            response = self._send('POST', '/api/v1/query/stream', json={"query": query_text},
+                                  headers={"Accept": "text/event-stream, application/x-ndjson"}, stream=True)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in (404, 405, 501):
+                raise
+            yield QueryEvent("result", self.query(query_text))
+            return
+        
+        try:
+            lines = response.iter_lines(decode_unicode=True)
+            if "ndjson" in response.headers.get("Content-Type", ""):
+                yield from parse_ndjson(lines)
+            else:
+                yield from parse_sse(lines)
+        finally:
+            response.close()
+    
+    def get_history(self, limit: int = 10, since: Optional[str] = None,
+                    until: Optional[str] = None) -> Dict[str, Any]:
+        params = {"limit": limit}
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        return self._request('GET', '/api/v1/history', params=params)
     
     def invite_member(self, email: str, role: str) -> Dict[str, Any]:
         return self._request('POST', '/api/v1/team/invite', json={
@@ -221,12 +614,296 @@ class RealBackendClient:
         return self._request('GET', '/api/v1/marketplace')
     
     def install_from_marketplace(self, api_name: str) -> Dict[str, Any]:
-        return self._request('POST', '/api/v1/marketplace/install', json={
+        result = self._request('POST', '/api/v1/marketplace/install', json={
             "api_name": api_name
         })
+        # The org's catalog changed; force a full fetch next time
+        self.catalog.invalidate("org")
+        return result
+    
+    def _download(self, method: str, path: str, dest: Path, decompress: bool = True, **kwargs) -> Dict[str, Any]:
+        """Stream a response body to dest in chunks without parsing it
+        
+        The body is written to ``dest.part`` and renamed when complete. With
+        decompress=False the bytes are kept exactly as sent (e.g. gzip).
+        """
+        start = time.perf_counter()
+        response = self._send(method, path, stream=True, **kwargs)
+        dest = Path(dest)
+        partial = dest.with_name(dest.name + ".part")
+        written = 0
+        try:
+            with profiling.span("http.download", path=path), open(partial, 'wb') as f:
+                for chunk in response.raw.stream(DOWNLOAD_CHUNK_SIZE, decode_content=decompress):
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(partial, dest)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        finally:
+            response.close()
+        
+        received = response.raw.tell() or written
+        self._count("bytes_decoded", written)
+        self._count("bytes_received", received)
+        return {
+            "bytes_written": written,
+            "bytes_received": received,
+            "content_encoding": None if decompress else response.headers.get('Content-Encoding'),
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+    
+    def query_to_file(self, query_text: str, dest: Path, decompress: bool = True) -> Dict[str, Any]:
+        """Run a query and save the raw JSON response to dest"""
+        return self._download('POST', '/api/v1/query', dest, decompress, json={"query": query_text})
+    
+    def export_to_file(self, resource: str, dest: Path, params: Dict[str, Any] = None,
+                       decompress: bool = True) -> Dict[str, Any]:
+        """Save the raw JSON of a list endpoint ("apis", "team" or "marketplace") to dest"""
+        return self._download('GET', EXPORT_PATHS[resource], dest, decompress, params=params)
 
 
-def create_client(use_mock: bool = None) -> BackendClient:
+class _AsyncClientBase:
+    """Shared concurrency limit and per-call timeout for async clients"""
+    
+    def __init__(self, max_concurrency: int = None, timeout: float = None):
+        self.max_concurrency = max_concurrency or _env_int("OUTRIS_MAX_CONCURRENCY", 100)
+        self.timeout = timeout
+        # Created on first use so it binds to the loop the client is used from
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+    
+    def _limit(self) -> asyncio.Semaphore:
+        """The concurrency semaphore for the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def _bounded(self, call: Awaitable[Dict[str, Any]], timeout: Optional[float]) -> Dict[str, Any]:
+        """Run a call under the concurrency limit, cancelling it after ``timeout`` seconds"""
+        timeout = timeout if timeout is not None else self.timeout
+        async with self._limit():
+            return await asyncio.wait_for(call, timeout)
+    
+    async def aclose(self):
+        """Release client resources"""
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class AsyncMockBackendClient(_AsyncClientBase):
+    """Async counterpart of MockBackendClient"""
+    
+    def __init__(self, max_concurrency: int = None, timeout: float = None):
+        super().__init__(max_concurrency, timeout)
+        self._mock = MockBackendClient()
+    
+    async def _call(self, method: str, *args, timeout: float = None) -> Dict[str, Any]:
+        async def run():
+            await asyncio.sleep(0)
+            return getattr(self._mock, method)(*args)
+        return await self._bounded(run(), timeout)
+    
+    async def signup(self, email: str, org_name: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('signup', email, org_name, timeout=timeout)
+    
+    async def verify_otp(self, email: str, otp: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('verify_otp', email, otp, timeout=timeout)
+    
+    async def login(self, email: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('login', email, timeout=timeout)
+    
+    async def register_api(self, spec: Dict, name: str, visibility: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('register_api', spec, name, visibility, timeout=timeout)
+    
+    async def add_secret(self, api_name: str, key_name: str, value: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('add_secret', api_name, key_name, value, timeout=timeout)
+    
+    async def list_apis(self, scope: str = "all", *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('list_apis', scope, timeout=timeout)
+    
+    async def query(self, query_text: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('query', query_text, timeout=timeout)
+    
+    async def get_history(self, limit: int = 10, since: Optional[str] = None, until: Optional[str] = None, *,
+                          timeout: float = None) -> Dict[str, Any]:
+        return await self._call('get_history', limit, since, until, timeout=timeout)
+    
+    async def invite_member(self, email: str, role: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('invite_member', email, role, timeout=timeout)
+    
+    async def accept_invitation(self, token: str, email: str, otp: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('accept_invitation', token, email, otp, timeout=timeout)
+    
+    async def list_team(self, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('list_team', timeout=timeout)
+    
+    async def get_marketplace(self, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('get_marketplace', timeout=timeout)
+    
+    async def install_from_marketplace(self, api_name: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._call('install_from_marketplace', api_name, timeout=timeout)
+
+
+class AsyncBackendClient(_AsyncClientBase):
+    """Async HTTP client for deployed backend
+    
+    Requests run on a single event loop over a pooled ``httpx.AsyncClient``.
+    At most ``max_concurrency`` calls are in flight at once; every call accepts
+    a ``timeout`` and can be cancelled like any other coroutine.
+    Requires the optional ``httpx`` dependency (``pip install outris[async]``).
+    """
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        max_concurrency: int = None,
+        timeout: float = None,
+        pool_maxsize: int = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+    ):
+        super().__init__(max_concurrency, timeout)
+        try:
+            import httpx
+        except ImportError:
+            raise RuntimeError("AsyncBackendClient requires httpx: pip install 'outris[async]'")
+        
+        self.base_url = base_url or os.getenv("OUTRIS_API_URL", DEFAULT_API_URL)
+        pool_maxsize = pool_maxsize or _env_int("OUTRIS_POOL_MAXSIZE", 10)
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(
+                max_connections=max(pool_maxsize, self.max_concurrency),
+                max_keepalive_connections=pool_maxsize,
+            ),
+            timeout=httpx.Timeout(
+                read_timeout or _env_float("OUTRIS_READ_TIMEOUT", 60.0),
+                connect=connect_timeout or _env_float("OUTRIS_CONNECT_TIMEOUT", 5.0),
+            ),
+        )
+    
+    async def aclose(self):
+        """Close all pooled connections"""
+        await self.http.aclose()
+    
+    async def _request(self, method: str, path: str, timeout: float = None, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with auth"""
+        api_key = get_api_key()
+        if api_key:
+            kwargs.setdefault('headers', {})
+            kwargs['headers']['X-API-Key'] = api_key
+        
+        async def send():
+            response = await self.http.request(method, path, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        return await self._bounded(send(), timeout)
+    
+    async def signup(self, email: str, org_name: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/auth/signup', timeout, json={
+            "email": email,
+            "org_name": org_name
+        })
+    
+    async def verify_otp(self, email: str, otp: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/auth/verify-otp', timeout, json={
+            "email": email,
+            "otp": otp
+        })
+    
+    async def login(self, email: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/auth/login', timeout, json={
+            "email": email
+        })
+    
+    async def register_api(self, spec: Dict, name: str, visibility: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/apis/register', timeout, json={
+            "spec": spec,
+            "name": name,
+            "visibility": visibility
+        })
+    
+    async def add_secret(self, api_name: str, key_name: str, value: str, *, timeout: float = None) -> Dict[str, Any]:
+        apis = await self.list_apis(scope="org", timeout=timeout)
+        api_id = next((a['api_id'] for a in apis['apis'] if a['name'] == api_name), None)
+        
+        if not api_id:
+            raise ValueError(f"API '{api_name}' not found")
+        
+        return await self._request('POST', f'/api/v1/apis/{api_id}/secrets', timeout, json={
+            "key_name": key_name,
+            "value": value
+        })
+    
+    async def list_apis(self, scope: str = "all", *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('GET', f'/api/v1/apis?scope={scope}', timeout)
+    
+    async def query(self, query_text: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/query', timeout, json={
+            "query": query_text
+        })
+    
+    async def get_history(self, limit: int = 10, since: Optional[str] = None, until: Optional[str] = None, *,
+                          timeout: float = None) -> Dict[str, Any]:
+        params = {"limit": limit}
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        return await self._request('GET', '/api/v1/history', timeout, params=params)
+    
+    async def invite_member(self, email: str, role: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/team/invite', timeout, json={
+            "email": email,
+            "role": role
+        })
+    
+    async def accept_invitation(self, token: str, email: str, otp: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/team/accept', timeout, json={
+            "token": token,
+            "email": email,
+            "otp": otp
+        })
+    
+    async def list_team(self, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('GET', '/api/v1/team/members', timeout)
+    
+    async def get_marketplace(self, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('GET', '/api/v1/marketplace', timeout)
+    
+    async def install_from_marketplace(self, api_name: str, *, timeout: float = None) -> Dict[str, Any]:
+        return await self._request('POST', '/api/v1/marketplace/install', timeout, json={
+            "api_name": api_name
+        })
+
+
+_shared_client: Optional[RealBackendClient] = None
+_reuse_clients = False
+_shared_lock = threading.Lock()
+
+@contextmanager
+def command_stats():
+    """Give the enclosed command its own client statistics (used by the daemon's shared client)"""
+    token = _command_stats.set(Counter())
+    try:
+        yield
+    finally:
+        _command_stats.reset(token)
+
+def enable_client_reuse():
+    """Make create_client hand out one long-lived RealBackendClient (used by the daemon)"""
+    global _reuse_clients
+    _reuse_clients = True
+
+def create_client(use_mock: bool = None, asynchronous: bool = False):
     """
     Factory function to create appropriate client
     
@@ -234,11 +911,20 @@ def create_client(use_mock: bool = None) -> BackendClient:
     - Explicitly requested via use_mock=True
     - Environment variable OUTRIS_USE_MOCK is set
     - Backend not ready (development mode)
+    
+    Pass asynchronous=True to get an awaitable client for use in asyncio code.
     """
+    global _shared_client
     if use_mock is None:
         use_mock = os.getenv("OUTRIS_USE_MOCK", "true").lower() == "true"
     
+    if asynchronous:
+        return AsyncMockBackendClient() if use_mock else AsyncBackendClient()
     if use_mock:
         return MockBackendClient()
-    else:
+    if not _reuse_clients:
         return RealBackendClient()
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = RealBackendClient()
+        return _shared_client
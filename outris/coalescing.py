@@ -0,0 +1,58 @@
+"""
+Single-flight request coalescing
+
+Concurrent callers asking for the same key share one underlying call: the
+first caller runs it, the others wait and get its result (or exception).
+Nothing is cached once the call finishes.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key
+
+    Waiting callers receive a shallow copy of the leader's result so they can
+    annotate it without affecting each other. ``count("coalesced")`` is
+    called for every call saved.
+    """
+
+    def __init__(self, count: Callable[[str], None] = None):
+        self.count = count or (lambda name: None)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.count("coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.copy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
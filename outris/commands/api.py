@@ -2,58 +2,196 @@
 API management commands: add, add-secret, list
 """
 
+import time
 import typer
-import yaml
+from collections import Counter
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
 from outris.client import create_client
+from outris.registry import SpecRegistry, register_spec
+from outris.scheduler import scheduler_for
+from outris.spec import ParsedSpec, find_specs, parse_spec, parse_specs
+from outris.utils.formatters import ROW_FORMATS, parse_fields, print_download_summary, print_transfer_stats, write_rows
+from outris.utils.stats import latency_summary
 
 app = typer.Typer()
 console = Console()
 
 @app.command()
 def add(
-    spec_path: str = typer.Argument(..., help="Path to OpenAPI spec (YAML/JSON)"),
+    spec_paths: List[str] = typer.Argument(..., help="OpenAPI specs (YAML/JSON): files, directories or glob patterns"),
     visibility: str = typer.Option("org", help="Visibility: private, org, public"),
-    name: str = typer.Option("", help="Custom API name"),
+    name: str = typer.Option("", help="Custom API name (single spec only)"),
+    prune: bool = typer.Option(False, "--prune/--no-prune", help="Drop unused and duplicate components before upload"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Don't prompt (skip adding credentials)"),
+    force: bool = typer.Option(False, "--force", help="Upload in full even if the spec hasn't changed"),
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Maximum concurrent uploads"),
+    parse_jobs: int = typer.Option(0, "--parse-jobs", help="Processes parsing specs (default: CPU count)"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show transfer sizes"),
 ):
-    """Register new API from OpenAPI specification"""
+    """Register new APIs from OpenAPI specifications"""
     
-    # Load spec file
-    spec_file = Path(spec_path)
-    if not spec_file.exists():
-        console.print(f"[red]✗[/red] File not found: {spec_path}")
+    paths = find_specs(spec_paths)
+    if not paths:
+        console.print(f"[red]✗[/red] No spec files found: {' '.join(spec_paths)}")
         raise typer.Exit(1)
+    if len(paths) > 1:
+        if name:
+            console.print("[red]✗[/red] --name can only be used with a single spec")
+            raise typer.Exit(1)
+        _add_many(paths, visibility, prune, jobs, parse_jobs or None, force, verbose)
+        return
+    
+    spec_file = paths[0]
+    with console.status(f"Parsing {spec_file.name}..."):
+        parsed = parse_spec(spec_file, prune)
+    if not parsed.ok:
+        console.print(f"[red]✗[/red] {spec_file}: {parsed.error}")
+        raise typer.Exit(1)
+    spec = parsed.spec
     
-    with open(spec_file) as f:
-        if spec_path.endswith('.yaml') or spec_path.endswith('.yml'):
-            spec = yaml.safe_load(f)
-        else:
-            import json
-            spec = json.load(f)
+    if parsed.pruned:
+        console.print(f"[dim]Pruned {parsed.pruned['unused']} unused and {parsed.pruned['deduplicated']} "
+                      f"duplicate components[/dim]")
     
     # Extract name from spec if not provided
     if not name:
-        name = spec.get('info', {}).get('title', spec_file.stem)
+        name = _spec_name(parsed)
     
     # Register API
     client = create_client()
     
+    registry = SpecRegistry()
+    start = time.perf_counter()
     with console.status(f"Registering {name}..."):
-        result = client.register_api(spec, name, visibility)
+        result = register_spec(client, spec, name, visibility, registry, force=force)
+    registry.save()
+    upload_ms = (time.perf_counter() - start) * 1000
+    change = result['change']
+    
+    if change['mode'] == "unchanged":
+        console.print(f"[green]✓[/green] [cyan]{result['name']}[/cyan] is unchanged since it was last registered; "
+                      f"skipped upload [dim](--force to upload anyway)[/dim]")
+        return
     
     console.print(f"\n[green]✓[/green] API registered: [cyan]{result['name']}[/cyan]")
     console.print(f"  Endpoints discovered: [cyan]{result['endpoints']}[/cyan]")
     console.print(f"  Intent mappings generated: [cyan]{result['intent_mappings']}[/cyan]")
     console.print(f"  Visibility: [cyan]{visibility}[/cyan]")
+    if change['mode'] != "new":
+        _print_changes(change)
+    console.print(f"[dim]  Parse: {parsed.parse_ms:.0f}ms  Upload: {upload_ms:.0f}ms[/dim]")
+    if verbose and hasattr(client, 'stats'):
+        print_transfer_stats(client.stats)
     
     # Optionally add secrets
-    if Confirm.ask("\nAdd API credentials?"):
+    if not yes and Confirm.ask("\nAdd API credentials?"):
         add_secret(result['name'])
 
+def _spec_name(parsed: ParsedSpec) -> str:
+    return parsed.spec.get('info', {}).get('title') or parsed.path.stem
+
+def _print_changes(change: Dict[str, Any], limit: int = 20):
+    """List operations added (+), modified (~) and removed (-) since the last registration"""
+    how = "sent as a patch" if change['mode'] == "patched" else "full upload"
+    console.print(f"  Changes: [green]+{len(change['added'])}[/green] [yellow]~{len(change['modified'])}[/yellow] "
+                  f"[red]-{len(change['removed'])}[/red] operations [dim]({how})[/dim]")
+    lines = [("green", "+", key) for key in change['added']]
+    lines += [("yellow", "~", key) for key in change['modified']]
+    lines += [("red", "-", key) for key in change['removed']]
+    for style, mark, key in lines[:limit]:
+        console.print(f"    [{style}]{mark}[/{style}] {key}")
+    if len(lines) > limit:
+        console.print(f"    [dim]... and {len(lines) - limit} more[/dim]")
+
+def _change_label(change: Dict[str, Any]) -> str:
+    if change['mode'] in ("new", "unchanged"):
+        return change['mode']
+    return (f"{change['mode']} +{len(change['added'])} ~{len(change['modified'])} "
+            f"-{len(change['removed'])}")
+
+def _add_many(paths: List[Path], visibility: str, prune: bool, jobs: int, parse_jobs: Optional[int], force: bool,
+              verbose: bool):
+    """Parse specs in parallel and upload them concurrently as each one is ready"""
+    client = create_client()
+    registry = SpecRegistry()
+    scheduler = scheduler_for(client, jobs)
+    modes = Counter()
+    total, done = len(paths), 0
+    failures: List[Tuple[Path, str]] = []
+    parse_ms, upload_ms = [], []
+    start = time.perf_counter()
+    
+    def report(line: str):
+        nonlocal done
+        done += 1
+        console.print(f"[dim][{done}/{total}][/dim] {line}")
+    
+    def parsed_specs():
+        for parsed in parse_specs(paths, prune, parse_jobs):
+            if parsed.ok:
+                parse_ms.append(parsed.parse_ms)
+                yield parsed
+            else:
+                failures.append((parsed.path, parsed.error))
+                report(f"[red]✗[/red] {parsed.path}: {parsed.error}")
+    
+    def upload(parsed: ParsedSpec):
+        began = time.perf_counter()
+        result = register_spec(client, parsed.spec, _spec_name(parsed), visibility, registry, force=force)
+        return result, (time.perf_counter() - began) * 1000
+    
+    console.print(f"Registering [cyan]{total}[/cyan] specs ({visibility})\n")
+    try:
+        for outcome in scheduler.map(upload, parsed_specs()):
+            parsed = outcome.item
+            if outcome.ok:
+                result, elapsed_ms = outcome.value
+                mode = result['change']['mode']
+                modes[mode] += 1
+                if mode != "unchanged":
+                    upload_ms.append(elapsed_ms)
+                report(f"[green]✓[/green] [cyan]{result['name']}[/cyan] {_change_label(result['change'])} "
+                       f"[dim]{result['endpoints']} endpoints, parse {parsed.parse_ms:.0f}ms, "
+                       f"upload {elapsed_ms:.0f}ms[/dim]")
+            else:
+                failures.append((parsed.path, str(outcome.error)))
+                report(f"[red]✗[/red] {parsed.path}: {outcome.error}")
+    finally:
+        # Keep the hashes of whatever was uploaded, even if interrupted
+        registry.save()
+    
+    _print_add_report(total, failures, time.perf_counter() - start, parse_ms, upload_ms, modes)
+    if verbose and hasattr(client, 'stats'):
+        print_transfer_stats(client.stats)
+    if failures:
+        raise typer.Exit(1)
+
+def _print_add_report(total: int, failures: List[Tuple[Path, str]], elapsed: float, parse_ms: List[float],
+                      upload_ms: List[float], modes: Counter):
+    """Print counts, timing percentiles and each failure"""
+    console.print(f"\n[bold]Registered {total - len(failures)} of {total} specs[/bold] in {elapsed:.2f}s")
+    console.print(f"  New: [cyan]{modes['new']}[/cyan]  Unchanged (skipped): [dim]{modes['unchanged']}[/dim]  "
+                  f"Patched: [green]{modes['patched']}[/green]  Full upload: [yellow]{modes['full']}[/yellow]")
+    table = Table(title="Timings (ms)")
+    table.add_column("Phase", style="cyan")
+    for column in ("total", "p50", "p95", "max"):
+        table.add_column(column, justify="right", style="green")
+    for label, values in (("parse", parse_ms), ("upload", upload_ms)):
+        if values:
+            summary = latency_summary(values)
+            table.add_row(label, f"{sum(values):.0f}", f"{summary['p50']:.0f}", f"{summary['p95']:.0f}",
+                          f"{max(values):.0f}")
+    console.print(table)
+    if failures:
+        console.print(f"\n[red]Failed ({len(failures)}):[/red]")
+        for path, error in failures:
+            console.print(f"  [red]✗[/red] {path}: {error}")
+
 @app.command()
 def add_secret(
     api_name: str = typer.Argument(..., help="API name"),
@@ -77,12 +215,24 @@ def add_secret(
 @app.command()
 def list(
     scope: str = typer.Option("all", help="Scope: all, org, public"),
+    output: str = typer.Option("table", help="Output format: table, ndjson, csv"),
+    fields: str = typer.Option("", help="Comma-separated columns for ndjson/csv (default: all)"),
+    output_file: str = typer.Option("", "--output-file", help="Stream the raw JSON response to this file without parsing it"),
+    compressed: bool = typer.Option(False, "--compressed", help="With --output-file, keep the body as sent on the wire (e.g. gzip)"),
 ):
     """List registered APIs"""
     
     client = create_client()
+    if output_file:
+        info = client.export_to_file("apis", output_file, {"scope": scope}, decompress=not compressed)
+        print_download_summary(info, output_file)
+        return
     result = client.list_apis(scope)
     
+    if output in ROW_FORMATS:
+        write_rows(result['apis'], output, parse_fields(fields))
+        return
+    
     if result['count'] == 0:
         console.print("[yellow]No APIs found[/yellow]")
         console.print("\nAdd an API: [cyan]outris add-api <spec.yaml>[/cyan]")
@@ -7,7 +7,7 @@ from rich.console import Console
 from rich.prompt import Prompt
 
 from outris.client import create_client
-from outris.config import save_config, clear_config, load_config
+from outris.config import update_config, clear_config, load_config
 
 app = typer.Typer()
 console = Console()
@@ -35,8 +35,8 @@ def signup():
     with console.status("Verifying code..."):
         result = client.verify_otp(email, otp)
     
-    # Save config
-    save_config({
+    # Save credentials, keeping other settings (e.g. cache TTLs)
+    update_config({
         "api_key": result["api_key"],
         "email": result["email"],
         "org_id": result["org_id"],
@@ -73,8 +73,8 @@ def login():
     with console.status("Verifying code..."):
         result = client.verify_otp(email, otp)
     
-    # Save config
-    save_config({
+    # Save credentials, keeping other settings (e.g. cache TTLs)
+    update_config({
         "api_key": result["api_key"],
         "email": result["email"],
         "org_id": result["org_id"],
@@ -0,0 +1,69 @@
+"""
+Daemon commands: start, stop, status
+"""
+
+import subprocess
+import sys
+import time
+
+import typer
+from rich.console import Console
+
+from outris import launcher
+from outris.daemon import DEFAULT_IDLE_TIMEOUT, DaemonServer
+
+app = typer.Typer()
+console = Console()
+
+@app.command()
+def start(
+    idle_timeout: float = typer.Option(DEFAULT_IDLE_TIMEOUT, help="Exit after this many idle seconds"),
+    foreground: bool = typer.Option(False, "--foreground", help="Run in this process instead of detaching"),
+):
+    """Start a background daemon that keeps connections and caches warm"""
+    
+    status = launcher.request({"control": "status"})
+    if status is not None:
+        console.print(f"[yellow]Daemon already running[/yellow] (pid {status['pid']})")
+        return
+    
+    if foreground:
+        console.print(f"[green]✓[/green] Listening on [cyan]{launcher.socket_path()}[/cyan]")
+        DaemonServer(idle_timeout=idle_timeout).serve()
+        return
+    
+    subprocess.Popen(
+        [sys.executable, "-m", "outris.daemon", "--idle-timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        status = launcher.request({"control": "status"})
+        if status is not None:
+            console.print(f"[green]✓[/green] Daemon started (pid {status['pid']}, idle timeout {idle_timeout:g}s)")
+            return
+        time.sleep(0.05)
+    console.print("[red]✗[/red] Daemon did not start")
+    raise typer.Exit(1)
+
+@app.command()
+def stop():
+    """Stop the running daemon"""
+    
+    if launcher.request({"control": "stop"}) is None:
+        console.print("[yellow]No daemon running[/yellow]")
+        return
+    console.print("[green]✓[/green] Daemon stopping")
+
+@app.command()
+def status():
+    """Show whether the daemon is running"""
+    
+    status = launcher.request({"control": "status"})
+    if status is None:
+        console.print("[dim]No daemon running[/dim]")
+        raise typer.Exit(1)
+    console.print(f"[green]●[/green] Running (pid {status['pid']})")
+    console.print(f"  Uptime: {status['uptime_s']}s, commands served: {status['served']}")
+    console.print(f"  Idle timeout: {status['idle_timeout_s']:g}s")
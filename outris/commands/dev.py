@@ -0,0 +1,48 @@
+"""
+Developer tools: serve-mock
+"""
+
+import typer
+from rich.console import Console
+
+app = typer.Typer()
+console = Console()
+
+@app.command()
+def serve_mock(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind"),
+    port: int = typer.Option(8765, help="Port to listen on"),
+    latency: str = typer.Option("0", help="Latency in ms: 50, uniform:10,100, normal:50,10, lognormal:50,0.5"),
+    error_rate: float = typer.Option(0.0, help="Fraction of requests failing with 503"),
+    rate_limit_rate: float = typer.Option(0.0, help="Fraction of requests rejected with 429"),
+    retry_after: float = typer.Option(1.0, help="Retry-After seconds sent with 429s"),
+    payload_bytes: int = typer.Option(0, help="Extra bytes of padding in query results"),
+    chunk_size: int = typer.Option(0, help="Stream responses in chunks of this many bytes"),
+    chunk_delay: float = typer.Option(0.0, help="Seconds to pause between streamed chunks"),
+    seed: int = typer.Option(None, help="Random seed for reproducible fault injection"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Log every request"),
+):
+    """Run a local stand-in backend with latency and fault injection"""
+    from outris.mock_server import MockServer, MockServerConfig
+    
+    config = MockServerConfig(
+        latency=latency,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        retry_after=retry_after,
+        payload_bytes=payload_bytes,
+        chunk_size=chunk_size,
+        chunk_delay=chunk_delay,
+        seed=seed,
+    )
+    server = MockServer(host, port, config, verbose=verbose)
+    
+    console.print(f"[green]✓[/green] Mock backend listening on [cyan]{server.url}[/cyan]")
+    console.print(f"[dim]Point the CLI at it: export OUTRIS_USE_MOCK=false OUTRIS_API_URL={server.url}[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        console.print(f"\n[dim]Served {server.stats.get('requests', 0)} requests[/dim]")
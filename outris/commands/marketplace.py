@@ -2,11 +2,15 @@
 Marketplace commands: browse, install
 """
 
+from typing import List
+
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from outris.client import create_client
+from outris.scheduler import scheduler_for
+from outris.utils.formatters import ROW_FORMATS, parse_fields, print_download_summary, write_rows
 
 app = typer.Typer()
 console = Console()
@@ -14,23 +18,38 @@ console = Console()
 @app.command()
 def browse(
     category: str = typer.Option("", help="Filter by category"),
+    output: str = typer.Option("table", help="Output format: table, ndjson, csv"),
+    fields: str = typer.Option("", help="Comma-separated columns for ndjson/csv (default: all)"),
+    output_file: str = typer.Option("", "--output-file", help="Stream the raw JSON response to this file without parsing it"),
+    compressed: bool = typer.Option(False, "--compressed", help="With --output-file, keep the body as sent on the wire (e.g. gzip)"),
 ):
     """Browse public API marketplace"""
     
+    if output_file and category:
+        # The endpoint can't filter, and filtering locally would mean parsing the body
+        console.print("[red]✗[/red] --category can't be used with --output-file")
+        raise typer.Exit(1)
     client = create_client()
+    if output_file:
+        print_download_summary(client.export_to_file("marketplace", output_file, decompress=not compressed), output_file)
+        return
     result = client.get_marketplace()
     
-    table = Table(title="API Marketplace")
-    table.add_column("Name", style="cyan")
-    table.add_column("Category", style="yellow")
-    table.add_column("Installs", justify="right", style="green")
-    
     apis = result['apis']
     
     # Filter by category if specified
     if category:
         apis = [a for a in apis if a['category'].lower() == category.lower()]
     
+    if output in ROW_FORMATS:
+        write_rows(apis, output, parse_fields(fields))
+        return
+    
+    table = Table(title="API Marketplace")
+    table.add_column("Name", style="cyan")
+    table.add_column("Category", style="yellow")
+    table.add_column("Installs", justify="right", style="green")
+    
     for api in apis:
         table.add_row(
             api['name'],
@@ -44,16 +63,28 @@ def browse(
 
 @app.command()
 def install(
-    api_name: str = typer.Argument(..., help="API name to install"),
+    api_names: List[str] = typer.Argument(..., help="API names to install"),
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Maximum installs running at once"),
 ):
-    """Install public API from marketplace"""
+    """Install public APIs from marketplace"""
     
     client = create_client()
     
-    with console.status(f"Installing {api_name}..."):
-        result = client.install_from_marketplace(api_name)
-    
-    console.print(f"[green]✓[/green] {result['message']}")
-    console.print(f"[dim]API ID: {result['api_id']}[/dim]")
+    if len(api_names) == 1:
+        with console.status(f"Installing {api_names[0]}..."):
+            result = client.install_from_marketplace(api_names[0])
+        console.print(f"[green]✓[/green] {result['message']}")
+        console.print(f"[dim]API ID: {result['api_id']}[/dim]")
+    else:
+        failed = 0
+        for outcome in scheduler_for(client, jobs).map(client.install_from_marketplace, api_names):
+            if outcome.ok:
+                console.print(f"[green]✓[/green] {outcome.item} [dim]({outcome.value['api_id']})[/dim]")
+            else:
+                failed += 1
+                console.print(f"[red]✗[/red] {outcome.item}: {outcome.error}")
+        console.print(f"\n[dim]Installed {len(api_names) - failed} of {len(api_names)}[/dim]")
+        if failed:
+            raise typer.Exit(1)
     console.print(f"\nYou can now query this API:")
     console.print(f"  [cyan]outris ask \"your query\"[/cyan]")
@@ -1,58 +1,149 @@
 """
-Query commands: ask, interactive, history
+Query commands: ask, interactive, history, batch, pipe, cache
 """
 
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
-from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.text import Text
+import csv
 import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
 
+from outris import profiling
+from outris.cache import QueryCache, cached_query, get_cache_ttls, set_cache_ttl
 from outris.client import create_client
+from outris.history import HistoryStore
+from outris.scheduler import scheduler_for
+from outris.streaming import STAGE_LABELS, QueryEvent, result_from_events
+from outris.utils.formatters import ROW_FORMATS, parse_fields, print_download_summary, print_transfer_stats, write_rows
+from outris.utils.render import render_json
+from outris.utils.stats import latency_summary
 
 app = typer.Typer()
+cache_app = typer.Typer()
+app.add_typer(cache_app, name="cache", help="Manage the local query result cache")
 console = Console()
+err_console = Console(stderr=True)
+
+def _open_cache(use_cache: bool):
+    """Open the result cache if enabled and at least one API opted in"""
+    if use_cache and get_cache_ttls():
+        return QueryCache()
+    return None
 
 @app.command()
 def ask(
     query_text: str = typer.Argument(..., help="Natural language query"),
-    output: str = typer.Option("pretty", help="Output format: pretty, json, table"),
+    output: str = typer.Option("pretty", help="Output format: pretty, json, table, ndjson, csv"),
+    fields: str = typer.Option("", help="Comma-separated columns for ndjson/csv (default: from the first row)"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Use cached results for cache-enabled APIs"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached results but store the fresh one"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show transfer sizes"),
+    read_only: bool = typer.Option(False, "--read-only", "--hedge", help="Queries are read-only: share identical ones in flight and resend slow ones"),
+    max_render_bytes: Optional[int] = typer.Option(
+        None, "--max-render-bytes", help="Truncate terminal output of large results (0 = never; default 1 MiB)"
+    ),
+    pager: Optional[bool] = typer.Option(
+        None, "--pager/--no-pager", help="Page large results (default: automatically on a terminal)"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Show progress and partial results as they arrive (bypasses the cache)"
+    ),
+    output_file: str = typer.Option("", "--output-file", help="Stream the raw JSON response to this file without parsing it"),
+    compressed: bool = typer.Option(False, "--compressed", help="With --output-file, keep the body as sent on the wire (e.g. gzip)"),
 ):
     """Query APIs using natural language"""
     
-    console.print(f"\n[bold blue]Processing:[/bold blue] {query_text}\n")
+    if output_file:
+        client = create_client()
+        with err_console.status("Executing query..."):
+            info = client.query_to_file(query_text, output_file, decompress=not compressed)
+        HistoryStore().record(query_text, {})
+        print_download_summary(info, output_file)
+        return
+    
+    rows_only = output in ROW_FORMATS
+    if not rows_only:
+        console.print(f"\n[bold blue]Processing:[/bold blue] {query_text}\n")
     
     client = create_client()
+    cache = _open_cache(use_cache)
+    
+    if stream:
+        try:
+            result = _stream_query(client, query_text, console if output in ("pretty", "table") else err_console)
+        except KeyboardInterrupt:
+            err_console.print("[yellow]Aborted[/yellow]")
+            raise typer.Exit(130)
+    else:
+        with err_console.status("Executing query...") if rows_only else console.status("Executing query..."):
+            result = cached_query(client, query_text, cache, refresh=refresh, read_only=read_only)
+    HistoryStore().record(query_text, result)
+    
+    if 'execution_time_ms' in result:
+        profiling.annotate(server_time_ms=result['execution_time_ms'])
     
-    with console.status("Executing query..."):
-        result = client.query(query_text)
+    with profiling.span("render", output=output):
+        if output == "json":
+            render_json(result, console, max_bytes=max_render_bytes, pager=pager)
+        elif output == "pretty":
+            _render_pretty(result, max_render_bytes, pager)
+        elif output == "table":
+            _render_table(result)
+        elif rows_only:
+            write_rows(_result_rows(result), output, parse_fields(fields))
     
-    if output == "json":
-        console.print_json(data=result)
-    elif output == "pretty":
-        _render_pretty(result)
-    elif output == "table":
-        _render_table(result)
+    if verbose and hasattr(client, 'stats'):
+        print_transfer_stats(client.stats)
 
-def _render_pretty(result: dict):
+def _render_pretty(result: dict, max_bytes: Optional[int] = None, pager: Optional[bool] = None):
     """Render query result with Rich formatting"""
     
     # Main result
     if 'result' in result:
-        console.print(Panel(
-            Syntax(json.dumps(result['result'], indent=2), "json"),
-            title="Result",
-            border_style="green"
-        ))
+        render_json(result['result'], console, title="Result", max_bytes=max_bytes, pager=pager)
     
     # Metadata
     console.print(f"\n[dim]API used:[/dim] [cyan]{result.get('api_used', 'N/A')}[/cyan]")
-    console.print(f"[dim]Response time:[/dim] [cyan]{result.get('execution_time_ms', 0)}ms[/cyan]")
+    console.print(f"[dim]Response time:[/dim] [cyan]{result.get('execution_time_ms', 0)}ms[/cyan]"
+                  + (" [yellow](cached)[/yellow]" if result.get('cached') else ""))
     
     if 'cost' in result:
         console.print(f"[dim]Cost:[/dim] [cyan]${result['cost']:.4f}[/cyan]")
 
+def _stream_query(client, query_text: str, progress: Console) -> dict:
+    """Run a streamed query, printing stages and partial data as they arrive"""
+    def show(event: QueryEvent):
+        if event.type == "stage":
+            stage = event.data.get('stage', '')
+            progress.print(f"[green]✓[/green] {STAGE_LABELS.get(stage, stage)} "
+                           f"[dim]{event.data.get('message', '')}[/dim]")
+        elif event.type == "partial":
+            preview = Text(f"… {json.dumps(event.data.get('data'))}", style="dim")
+            progress.print(preview, no_wrap=True, overflow="ellipsis")
+    
+    events = client.query_stream(query_text)
+    try:
+        return result_from_events(events, show)
+    finally:
+        # Closing the generator aborts the request if we stopped early
+        events.close()
+
+def _result_rows(result: dict) -> list:
+    """Rows of a list-shaped result: the list itself, or the one list of objects inside it"""
+    payload = result.get('result')
+    if isinstance(payload, dict):
+        lists = [v for v in payload.values() if isinstance(v, list) and all(isinstance(i, dict) for i in v)]
+        payload = lists[0] if len(lists) == 1 else [payload]
+    if not isinstance(payload, list):
+        return [{"value": payload}]
+    return [row if isinstance(row, dict) else {"value": row} for row in payload]
+
 def _render_table(result: dict):
     """Render query result as table (for list results)"""
     from rich.table import Table
@@ -68,13 +159,19 @@ def _render_table(result: dict):
     console.print(table)
 
 @app.command()
-def interactive():
+def interactive(
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Use cached results for cache-enabled APIs"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached results but store fresh ones"),
+    stream: bool = typer.Option(False, "--stream", help="Show progress and partial results as they arrive (Ctrl-C aborts a query)"),
+):
     """Start interactive CLI session"""
     
     console.print("\n[bold]Outris Interactive Mode[/bold]")
     console.print("Type [cyan]exit[/cyan] to quit, [cyan]help[/cyan] for commands\n")
     
     client = create_client()
+    cache = _open_cache(use_cache)
+    store = HistoryStore()
     
     while True:
         try:
@@ -90,8 +187,17 @@ def interactive():
                 console.print("  [cyan]<any query>[/cyan] - Execute natural language query\n")
                 continue
             
-            result = client.query(query_text)
-            _render_pretty(result)
+            if stream:
+                try:
+                    result = _stream_query(client, query_text, console)
+                except KeyboardInterrupt:
+                    console.print("[yellow]Aborted[/yellow]\n")
+                    continue
+            else:
+                result = cached_query(client, query_text, cache, refresh=refresh)
+            store.record(query_text, result)
+            with profiling.span("render", output="pretty"):
+                _render_pretty(result)
             console.print()  # Blank line
             
         except KeyboardInterrupt:
@@ -103,24 +209,232 @@ def interactive():
 @app.command()
 def history(
     limit: int = typer.Option(10, help="Number of recent queries to show"),
+    offset: int = typer.Option(0, help="Skip this many matching queries (paging)"),
+    api: str = typer.Option("", "--api", help="Only queries answered by this API"),
+    since: str = typer.Option("", "--since", help="Only queries after an ISO date or age like 7d, 12h"),
+    grep: str = typer.Option("", "--grep", help="Full-text search in query text"),
+    sync: bool = typer.Option(True, "--sync/--no-sync", help="Pull new server history before searching"),
+    output: str = typer.Option("table", help="Output format: table, ndjson, csv"),
+    fields: str = typer.Option("", help="Comma-separated columns for ndjson/csv (default: all)"),
 ):
-    """Show recent query history"""
+    """Search query history (local database, synced from the server)"""
     
-    client = create_client()
-    result = client.get_history(limit)
+    # Keep stdout clean for ndjson/csv
+    status_console = err_console if output in ROW_FORMATS else console
+    store = HistoryStore()
+    if sync:
+        try:
+            with status_console.status("Syncing history..."):
+                store.sync(create_client())
+        except Exception as e:
+            status_console.print(f"[yellow]⚠[/yellow] Sync failed, showing local history: {e}")
+    
+    rows = store.search(grep=grep, api=api, since=since, limit=limit, offset=offset)
+    if output in ROW_FORMATS:
+        write_rows(rows, output, parse_fields(fields))
+        return
     
     from rich.table import Table
     
     table = Table(title="Query History")
     table.add_column("Query", style="cyan")
     table.add_column("API", style="yellow")
+    table.add_column("Time", justify="right", style="green")
     table.add_column("Timestamp", style="dim")
     
-    for query in result['queries']:
+    for query in rows:
+        elapsed = query['execution_time_ms']
         table.add_row(
             query['query'],
-            query['api'],
+            query['api'] or "",
+            f"{elapsed:.0f}ms" if elapsed is not None else "",
             query['timestamp']
         )
     
     console.print(table)
+    if len(rows) == limit:
+        console.print(f"[dim]More results: --offset {offset + limit}[/dim]")
+
+def _read_queries(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield {"id", "query"} records from a JSONL or CSV file"""
+    with open(path, newline='') as f:
+        if path.suffix.lower() == '.csv':
+            reader = csv.DictReader(f)
+            field = 'query' if 'query' in (reader.fieldnames or []) else reader.fieldnames[0]
+            for row in reader:
+                yield {"id": row.get('id'), "query": row[field]}
+            return
+        
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, str):
+                yield {"id": None, "query": record}
+            else:
+                yield {"id": record.get('id'), "query": record['query']}
+
+@app.command()
+def batch(
+    input_file: str = typer.Argument(..., help="JSONL or CSV file of queries"),
+    workers: int = typer.Option(8, "--workers", "-j", help="Number of concurrent queries"),
+    ordered: bool = typer.Option(False, "--ordered", help="Emit results in input order"),
+    out: str = typer.Option("", "--out", help="Write NDJSON results to this file instead of stdout"),
+    read_only: bool = typer.Option(False, "--read-only", "--hedge", help="Queries are read-only: share identical ones in flight and resend slow ones"),
+):
+    """Run many queries concurrently, streaming NDJSON results"""
+    
+    path = Path(input_file)
+    if not path.exists():
+        err_console.print(f"[red]✗[/red] File not found: {input_file}")
+        raise typer.Exit(1)
+    
+    client = create_client()
+    store = HistoryStore()
+    sink = open(out, 'w') if out else sys.stdout
+    wall_ms, server_ms = [], []
+    errors = 0
+    start = time.perf_counter()
+    
+    try:
+        scheduler = scheduler_for(client, workers)
+        outcomes = scheduler.map(
+            lambda record: client.query(record['query'], read_only=read_only),
+            _read_queries(path),
+            ordered=ordered,
+        )
+        for outcome in outcomes:
+            record = {
+                "index": outcome.index,
+                "id": outcome.item['id'],
+                "query": outcome.item['query'],
+                "ok": outcome.ok,
+                "wall_ms": round(outcome.elapsed_ms, 2),
+            }
+            wall_ms.append(outcome.elapsed_ms)
+            if outcome.ok:
+                record["result"] = outcome.value
+                store.record(outcome.item['query'], outcome.value)
+                if 'execution_time_ms' in outcome.value:
+                    server_ms.append(outcome.value['execution_time_ms'])
+            else:
+                errors += 1
+                record["error"] = str(outcome.error)
+            sink.write(json.dumps(record) + "\n")
+            sink.flush()
+    finally:
+        if out:
+            sink.close()
+    
+    elapsed = time.perf_counter() - start
+    _print_batch_summary(len(wall_ms), errors, elapsed, wall_ms, server_ms, getattr(client, 'stats', {}),
+                         scheduler.snapshot())
+    if errors:
+        raise typer.Exit(1)
+
+def _print_batch_summary(total: int, errors: int, elapsed: float, wall_ms: list, server_ms: list, stats: dict = None,
+                         schedule: dict = None):
+    """Print throughput, error count, retries, throttling and latency percentiles to stderr"""
+    from rich.table import Table
+    
+    throughput = total / elapsed if elapsed > 0 else 0.0
+    err_console.print(f"\n[bold]Batch complete:[/bold] {total} queries in {elapsed:.2f}s "
+                      f"([cyan]{throughput:.1f} q/s[/cyan])")
+    err_console.print(f"  Succeeded: [green]{total - errors}[/green]  Failed: [red]{errors}[/red]")
+    if stats and stats.get("retries"):
+        err_console.print(f"  Retries: [yellow]{stats['retries']:.0f}[/yellow] "
+                          f"({stats.get('retry_wait_s', 0):.1f}s waiting)")
+    if stats and stats.get("hedges_fired"):
+        err_console.print(f"  Hedges: [yellow]{stats['hedges_fired']}[/yellow] fired, "
+                          f"[green]{stats.get('hedges_won', 0)}[/green] won")
+    if stats and stats.get("coalesced"):
+        err_console.print(f"  Coalesced: [green]{stats['coalesced']}[/green] calls saved")
+    if schedule and (schedule["throttle_events"] or schedule["decreases"]):
+        err_console.print(f"  Concurrency: peak [cyan]{schedule['peak_concurrency']}[/cyan], "
+                          f"ended at [cyan]{schedule['concurrency']}[/cyan] "
+                          f"({schedule['throttle_events']} throttled, {schedule['decreases']} backoffs)")
+    
+    table = Table(title="Latency (ms)")
+    table.add_column("Source", style="cyan")
+    for column in ("p50", "p95", "p99"):
+        table.add_column(column, justify="right", style="green")
+    for label, values in (("wall", wall_ms), ("server", server_ms)):
+        if values:
+            summary = latency_summary(values)
+            table.add_row(label, *(f"{summary[k]:.1f}" for k in ("p50", "p95", "p99")))
+    err_console.print(table)
+
+@app.command()
+def pipe(
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Number of concurrent queries"),
+    window: int = typer.Option(0, help="Maximum queries in flight (default: 2 x jobs)"),
+    ordered: bool = typer.Option(True, "--ordered/--unordered", help="Keep output in input order"),
+    read_only: bool = typer.Option(False, "--read-only", "--hedge", help="Queries are read-only: share identical ones in flight and resend slow ones"),
+):
+    """Read one query per line from stdin, write one JSON result per line to stdout"""
+    
+    client = create_client()
+    store = HistoryStore()
+    queries = (line.rstrip("\n") for line in sys.stdin if line.strip())
+    
+    # The scheduler pulls from stdin only when a slot frees up, so memory stays
+    # flat and a slow downstream consumer throttles how fast we read
+    outcomes = scheduler_for(client, jobs).map(
+        lambda text: client.query(text, read_only=read_only), queries, ordered=ordered, window=window
+    )
+    try:
+        for outcome in outcomes:
+            if outcome.ok:
+                record = {"query": outcome.item, **outcome.value}
+                store.record(outcome.item, outcome.value)
+            else:
+                record = {"query": outcome.item, "error": str(outcome.error)}
+            sys.stdout.write(json.dumps(record, separators=(',', ':')) + "\n")
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`): stop scheduling work, and point
+        # stdout at devnull so the interpreter's final flush doesn't fail too
+        outcomes.close()
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(0)
+
+@cache_app.command("enable")
+def cache_enable(
+    api_name: str = typer.Argument(..., help="API whose results may be cached"),
+    ttl: int = typer.Option(300, help="Seconds a cached result stays fresh"),
+):
+    """Allow caching of read-only query results for an API"""
+    set_cache_ttl(api_name, ttl)
+    console.print(f"[green]✓[/green] Caching [cyan]{api_name}[/cyan] results for {ttl}s")
+
+@cache_app.command("disable")
+def cache_disable(
+    api_name: str = typer.Argument(..., help="API to stop caching"),
+):
+    """Stop caching results for an API"""
+    set_cache_ttl(api_name, None)
+    purged = QueryCache().purge_api(api_name)
+    console.print(f"[green]✓[/green] Caching disabled for [cyan]{api_name}[/cyan] "
+                  f"[dim]({purged} cached results removed)[/dim]")
+
+@cache_app.command("stats")
+def cache_stats():
+    """Show cache hit/miss statistics"""
+    stats = QueryCache().stats()
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = stats['hits'] / lookups * 100 if lookups else 0.0
+    
+    console.print("\n[bold]Query Cache[/bold]\n")
+    console.print(f"  Hits: [green]{stats['hits']}[/green]  Misses: [yellow]{stats['misses']}[/yellow]"
+                  f"  Hit rate: [cyan]{hit_rate:.1f}%[/cyan]")
+    console.print(f"  Entries: [cyan]{stats['entries']}[/cyan] ({stats['bytes']} bytes)"
+                  f"  Evictions: [dim]{stats['evictions']}[/dim]")
+    for api_name, ttl in get_cache_ttls().items():
+        console.print(f"  [dim]{api_name}: ttl {ttl}s[/dim]")
+
+@cache_app.command("clear")
+def cache_clear():
+    """Remove all cached results"""
+    QueryCache().clear()
+    console.print("[green]✓[/green] Cache cleared")
@@ -2,30 +2,61 @@
 Team collaboration commands: invite, accept, list
 """
 
+from typing import List
+
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
 from outris.client import create_client
+from outris.scheduler import scheduler_for
+from outris.utils.formatters import ROW_FORMATS, parse_fields, print_download_summary, write_rows
 
 app = typer.Typer()
 console = Console()
 
 @app.command()
 def invite(
-    email: str = typer.Argument(..., help="Email address to invite"),
+    emails: List[str] = typer.Argument(None, help="Email addresses to invite"),
     role: str = typer.Option("member", help="Role: admin, member"),
+    from_file: str = typer.Option("", "--from-file", help="Also invite each address in this file (one per line)"),
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Maximum invitations sent at once"),
 ):
-    """Invite team member"""
+    """Invite team members"""
+    
+    emails = [*(emails or []), *_read_lines(from_file)]
+    if not emails:
+        console.print("[red]✗[/red] Give at least one email address or --from-file")
+        raise typer.Exit(1)
     
     client = create_client()
     
-    with console.status(f"Sending invitation to {email}..."):
-        result = client.invite_member(email, role)
+    if len(emails) == 1:
+        with console.status(f"Sending invitation to {emails[0]}..."):
+            result = client.invite_member(emails[0], role)
+        console.print(f"[green]✓[/green] {result['message']}")
+        console.print(f"[dim]Role: {role}[/dim]")
+        return
     
-    console.print(f"[green]✓[/green] {result['message']}")
-    console.print(f"[dim]Role: {role}[/dim]")
+    # Paced by the adaptive scheduler so large invite lists don't trip rate limits
+    scheduler = scheduler_for(client, jobs)
+    failed = 0
+    for outcome in scheduler.map(lambda email: client.invite_member(email, role), emails):
+        if outcome.ok:
+            console.print(f"[green]✓[/green] {outcome.item}")
+        else:
+            failed += 1
+            console.print(f"[red]✗[/red] {outcome.item}: {outcome.error}")
+    console.print(f"\n[dim]Invited {len(emails) - failed} of {len(emails)} as {role}[/dim]")
+    if failed:
+        raise typer.Exit(1)
+
+def _read_lines(path: str) -> List[str]:
+    if not path:
+        return []
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
 
 @app.command()
 def accept(
@@ -52,12 +83,13 @@ def accept(
     with console.status("Verifying and joining team..."):
         result = client.accept_invitation(token, email, otp)
     
-    # Save new config
-    from outris.config import save_config
-    save_config({
+    # Switch credentials, keeping other settings (e.g. cache TTLs)
+    from outris.config import update_config
+    update_config({
         "api_key": result["api_key"],
         "email": email,
         "org_id": result["org_id"],
+        "org_name": result.get("org_name", ""),
         "role": result["role"]
     })
     
@@ -65,12 +97,24 @@ def accept(
     console.print(f"  Role: [cyan]{result['role']}[/cyan]")
 
 @app.command()
-def list():
+def list(
+    output: str = typer.Option("table", help="Output format: table, ndjson, csv"),
+    fields: str = typer.Option("", help="Comma-separated columns for ndjson/csv (default: all)"),
+    output_file: str = typer.Option("", "--output-file", help="Stream the raw JSON response to this file without parsing it"),
+    compressed: bool = typer.Option(False, "--compressed", help="With --output-file, keep the body as sent on the wire (e.g. gzip)"),
+):
     """List team members"""
     
     client = create_client()
+    if output_file:
+        print_download_summary(client.export_to_file("team", output_file, decompress=not compressed), output_file)
+        return
     result = client.list_team()
     
+    if output in ROW_FORMATS:
+        write_rows(result['members'], output, parse_fields(fields))
+        return
+    
     table = Table(title="Team Members")
     table.add_column("Email", style="cyan")
     table.add_column("Role", style="yellow")
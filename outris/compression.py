@@ -0,0 +1,50 @@
+"""
+Request body compression helpers
+
+gzip is always available and is the default, since it is the encoding
+servers most commonly accept. zstd can be requested explicitly when a zstd
+module is installed (`compression.zstd` on Python 3.14+, `backports.zstd`
+or `zstandard`).
+"""
+
+import gzip
+from typing import Callable, Optional
+
+def _zstd_compressor() -> Optional[Callable[[bytes], bytes]]:
+    """Return a zstd compress function if a zstd module is installed"""
+    for module_name in ("compression.zstd", "backports.zstd"):
+        try:
+            module = __import__(module_name, fromlist=["compress"])
+            return module.compress
+        except ImportError:
+            continue
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor().compress
+
+def choose_encoding(preference: str = "auto") -> Optional[str]:
+    """
+    Resolve a compression preference to a Content-Encoding
+
+    "auto" and "gzip" pick gzip; "none" disables compression; "zstd" uses
+    zstd when it is installed and falls back to gzip otherwise.
+    """
+    preference = (preference or "auto").lower()
+    if preference == "none":
+        return None
+    if preference == "zstd" and _zstd_compressor() is not None:
+        return "zstd"
+    return "gzip"
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with the given Content-Encoding"""
+    if encoding == "zstd":
+        return _zstd_compressor()(data)
+    return gzip.compress(data, compresslevel=6)
+
+def accept_encoding() -> str:
+    """Accept-Encoding value covering every decoder urllib3 has available"""
+    from urllib3.util.request import ACCEPT_ENCODING
+    return ACCEPT_ENCODING
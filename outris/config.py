@@ -1,34 +1,113 @@
 """
 Configuration management for Outris CLI
 Stores API key, org info in ~/.outris/config.json
+
+The parsed config is cached in-process and only re-read when the file's
+mtime or size changes. Writes go through a file lock and an atomic rename so
+concurrent CLI processes never see a half-written file.
 """
 
 import json
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on atomic rename only
+    fcntl = None
 
 CONFIG_DIR = Path.home() / ".outris"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+_cache_lock = threading.Lock()
+_cached_stamp: Optional[Tuple[Path, int, int]] = None
+_cached_config: Dict[str, Any] = {}
+
 def ensure_config_dir():
     """Create ~/.outris directory if it doesn't exist"""
     CONFIG_DIR.mkdir(exist_ok=True)
 
+def _file_stamp() -> Optional[Tuple[Path, int, int]]:
+    """(path, mtime, size) of the config file, or None if it doesn't exist"""
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+
+def _read_config() -> Dict[str, Any]:
+    """Read and parse the config file from disk"""
+    with open(CONFIG_FILE, 'r') as f:
+        return json.load(f)
+
+def _set_cache(stamp, config: Dict[str, Any]):
+    global _cached_stamp, _cached_config
+    _cached_stamp = stamp
+    _cached_config = config
+
+@contextmanager
+def _config_lock():
+    """Hold an exclusive lock on ~/.outris/config.lock across processes"""
+    ensure_config_dir()
+    with open(CONFIG_DIR / "config.lock", 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = 2):
+    """Write JSON to a temp file next to path and rename it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _write_atomic(config: Dict[str, Any]):
+    """Write the config file atomically"""
+    write_json_atomic(CONFIG_FILE, config)
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from ~/.outris/config.json"""
-    if not CONFIG_FILE.exists():
+    stamp = _file_stamp()
+    if stamp is None:
         return {}
-    
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+
+    with _cache_lock:
+        if stamp != _cached_stamp:
+            _set_cache(stamp, _read_config())
+        return dict(_cached_config)
 
 def save_config(config: Dict[str, Any]):
     """Save configuration to ~/.outris/config.json"""
-    ensure_config_dir()
-    
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    with _config_lock():
+        _write_atomic(config)
+        with _cache_lock:
+            _set_cache(_file_stamp(), dict(config))
+
+def update_config(changes: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge changes into the stored config without losing concurrent updates"""
+    with _config_lock():
+        config = _read_config() if CONFIG_FILE.exists() else {}
+        config.update(changes)
+        _write_atomic(config)
+        with _cache_lock:
+            _set_cache(_file_stamp(), dict(config))
+    return config
 
 def get_api_key() -> Optional[str]:
     """Get stored API key"""
@@ -42,5 +121,8 @@ def get_org_id() -> Optional[str]:
 
 def clear_config():
     """Clear stored configuration (logout)"""
-    if CONFIG_FILE.exists():
-        CONFIG_FILE.unlink()
+    with _config_lock():
+        if CONFIG_FILE.exists():
+            CONFIG_FILE.unlink()
+        with _cache_lock:
+            _set_cache(None, {})
@@ -0,0 +1,226 @@
+"""
+Background daemon serving forwarded CLI commands
+
+`outris daemon start` runs this server on ~/.outris/daemon.sock (mode 0600,
+same-user peers only). Command modules are imported once, backend clients are
+reused across commands, and config and catalog caches stay warm. Each
+forwarded command runs on its own thread with stdout/stderr captured
+per-thread and its own client statistics, so `-v` reports only its traffic. The daemon exits after ``idle_timeout`` seconds without requests.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List
+
+from outris import launcher
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """sys.stdout/sys.stderr stand-in writing to a per-thread buffer when one is set"""
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    def _target(self):
+        return getattr(self.local, "buffer", None) or self.default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return False if getattr(self.local, "buffer", None) else self.default.isatty()
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+
+def _peer_uid(sock: socket.socket) -> int:
+    """UID of the process on the other end of a Unix socket (Linux and macOS)"""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        return struct.unpack("3i", creds)[1]
+    return os.getpeereid(sock.fileno())[0] if hasattr(os, "getpeereid") else os.getuid()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self):
+        if _peer_uid(self.connection) != os.getuid():
+            return
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        self.server.begin()
+        try:
+            response = self.server.dispatch(message)
+        finally:
+            self.server.end()
+        self.wfile.write(json.dumps(response).encode())
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server running outris commands in a warm process"""
+
+    daemon_threads = True
+    # Bursts of parallel invocations (xargs -P, make -j) shouldn't see ECONNREFUSED
+    request_queue_size = 128
+
+    def __init__(self, path: Path = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.path = Path(path or launcher.socket_path())
+        self.idle_timeout = idle_timeout
+        self.env = launcher.client_env()
+        self.started_at = time.monotonic()
+        self.last_activity = self.started_at
+        self.served = 0
+        self.active = 0
+        self._stopping = False
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(mode=0o700, exist_ok=True)
+        if self.path.exists() or self.path.is_symlink():
+            if launcher.request({"control": "status"}, self.path) is not None:
+                raise RuntimeError(f"A daemon is already listening on {self.path}")
+            self.path.unlink()
+        # Create the socket with owner-only permissions from the start
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.path, 0o600)
+        self._command = self._warm_up()
+
+    def _warm_up(self):
+        """Import every command and keep backend clients alive between commands"""
+        import typer
+        from outris import client
+        from outris.main import LAZY_COMMANDS, app
+
+        client.enable_client_reuse()
+        command = typer.main.get_command(app)
+        for name in LAZY_COMMANDS:
+            command.get_command(None, name)
+        return command
+
+    def begin(self):
+        with self._lock:
+            self.active += 1
+            self.last_activity = time.monotonic()
+
+    def end(self):
+        with self._lock:
+            self.active -= 1
+            self.last_activity = time.monotonic()
+
+    def idle_for(self) -> float:
+        with self._lock:
+            return 0.0 if self.active else time.monotonic() - self.last_activity
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        control = message.get("control")
+        if control == "status":
+            return {
+                "pid": os.getpid(),
+                "uptime_s": round(time.monotonic() - self.started_at, 1),
+                "served": self.served,
+                "idle_timeout_s": self.idle_timeout,
+            }
+        if control == "stop":
+            self._stopping = True
+            return {"stopping": True}
+
+        argv = message.get("argv") or []
+        if message.get("env", {}) != self.env:
+            return {"fallback": True, "reason": "environment differs from the daemon's"}
+        if not launcher.should_forward(argv, interactive=False):
+            return {"fallback": True, "reason": "command must run locally"}
+        return self.run_command(argv)
+
+    def run_command(self, argv: List[str]) -> Dict[str, Any]:
+        """Run one CLI command with this thread's output captured"""
+        import click
+        from outris.client import command_stats
+
+        out, err = io.StringIO(), io.StringIO()
+        stdout, stderr = self._capture_streams()
+        stdout.local.buffer, stderr.local.buffer = out, err
+        try:
+            with command_stats():
+                code = self._command.main(args=argv, prog_name="outris", standalone_mode=False) or 0
+        except click.exceptions.Exit as e:
+            code = e.exit_code
+        except click.ClickException as e:
+            e.show(file=err)
+            code = e.exit_code
+        except click.Abort:
+            err.write("Aborted!\n")
+            code = 1
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc(file=err)
+            code = 1
+        finally:
+            stdout.local.buffer = stderr.local.buffer = None
+        with self._lock:
+            self.served += 1
+        return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit": code}
+
+    def _capture_streams(self):
+        """Make sure sys.stdout/sys.stderr are per-thread capturing streams"""
+        with self._lock:
+            if not isinstance(sys.stdout, _ThreadLocalStream):
+                sys.stdout = _ThreadLocalStream(sys.stdout)
+            if not isinstance(sys.stderr, _ThreadLocalStream):
+                sys.stderr = _ThreadLocalStream(sys.stderr)
+            return sys.stdout, sys.stderr
+
+    def serve(self):
+        """Serve until stopped or idle for idle_timeout seconds"""
+        self.timeout = min(0.25, self.idle_timeout)
+        try:
+            while not self._stopping and self.idle_for() < self.idle_timeout:
+                self.handle_request()
+        finally:
+            if isinstance(sys.stdout, _ThreadLocalStream):
+                sys.stdout = sys.stdout.default
+            if isinstance(sys.stderr, _ThreadLocalStream):
+                sys.stderr = sys.stderr.default
+            self.server_close()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def main(argv: List[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the outris daemon in the foreground")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    DaemonServer(idle_timeout=args.idle_timeout).serve()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Hedged requests for read-only calls
+
+If a call hasn't returned within a percentile of recent latency, a duplicate
+is sent and whichever answers first wins. Hedges are capped to a fraction of
+total calls so a slow backend isn't flooded with extra load.
+
+A blocking requests call can't be interrupted from another thread, so the
+losing copy is not cancelled: it runs to completion on its pool thread and
+its result is discarded.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Optional
+
+from outris.utils.stats import percentile
+
+
+class Hedger:
+    """
+    Runs calls with at most one hedge each
+
+    The hedge delay is the ``delay_percentile`` of the last ``window`` observed
+    latencies (``initial_delay_ms`` until ``min_samples`` have been seen).
+    Hedges fire only while they stay within ``budget`` of all calls (plus a
+    burst of one, so a lone slow call can still be hedged). The delay is
+    timed from when a call starts running, not from when it was queued.
+    
+    ``count(name)`` is called for "hedges_fired" and "hedges_won".
+    """
+
+    def __init__(
+        self,
+        delay_percentile: float = None,
+        budget: float = None,
+        initial_delay_ms: float = None,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 32,
+        count: Callable[[str], None] = None,
+    ):
+        self.delay_percentile = delay_percentile or float(os.getenv("OUTRIS_HEDGE_PERCENTILE", 95))
+        self.budget = budget if budget is not None else float(os.getenv("OUTRIS_HEDGE_BUDGET", 0.05))
+        self.initial_delay_ms = initial_delay_ms or float(os.getenv("OUTRIS_HEDGE_DELAY_MS", 500))
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.count = count or (lambda name: None)
+        self.calls = 0
+        self.fired = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+
+    def observe(self, latency_ms: float):
+        """Record the latency of a completed call"""
+        with self._lock:
+            self._latencies.append(latency_ms)
+
+    def delay(self) -> float:
+        """Seconds to wait before hedging"""
+        with self._lock:
+            samples = list(self._latencies)
+        if len(samples) < self.min_samples:
+            return self.initial_delay_ms / 1000
+        return percentile(samples, self.delay_percentile) / 1000
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.fired >= self.budget * self.calls + 1:
+                return False
+            self.fired += 1
+        self.count("hedges_fired")
+        return True
+
+    def reserve(self, concurrency: int):
+        """Make room for concurrency calls and their hedges so callers never queue for a thread"""
+        with self._lock:
+            self.max_workers = max(self.max_workers, 2 * concurrency)
+
+    def _submit(self, call: Callable[[], Any], started: threading.Event = None) -> Future:
+        with self._lock:
+            if self._executor_workers < self.max_workers:
+                if self._executor is not None:
+                    # Calls already on the old pool still finish
+                    self._executor.shutdown(wait=False)
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="outris-hedge")
+                self._executor_workers = self.max_workers
+            executor = self._executor
+
+        def timed():
+            if started is not None:
+                started.set()
+            start = time.perf_counter()
+            result = call()
+            self.observe((time.perf_counter() - start) * 1000)
+            return result
+        # Carry the caller's context (e.g. scheduler pacing) onto the pool thread
+        return executor.submit(contextvars.copy_context().run, timed)
+
+    def run(self, call: Callable[[], Any]) -> Any:
+        """Run call(), hedging it once if it is slower than usual"""
+        with self._lock:
+            self.calls += 1
+        started = threading.Event()
+        primary = self._submit(call, started)
+        # Time spent queued for a thread doesn't count towards the delay
+        primary.add_done_callback(lambda _: started.set())
+        started.wait()
+        done, _ = wait([primary], timeout=self.delay())
+        if done or not self._take_budget():
+            return primary.result()
+
+        hedge = self._submit(call)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.count("hedges_won")
+                    # Only stops a copy that hasn't started; a running one is left to finish
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,210 @@
+"""
+Local query history stored in ~/.outris/history.db
+
+Every query run from this machine is recorded with its result metadata, and
+server-side history is pulled in incrementally: the server returns its latest
+entries first, so each sync pages backwards with ``until`` down to the newest
+timestamp synced last time. The server's copy of a query run here replaces
+the local row instead of being added next to it. Searches run locally against indexed columns and an
+FTS5 full-text index, so they work offline.
+"""
+
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from outris import config
+
+SYNC_PAGE_SIZE = 500
+# A local row is taken to be the server's copy of the same query within this window
+CLAIM_WINDOW_S = 300
+
+_SCHEMA = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    CREATE TABLE IF NOT EXISTS queries (
+        id INTEGER PRIMARY KEY,
+        org_id TEXT,
+        query TEXT NOT NULL,
+        api TEXT,
+        timestamp TEXT NOT NULL,
+        execution_time_ms REAL,
+        cost REAL,
+        source TEXT NOT NULL,
+        remote_key TEXT UNIQUE
+    );
+    CREATE INDEX IF NOT EXISTS queries_org_time ON queries (org_id, timestamp);
+    CREATE INDEX IF NOT EXISTS queries_org_api ON queries (org_id, api);
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS queries_fts USING fts5(
+        query, content='queries', content_rowid='id'
+    );
+    CREATE TRIGGER IF NOT EXISTS queries_fts_insert AFTER INSERT ON queries BEGIN
+        INSERT INTO queries_fts (rowid, query) VALUES (new.id, new.query);
+    END;
+    CREATE TRIGGER IF NOT EXISTS queries_fts_delete AFTER DELETE ON queries BEGIN
+        INSERT INTO queries_fts (queries_fts, rowid, query) VALUES ('delete', old.id, old.query);
+    END;
+"""
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def _seconds_before(timestamp: str, seconds: int) -> str:
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00")) - timedelta(seconds=seconds)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def parse_since(value: str) -> str:
+    """Turn "7d", "12h", "30m" or an ISO date into an ISO timestamp"""
+    match = re.fullmatch(r"(\d+)([dhm])", value.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"d": timedelta(days=amount), "h": timedelta(hours=amount), "m": timedelta(minutes=amount)}[unit]
+        return (datetime.now(timezone.utc) - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _remote_key(item: Dict[str, Any]) -> str:
+    return str(item.get('id') or f"{item['timestamp']}|{item['query']}")
+
+
+class HistoryStore:
+    """SQLite-backed query history with incremental sync and full-text search"""
+
+    def __init__(self, path: Path = None):
+        self.path = path or config.CONFIG_DIR / "history.db"
+        self.path.parent.mkdir(exist_ok=True)
+        self.org_id = config.get_org_id()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+        try:
+            self._db.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: fall back to LIKE scans
+            self.has_fts = False
+
+    def record(self, query_text: str, result: Dict[str, Any]):
+        """Record a query executed from this machine"""
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO queries (org_id, query, api, timestamp, execution_time_ms, cost, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'local')",
+                (self.org_id, query_text, result.get('api_used'), _now(),
+                 result.get('execution_time_ms'), result.get('cost')),
+            )
+
+    def _cursor_key(self) -> str:
+        return f"sync_cursor:{self.org_id or ''}"
+
+    def sync(self, client, page_size: int = SYNC_PAGE_SIZE) -> int:
+        """
+        Fetch server history newer than the last sync, returning rows added
+
+        Pages are walked newest to oldest with an inclusive ``until`` cursor, and
+        the high-water mark only moves once the walk reaches the previous one,
+        so an interrupted sync loses nothing. Each boundary is re-fetched (also
+        one second back from the mark) and duplicates are dropped, so entries
+        sharing a timestamp aren't skipped.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = ?", (self._cursor_key(),)).fetchone()
+        high_water = row[0] if row else None
+        since = _seconds_before(high_water, 1) if high_water else None
+        until, newest, seen, added = None, high_water, set(), 0
+
+        while True:
+            page = client.get_history(limit=page_size, since=since, until=until)['queries']
+            fresh = [item for item in page if _remote_key(item) not in seen]
+            with self._lock:
+                self._db.execute("BEGIN")
+                for item in fresh:
+                    seen.add(_remote_key(item))
+                    added += self._merge(item)
+                self._db.execute("COMMIT")
+            if page:
+                newest = max(newest or "", *(item['timestamp'] for item in page))
+            if len(page) < page_size:
+                break
+            if not fresh:
+                # A full page of entries we already have: the server ignored until
+                # or one timestamp fills a page. Keep the mark so nothing is lost.
+                return added
+            until = min(item['timestamp'] for item in page)
+
+        if newest and newest != high_water:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (self._cursor_key(), newest)
+                )
+        return added
+
+    def _merge(self, item: Dict[str, Any]) -> int:
+        """Store one server entry, claiming the local row for the same query if there is one"""
+        remote_key = _remote_key(item)
+        if self._db.execute("SELECT 1 FROM queries WHERE remote_key = ?", (remote_key,)).fetchone():
+            return 0
+        local = self._db.execute(
+            "SELECT id FROM queries WHERE org_id IS ? AND source = 'local' AND remote_key IS NULL AND query = ? "
+            "AND ABS(julianday(timestamp) - julianday(?)) * 86400 <= ? "
+            "ORDER BY ABS(julianday(timestamp) - julianday(?)) LIMIT 1",
+            (self.org_id, item['query'], item['timestamp'], CLAIM_WINDOW_S, item['timestamp']),
+        ).fetchone()
+        if local:
+            self._db.execute(
+                "UPDATE queries SET remote_key = ?, timestamp = ?, "
+                "execution_time_ms = COALESCE(?, execution_time_ms), cost = COALESCE(?, cost) WHERE id = ?",
+                (remote_key, item['timestamp'], item.get('execution_time_ms'), item.get('cost'), local[0]),
+            )
+            return 0
+        self._db.execute(
+            "INSERT INTO queries "
+            "(org_id, query, api, timestamp, execution_time_ms, cost, source, remote_key) "
+            "VALUES (?, ?, ?, ?, ?, ?, 'server', ?)",
+            (self.org_id, item['query'], item.get('api'), item['timestamp'],
+             item.get('execution_time_ms'), item.get('cost'), remote_key),
+        )
+        return 1
+
+    def search(
+        self,
+        grep: str = "",
+        api: str = "",
+        since: str = "",
+        limit: int = 10,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Newest-first history rows matching the given filters"""
+        clauses, params = ["q.org_id IS ?"], [self.org_id]
+        joins = ""
+        if grep:
+            if self.has_fts:
+                joins = "JOIN queries_fts ON queries_fts.rowid = q.id"
+                clauses.append("queries_fts MATCH ?")
+                params.append('"' + grep.replace('"', '""') + '"')
+            else:
+                clauses.append("q.query LIKE ?")
+                params.append(f"%{grep}%")
+        if api:
+            clauses.append("q.api = ?")
+            params.append(api)
+        if since:
+            clauses.append("q.timestamp >= ?")
+            params.append(parse_since(since))
+
+        sql = (f"SELECT q.* FROM queries q {joins} WHERE {' AND '.join(clauses)} "
+               "ORDER BY q.timestamp DESC, q.id DESC LIMIT ? OFFSET ?")
+        with self._lock:
+            rows = self._db.execute(sql, params + [limit, offset]).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,101 @@
+"""
+Thin `outris` entry point
+
+When an `outris daemon` is running and the command is safe to run remotely,
+argv is forwarded over ~/.outris/daemon.sock and the daemon's output is
+replayed here. That skips importing typer, rich and requests and reuses the
+daemon's warm connections. Anything else runs in-process as usual.
+
+Only imports the standard library and outris.config, so forwarding stays fast.
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from outris import config
+
+# Commands that only read from the backend and write to stdout
+FORWARDABLE = (
+    ("ask",),
+    ("api", "list"),
+    ("team", "list"),
+    ("marketplace", "browse"),
+    ("query", "history"),
+    ("query", "cache", "stats"),
+)
+# Options that touch local files, the terminal or process-wide state
+LOCAL_ONLY_OPTIONS = {"--output-file", "--trace-file", "--profile", "--pager", "--stream", "--help"}
+
+def socket_path() -> Path:
+    return config.CONFIG_DIR / "daemon.sock"
+
+def client_env() -> Dict[str, str]:
+    """Environment settings a forwarded command must share with the daemon"""
+    return {k: v for k, v in os.environ.items() if k.startswith("OUTRIS_") and not k.startswith("OUTRIS_DAEMON")}
+
+def should_forward(argv: List[str], interactive: bool) -> bool:
+    """True if argv can run in the daemon (never for a terminal: output there is rich)"""
+    if interactive or os.getenv("OUTRIS_DAEMON", "auto").lower() in ("off", "false", "0"):
+        return False
+    if any(arg.split("=", 1)[0] in LOCAL_ONLY_OPTIONS for arg in argv):
+        return False
+    return any(tuple(argv[:len(prefix)]) == prefix for prefix in FORWARDABLE)
+
+def request(message: Dict[str, Any], path: Path = None, timeout: float = None) -> Optional[Dict[str, Any]]:
+    """Send one JSON request to the daemon, returning None if it isn't usable"""
+    path = path or socket_path()
+    try:
+        info = path.lstat()
+    except OSError:
+        return None
+    # Refuse sockets we don't own: another user could be impersonating the daemon
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+
+def forward(argv: List[str], path: Path = None) -> Optional[int]:
+    """Run argv in the daemon and replay its output, or return None to run locally"""
+    response = request({"argv": argv, "env": client_env()}, path)
+    if not response or response.get("fallback"):
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("exit", 0))
+
+def main():
+    argv = sys.argv[1:]
+    if should_forward(argv, sys.stdout.isatty()):
+        code = forward(argv)
+        if code is not None:
+            sys.exit(code)
+
+    from outris.main import app
+    app()
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,121 @@
 """
 Main entry point for Outris CLI
+
+Command groups are registered lazily: a sub-app's module (and the Rich
+widgets, yaml and requests it pulls in) is only imported when that command
+actually runs, so `outris --help` and `outris ask` start fast.
 """
 
+import importlib
+from typing import Dict, Optional, Tuple
+
+import click
 import typer
+from typer.core import TyperGroup
 from rich.console import Console
 
-from outris.commands import auth, api, query, team, marketplace
+# name -> (module, sub-command or None for the whole group, help text)
+LAZY_COMMANDS: Dict[str, Tuple[str, Optional[str], str]] = {
+    "auth": ("outris.commands.auth", None, "Authentication commands"),
+    "api": ("outris.commands.api", None, "API management commands"),
+    "query": ("outris.commands.query", None, "Query commands"),
+    "team": ("outris.commands.team", None, "Team collaboration commands"),
+    "marketplace": ("outris.commands.marketplace", None, "Marketplace commands"),
+    "dev": ("outris.commands.dev", None, "Developer tools"),
+    "daemon": ("outris.commands.daemon", None, "Background daemon for fast repeated invocations"),
+    "ask": ("outris.commands.query", "ask", "Query APIs using natural language"),
+}
+
+
+def _load_command(name: str) -> click.Command:
+    """Import a lazily registered command and build its Click command"""
+    module_name, sub_command, help_text = LAZY_COMMANDS[name]
+    module = importlib.import_module(module_name)
+    group = typer.main.get_group(module.app)
+    if sub_command:
+        return group.commands[sub_command]
+    group.name = name
+    group.help = help_text
+    return group
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports sub-command modules on first use"""
+
+    _listing = False
+
+    def list_commands(self, ctx: click.Context):
+        return sorted(set(super().list_commands(ctx)) | set(LAZY_COMMANDS))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_COMMANDS:
+            return command
+
+        if self._listing:
+            # Help output only needs the name and summary; don't import anything
+            help_text = LAZY_COMMANDS[cmd_name][2]
+            return click.Command(cmd_name, help=help_text, short_help=help_text)
+
+        command = _load_command(cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
 
 app = typer.Typer(
     name="outris",
     help="Natural language CLI for any API - register, query, and collaborate",
     no_args_is_help=True,
+    cls=LazyTyperGroup,
 )
 
 console = Console()
 
-# Register command groups
-app.add_typer(auth.app, name="auth", help="Authentication commands")
-app.add_typer(api.app, name="api", help="API management commands")
-app.add_typer(query.app, name="query", help="Query commands")
-app.add_typer(team.app, name="team", help="Team collaboration commands")
-app.add_typer(marketplace.app, name="marketplace", help="Marketplace commands")
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Print a client-side timing breakdown"),
+    trace_file: str = typer.Option("", "--trace-file", help="Write Chrome-trace JSON spans to this file"),
+):
+    """Natural language CLI for any API - register, query, and collaborate"""
+    if profile or trace_file:
+        from outris import profiling
+
+        tracer = profiling.enable()
+        ctx.call_on_close(lambda: _report_profile(tracer, profile, trace_file))
+
+
+def _report_profile(tracer, profile: bool, trace_file: str):
+    """Print the span breakdown and/or write the trace file"""
+    if trace_file:
+        tracer.write(trace_file)
+    if not profile:
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Profile (client-side)")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Total ms", justify="right", style="green")
+    table.add_column("Mean ms", justify="right", style="green")
+    for name, entry in tracer.summary().items():
+        table.add_row(name, str(entry["count"]), f"{entry['total_ms']:.1f}", f"{entry['mean_ms']:.1f}")
+
+    err_console = Console(stderr=True)
+    err_console.print(table)
+    for key, value in tracer.metadata.items():
+        err_console.print(f"[dim]{key}:[/dim] [cyan]{value}[/cyan]")
+    if trace_file:
+        err_console.print(f"[dim]Trace written to {trace_file}[/dim]")
 
 # Top-level convenience commands (aliases)
 @app.command()
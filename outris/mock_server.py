@@ -0,0 +1,238 @@
+"""
+Local HTTP stand-in for the Outris backend
+
+Serves every /api/v1 route RealBackendClient uses, with bodies taken from
+MockBackendClient, plus configurable latency, 5xx and 429 rates, padded
+payloads and slow chunked responses. ``/api/v1/query/stream`` answers with
+Server-Sent Events, spaced by ``chunk_delay``. Used by `outris dev serve-mock`, the
+benchmarks and tests to exercise the real network path without a backend.
+"""
+
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from outris.client import MockBackendClient
+from outris.streaming import QueryEvent, encode_sse
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Build a latency sampler (seconds) from a spec in milliseconds
+
+    Supported forms: "0", "fixed:50", "uniform:10,100", "normal:50,10"
+    (mean, stddev) and "lognormal:50,0.5" (median, sigma).
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    params = [float(p) for p in args.split(",")]
+    if kind == "fixed":
+        return lambda rng: params[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(params[0], params[1]) / 1000
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(params[0], params[1])) / 1000
+    if kind == "lognormal":
+        import math
+        return lambda rng: rng.lognormvariate(math.log(params[0]), params[1]) / 1000
+    raise ValueError(f"Unknown latency distribution: {kind}")
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour knobs for the stand-in server"""
+    latency: str = "0"
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    payload_bytes: int = 0
+    chunk_size: int = 0
+    chunk_delay: float = 0.0
+    seed: Optional[int] = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "MockServer"
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def _decode_body(self, body: bytes) -> Any:
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding:
+            raise _HTTPError(415, f"Unsupported Content-Encoding: {encoding}")
+        return json.loads(body) if body else {}
+
+    def _send_json(self, status: int, payload: Any, headers: Dict[str, str] = None):
+        data = json.dumps(payload).encode() if status != 304 else b""
+        config = self.server.config
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        if config.chunk_size and data:
+            # Slow streaming: chunked transfer with a pause between chunks
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(data), config.chunk_size):
+                chunk = data[start:start + config.chunk_size]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+                time.sleep(config.chunk_delay)
+            self.wfile.write(b"0\r\n\r\n")
+            return
+
+        if "gzip" in self.headers.get("Accept-Encoding", "") and len(data) > 1024:
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_events(self, events: Iterable[QueryEvent]):
+        """Stream events as chunked Server-Sent Events, pausing chunk_delay between them"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event in events:
+            frame = encode_sse(event)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(frame), frame))
+            self.wfile.flush()
+            time.sleep(self.server.config.chunk_delay)
+        self.wfile.write(b"0\r\n\r\n")
+    
+    def _handle(self):
+        self.server.count("requests")
+        # Always drain the body so the keep-alive connection stays usable
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            self.server.inject_faults()
+            body = self._decode_body(raw)
+            if self.command == "POST" and urlsplit(self.path).path == "/api/v1/query/stream":
+                return self._send_events(self.server.backend.query_stream(body["query"]))
+            status, payload, headers = self.server.route(self, body)
+        except _HTTPError as e:
+            self.server.count(f"status_{e.status}")
+            status, payload, headers = e.status, {"detail": e.detail}, e.headers
+        self._send_json(status, payload, headers)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, detail: str, headers: Dict[str, str] = None):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+        self.headers = headers or {}
+
+
+class MockServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer serving the Outris API from MockBackendClient data"""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: MockServerConfig = None, verbose: bool = False):
+        super().__init__((host, port), _Handler)
+        self.config = config or MockServerConfig()
+        self.verbose = verbose
+        self.backend = MockBackendClient()
+        self.stats: Dict[str, int] = {}
+        self._latency = parse_latency(self.config.latency)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str):
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def inject_faults(self):
+        """Sleep for a sampled latency, then maybe fail with 503 or 429"""
+        with self._lock:
+            delay = self._latency(self._rng)
+            roll = self._rng.random()
+        time.sleep(delay)
+        if roll < self.config.error_rate:
+            raise _HTTPError(503, "Injected failure")
+        if roll < self.config.error_rate + self.config.rate_limit_rate:
+            raise _HTTPError(429, "Rate limited", {"Retry-After": f"{self.config.retry_after:g}"})
+
+    def _padded(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        if self.config.payload_bytes:
+            result = dict(result)
+            result["result"] = {**result["result"], "padding": "x" * self.config.payload_bytes}
+        return result
+
+    def route(self, request: _Handler, body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        """Dispatch a request to the matching MockBackendClient call"""
+        url = urlsplit(request.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        method, path, backend = request.command, url.path, self.backend
+
+        if method == "GET" and path == "/api/v1/apis":
+            payload = backend.list_apis(params.get("scope", "all"))
+            etag = '"%s"' % hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+            if request.headers.get("If-None-Match") == etag:
+                return 304, None, {"ETag": etag}
+            return 200, payload, {"ETag": etag}
+        if method == "GET" and path == "/api/v1/history":
+            return 200, backend.get_history(int(params.get("limit", 10)), params.get("since"), params.get("until")), {}
+        if method == "GET" and path == "/api/v1/team/members":
+            return 200, backend.list_team(), {}
+        if method == "GET" and path == "/api/v1/marketplace":
+            return 200, backend.get_marketplace(), {}
+
+        secrets = re.fullmatch(r"/api/v1/apis/([^/]+)/secrets", path)
+        if method == "POST" and secrets:
+            return 200, backend.add_secret(secrets.group(1), body["key_name"], body["value"]), {}
+        spec_update = re.fullmatch(r"/api/v1/apis/([^/]+)/spec", path)
+        if method == "PATCH" and spec_update:
+            return 200, backend.update_api_spec(spec_update.group(1), body), {}
+
+        post_routes = {
+            "/api/v1/auth/signup": lambda: backend.signup(body["email"], body["org_name"]),
+            "/api/v1/auth/verify-otp": lambda: backend.verify_otp(body["email"], body["otp"]),
+            "/api/v1/auth/login": lambda: backend.login(body["email"]),
+            "/api/v1/apis/register": lambda: backend.register_api(body["spec"], body["name"], body["visibility"]),
+            "/api/v1/query": lambda: self._padded(backend.query(body["query"])),
+            "/api/v1/team/invite": lambda: backend.invite_member(body["email"], body["role"]),
+            "/api/v1/team/accept": lambda: backend.accept_invitation(body["token"], body["email"], body["otp"]),
+            "/api/v1/marketplace/install": lambda: backend.install_from_marketplace(body["api_name"]),
+        }
+        if method == "POST" and path in post_routes:
+            return 200, post_routes[path](), {}
+        raise _HTTPError(404, f"No route for {method} {path}")
+
+    def start(self) -> "MockServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,186 @@
+"""
+Client-side timing instrumentation
+
+When profiling is enabled (`outris --profile` or `--trace-file`), the client
+records spans for DNS, TCP connect, TLS, time-to-first-byte, download, JSON
+decode and rendering. They can be summarised on exit or exported in Chrome
+trace format (load the file in chrome://tracing or Perfetto).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class Tracer:
+    """Collects timed spans from any thread"""
+
+    def __init__(self):
+        self.spans: List[Dict[str, Any]] = []
+        self.counters: List[Dict[str, Any]] = []
+        self.metadata: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def add_span(self, name: str, start: float, end: float, category: str = "client", **args):
+        """Record a span from perf_counter() start/end times"""
+        with self._lock:
+            self.spans.append({
+                "name": name,
+                "cat": category,
+                "start": start,
+                "end": end,
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def add_counter(self, name: str, **values: float):
+        """Record sampled values (e.g. queue depth) at the current time"""
+        with self._lock:
+            self.counters.append({"name": name, "ts": time.perf_counter(), "args": values})
+
+    @contextmanager
+    def span(self, name: str, category: str = "client", **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.perf_counter(), category, **args)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-span-name count and total/mean duration in ms"""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span["name"], {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += (span["end"] - span["start"]) * 1000
+        for entry in totals.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return totals
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Spans as Chrome trace-event JSON (complete events, microseconds)"""
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": span["name"],
+                    "cat": span["cat"],
+                    "ph": "X",
+                    "ts": round((span["start"] - self._origin) * 1e6, 3),
+                    "dur": round((span["end"] - span["start"]) * 1e6, 3),
+                    "pid": pid,
+                    "tid": span["tid"],
+                    "args": span["args"],
+                }
+                for span in self.spans
+            ]
+            events += [
+                {
+                    "name": counter["name"],
+                    "ph": "C",
+                    "ts": round((counter["ts"] - self._origin) * 1e6, 3),
+                    "pid": pid,
+                    "args": counter["args"],
+                }
+                for counter in self.counters
+            ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.metadata}
+
+    def write(self, path: Path):
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+_tracer: Optional[Tracer] = None
+
+def enable() -> Tracer:
+    """Start collecting spans process-wide"""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+def disable():
+    global _tracer
+    _tracer = None
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+@contextmanager
+def span(name: str, category: str = "client", **args):
+    """Time a block if profiling is enabled; a no-op otherwise"""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, category, **args):
+        yield
+
+def annotate(**values):
+    """Attach metadata (e.g. server-reported timings) to the current trace"""
+    if _tracer is not None:
+        _tracer.metadata.update(values)
+
+
+@lru_cache(maxsize=None)
+def timed_pool_classes() -> Dict[str, type]:
+    """urllib3 connection pool classes that record dns/connect/tls spans"""
+    import socket
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedConnectionMixin:
+        def _new_conn(self):
+            tracer = _tracer
+            if tracer is None:
+                return super()._new_conn()
+
+            host = self._dns_host
+            start = time.perf_counter()
+            try:
+                address = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)[0][4][0]
+            except OSError:
+                address = None
+            resolved = time.perf_counter()
+            tracer.add_span("dns", start, resolved, "network", host=host)
+
+            # Connect to the address we just resolved so DNS isn't paid twice
+            if address:
+                self._dns_host = address
+            try:
+                conn = super()._new_conn()
+            finally:
+                self._dns_host = host
+            self._connected_at = time.perf_counter()
+            tracer.add_span("connect", resolved, self._connected_at, "network", host=host)
+            return conn
+
+    class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+        pass
+
+    class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+        def connect(self):
+            tracer = _tracer
+            if tracer is None:
+                return super().connect()
+            start = time.perf_counter()
+            self._connected_at = None
+            super().connect()
+            # Everything after the TCP connect is the TLS handshake
+            tracer.add_span("tls", self._connected_at or start, time.perf_counter(), "network", host=self.host)
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
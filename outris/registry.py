@@ -0,0 +1,142 @@
+"""
+Incremental spec registration backed by ~/.outris/specs.json
+
+For every API registered from this machine the content hashes of the last
+uploaded spec are kept per org. Re-registering an identical spec is skipped
+without contacting the backend; a changed spec is sent as a patch of added,
+removed and modified operations when the backend supports it, and uploaded
+in full otherwise. Entries are kept in memory and written back once per
+command with `SpecRegistry.save`.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from outris import config
+from outris.spec import diff_operations, operation_keys, spec_hashes, spec_patch
+
+# Statuses meaning the backend can't apply a patch: fall back to a full upload
+PATCH_UNSUPPORTED = (404, 405, 501)
+PATCH_CONFLICT = (409, 412)
+
+
+class SpecRegistry:
+    """(org, visibility, name) -> hashes and result of the last registration"""
+
+    def __init__(self, path: Path = None):
+        self.path = path or config.CONFIG_DIR / "specs.json"
+        self._lock = threading.Lock()
+        self._org_id = config.get_org_id()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        # Cleared the first time the backend turns a patch down as unsupported
+        self.patch_supported = True
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self._entries = data.get("orgs", {}).get(str(self._org_id), {})
+
+    def save(self):
+        """Write entries changed since the last save, merged into the file under the config lock"""
+        with self._lock:
+            if not self._dirty:
+                return
+            changed = {key: self._entries[key] for key in self._dirty}
+            with config._config_lock():
+                try:
+                    with open(self.path) as f:
+                        data = json.load(f)
+                except (FileNotFoundError, ValueError):
+                    data = {}
+                orgs = data.get("orgs", {})
+                orgs.setdefault(str(self._org_id), {}).update(changed)
+                config.write_json_atomic(self.path, {"orgs": orgs}, indent=None)
+            self._dirty.clear()
+
+    @staticmethod
+    def _key(name: str, visibility: str) -> str:
+        return f"{visibility}:{name}"
+
+    def get(self, name: str, visibility: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(self._key(name, visibility))
+
+    def put(self, name: str, visibility: str, hashes: Dict[str, Any], result: Dict[str, Any]):
+        with self._lock:
+            key = self._key(name, visibility)
+            self._entries[key] = {"hashes": hashes, "result": result}
+            self._dirty.add(key)
+
+
+def register_spec(
+    client,
+    spec: Dict[str, Any],
+    name: str,
+    visibility: str,
+    registry: Optional[SpecRegistry],
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Register a spec, skipping or patching when an earlier upload is known
+
+    Pass registry=None (or force=True) to always upload in full; call
+    ``registry.save()`` afterwards to persist the new hashes. The result
+    carries a ``change`` entry: ``mode`` is "new", "unchanged", "patched" or
+    "full", plus the added/removed/modified operation keys.
+    """
+    # Hashes are only needed to compare against, or to store for next time
+    hashes = spec_hashes(spec) if registry is not None else None
+    previous = registry.get(name, visibility) if registry is not None and not force else None
+
+    if previous is None:
+        changes = {"added": operation_keys(spec), "removed": [], "modified": []}
+        mode = "new"
+    elif previous["hashes"]["spec"] == hashes["spec"]:
+        changes = {"added": [], "removed": [], "modified": []}
+        return {**previous["result"], "change": {"mode": "unchanged", **changes}}
+    else:
+        changes = diff_operations(previous["hashes"]["operations"], hashes["operations"])
+        mode = "patched"
+
+    result = None
+    if previous is not None and registry.patch_supported and hasattr(client, "update_api_spec"):
+        patch = spec_patch(spec, changes, previous["hashes"]["document"] != hashes["document"])
+        result = _try_patch(client, registry, previous["result"]["api_id"], {
+            "name": name,
+            "visibility": visibility,
+            "base_hash": previous["hashes"]["spec"],
+            "spec_hash": hashes["spec"],
+            **patch,
+        })
+    if result is None:
+        result = client.register_api(spec, name, visibility)
+        mode = "full" if previous is not None else mode
+
+    result = {**result, "endpoints": result.get("endpoints", len(spec.get("paths") or {}))}
+    if registry is not None and "api_id" in result:
+        registry.put(name, visibility, hashes, result)
+    return {**result, "change": {"mode": mode, **changes}}
+
+
+def _try_patch(client, registry: SpecRegistry, api_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Apply a patch, or return None when the backend wants a full upload"""
+    import requests
+
+    try:
+        return client.update_api_spec(api_id, patch)
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if status in PATCH_UNSUPPORTED:
+            registry.patch_supported = False
+            return None
+        if status in PATCH_CONFLICT:
+            # The server's copy isn't the one we hashed (edited elsewhere)
+            return None
+        raise
@@ -0,0 +1,137 @@
+"""
+Retry policy and circuit breaker for backend requests
+
+Transient failures (connection errors, 429, 502, 503, 504) are retried with
+exponential backoff and full jitter, honouring ``Retry-After``. Idempotent
+methods are always retried; POSTs only when they carry an
+``Idempotency-Key`` (or were rejected with 429 before being processed). A circuit breaker stops hammering a
+backend that keeps failing and fails fast until it has had time to recover.
+"""
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Mapping, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit is open"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Backend unavailable; circuit open, retrying in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request"""
+    max_attempts: int = 4
+    base_delay: float = 0.2
+    max_delay: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Policy configured by OUTRIS_RETRY_ATTEMPTS / _BASE_DELAY / _MAX_DELAY"""
+        return cls(
+            max_attempts=max(1, int(os.getenv("OUTRIS_RETRY_ATTEMPTS", cls.max_attempts))),
+            base_delay=float(os.getenv("OUTRIS_RETRY_BASE_DELAY", cls.base_delay)),
+            max_delay=float(os.getenv("OUTRIS_RETRY_MAX_DELAY", cls.max_delay)),
+        )
+
+    def is_idempotent(self, method: str, headers: Mapping[str, str]) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS or "Idempotency-Key" in headers
+
+    def should_retry_status(self, status: int, method: str, headers: Mapping[str, str]) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        # A 429 means the request was rejected unprocessed, so any method is safe to resend
+        return status == 429 or self.is_idempotent(method, headers)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number ``attempt`` (1-based)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self.rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    After ``failure_threshold`` failures in a row the circuit opens and calls
+    fail immediately. Once ``reset_timeout`` has passed one trial call is let
+    through (half-open); success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = None, reset_timeout: float = None):
+        self.failure_threshold = failure_threshold or int(os.getenv("OUTRIS_CIRCUIT_THRESHOLD", 5))
+        self.reset_timeout = reset_timeout or float(os.getenv("OUTRIS_CIRCUIT_RESET", 30.0))
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            waited = time.monotonic() - self.opened_at
+            if waited < self.reset_timeout:
+                raise CircuitOpenError(self.reset_timeout - waited)
+            if self._trial_in_flight:
+                raise CircuitOpenError(0.0)
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def release(self):
+        """End a trial call that finished without a verdict (e.g. interrupted)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failure, returning True if this opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            reopened = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopened or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
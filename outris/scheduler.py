@@ -0,0 +1,286 @@
+"""
+Adaptive, rate-limit-aware scheduling for bulk operations
+
+Bulk commands submit work through ``AdaptiveScheduler.map``. Two mechanisms
+keep them as fast as the backend allows without tripping 429s:
+
+- Per-endpoint token buckets, paused by ``Retry-After`` and paced from
+  ``X-RateLimit-*`` / ``RateLimit-*`` headers once the remaining quota is
+  no more than the work in flight or queued. They only apply to requests
+  made by ``map``/``run`` tasks; one-off interactive calls are never paced.
+- An AIMD concurrency limit: +1 per limit's worth of successful tasks,
+  halved (at most once per round trip) on overload signals only: 429, 503,
+  504 and timeouts. Latency alone never lowers it, since query latencies
+  vary widely without the backend being overloaded.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from outris import profiling
+from outris.retry import CircuitOpenError, parse_retry_after
+from outris.utils.concurrency import Outcome, bounded_map
+
+OVERLOAD_STATUSES = frozenset({429, 503, 504})
+
+# Set while a scheduler task runs, so only bulk requests are paced
+_in_task = contextvars.ContextVar("outris_scheduler_task", default=False)
+
+
+def parse_rate_limit(headers: Mapping[str, str]) -> Optional[Tuple[float, float, float]]:
+    """(limit, remaining, seconds until reset) from rate-limit headers, if present"""
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = headers.get(prefix + "Remaining")
+        if remaining is None:
+            continue
+        try:
+            remaining = float(remaining)
+            limit = float(headers.get(prefix + "Limit") or remaining)
+            reset = float(headers.get(prefix + "Reset") or 1.0)
+        except ValueError:
+            return None
+        if reset > 1e9:
+            # An epoch timestamp rather than delta-seconds
+            reset = reset - time.time()
+        return limit, remaining, max(reset, 0.0)
+    return None
+
+
+class TokenBucket:
+    """
+    Pacing for one endpoint
+
+    Unlimited while the server's remaining quota covers the outstanding work;
+    below that the remaining quota is spread evenly over the time left in the
+    window.
+    """
+
+    def __init__(self, rate: float = None, burst: float = 1.0):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.paused_until - now)
+            if self.rate is None:
+                return wait
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def update(self, limit: float, remaining: float, reset: float, demand: int = 0):
+        """Re-pace from the server's view of the current window and the requests still to send"""
+        if remaining <= 0:
+            self.pause(reset)
+            return
+        with self._lock:
+            if remaining > demand:
+                self.rate = None
+                return
+            burst = max(1.0, min(limit, remaining) / 10)
+            if self.rate is None:
+                self.tokens = burst
+            self.rate = remaining / max(reset, 0.001)
+            self.burst = burst
+            self.tokens = min(self.tokens, self.burst)
+
+
+class AdaptiveScheduler:
+    """Runs bulk work at an AIMD-adjusted concurrency behind per-endpoint token buckets"""
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        min_concurrency: int = 1,
+        initial_concurrency: int = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("OUTRIS_MAX_CONCURRENCY", 32)))
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = float(initial_concurrency or self.max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak = 0
+        self.throttle_events = 0
+        self.decreases = 0
+        # Smoothed task latency, used only to space decreases one round trip apart
+        self.recent_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._cond = threading.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        return int(self.limit)
+
+    def resize(self, max_concurrency: int):
+        """Change the concurrency cap, starting at it if no work has run yet"""
+        with self._cond:
+            self.max_concurrency = max(1, max_concurrency)
+            self.min_concurrency = min(self.min_concurrency, self.max_concurrency)
+            self.limit = min(self.limit, self.max_concurrency) if self.peak else float(self.max_concurrency)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Live state: current concurrency, queue depth and throttle events"""
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "queue_depth": self.waiting,
+                "peak_concurrency": self.peak,
+                "throttle_events": self.throttle_events,
+                "decreases": self.decreases,
+            }
+
+    def _publish(self):
+        """Record the current state on the --profile trace"""
+        tracer = profiling.get_tracer()
+        if tracer is not None:
+            state = self.snapshot()
+            tracer.add_counter("scheduler", concurrency=state["concurrency"], in_flight=state["in_flight"],
+                               queue_depth=state["queue_depth"])
+            profiling.annotate(**{f"scheduler.{key}": value for key, value in state.items()})
+
+    # Request-level pacing, called by the client around every HTTP attempt
+
+    def _bucket(self, endpoint: str) -> TokenBucket:
+        with self._cond:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                bucket = self._buckets[endpoint] = TokenBucket()
+            return bucket
+
+    def before_request(self, endpoint: str):
+        """Wait until the endpoint's bucket allows another request (scheduler tasks only)"""
+        if not _in_task.get():
+            return
+        wait = self._bucket(endpoint).reserve()
+        if wait > 0:
+            with profiling.span("scheduler.throttle", endpoint=endpoint):
+                time.sleep(wait)
+
+    def after_response(self, endpoint: str, status: int, headers: Mapping[str, str]):
+        """Learn the endpoint's rate limit from a response"""
+        bucket = self._bucket(endpoint)
+        quota = parse_rate_limit(headers)
+        if quota is not None:
+            with self._cond:
+                demand = self.in_flight + self.waiting
+            bucket.update(*quota, demand=demand)
+        if status in OVERLOAD_STATUSES:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                bucket.pause(retry_after)
+        if status in OVERLOAD_STATUSES:
+            with self._cond:
+                self.throttle_events += status == 429
+                self._decrease(0.0)
+
+    # Task-level concurrency
+
+    def _enqueue(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Count items as queued once they're submitted"""
+        for item in items:
+            with self._cond:
+                self.waiting += 1
+            yield item
+
+    def _acquire(self):
+        with self._cond:
+            while self.in_flight >= self.concurrency:
+                self._cond.wait()
+            self.waiting -= 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        self._publish()
+
+    def _release(self, elapsed: float, error: Optional[BaseException]):
+        with self._cond:
+            self.in_flight -= 1
+            if error is not None and _is_overload(error):
+                self._decrease(elapsed)
+            elif error is None:
+                self._observe_latency(elapsed)
+            self._cond.notify_all()
+        self._publish()
+
+    def _observe_latency(self, elapsed: float):
+        self.recent_latency = elapsed if self.recent_latency is None else 0.8 * self.recent_latency + 0.2 * elapsed
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def _decrease(self, elapsed: float):
+        # One cut per round trip: the other in-flight tasks saw the same congestion
+        now = time.monotonic()
+        if now - self._last_decrease < max(elapsed, self.recent_latency or 0.0):
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_concurrency, self.limit / 2)
+        self.decreases += 1
+
+    def run(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        """Run fn(item) once a concurrency slot is free"""
+        with self._cond:
+            self.waiting += 1
+        return self._run(fn, item)
+
+    def _run(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        self._acquire()
+        token = _in_task.set(True)
+        start = time.monotonic()
+        error = None
+        try:
+            return fn(item)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _in_task.reset(token)
+            self._release(time.monotonic() - start, error)
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        ordered: bool = False,
+        window: int = None,
+    ) -> Iterator[Outcome]:
+        """Like bounded_map, at the scheduler's current concurrency"""
+        return bounded_map(lambda item: self._run(fn, item), self._enqueue(items), workers=self.max_concurrency,
+                           ordered=ordered, window=window)
+
+
+def _is_overload(error: BaseException) -> bool:
+    """True for errors that mean the backend wants less traffic"""
+    if isinstance(error, CircuitOpenError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None:
+        return status in OVERLOAD_STATUSES
+    import requests
+    return isinstance(error, requests.Timeout)
+
+
+def scheduler_for(client: Any, max_concurrency: int = None) -> AdaptiveScheduler:
+    """The client's scheduler capped at max_concurrency, or a standalone one for clients without it"""
+    scheduler = getattr(client, "scheduler", None)
+    if scheduler is None:
+        return AdaptiveScheduler(max_concurrency)
+    if max_concurrency:
+        scheduler.resize(max_concurrency)
+    return scheduler
@@ -0,0 +1,389 @@
+"""
+OpenAPI spec loading and pre-processing
+
+Specs are parsed once, with the format detected from content rather than the
+file extension, using libyaml's C loader when it is available. Many specs are
+parsed in parallel on a process pool by `parse_specs`. `prune_spec`
+optionally shrinks a spec before upload by dropping components that nothing
+references and collapsing identical components into one. `spec_hashes`
+fingerprints a spec and each of its operations so re-registration can skip
+unchanged specs and send only the operations that changed.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# JSON-pointer prefixes of reusable component containers (OpenAPI 3 and Swagger 2)
+COMPONENT_CONTAINERS = [
+    ("components", "schemas"),
+    ("components", "responses"),
+    ("components", "parameters"),
+    ("components", "examples"),
+    ("components", "requestBodies"),
+    ("components", "headers"),
+    ("components", "links"),
+    ("components", "callbacks"),
+    ("definitions",),
+    ("parameters",),
+    ("responses",),
+]
+
+def _yaml_loader():
+    """Fastest available safe YAML loader"""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def detect_format(path: Path) -> str:
+    """Return "json" or "yaml" by sniffing the first non-blank character"""
+    with open(path, 'rb') as f:
+        head = f.read(4096).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return "json" if head[:1] in (b"{", b"[") else "yaml"
+
+def load_spec(path: Path) -> Dict[str, Any]:
+    """Parse an OpenAPI spec file (JSON or YAML, regardless of extension)"""
+    if detect_format(path) == "json":
+        with open(path, 'rb') as f:
+            return json.load(f)
+
+    import yaml
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_yaml_loader())
+
+def _mapping_targets(node: Dict[str, Any]) -> Dict[str, str]:
+    """A node's discriminator mapping entries that name local schemas, as {key: $ref}"""
+    discriminator = node.get("discriminator")
+    mapping = discriminator.get("mapping") if isinstance(discriminator, dict) else None
+    if not isinstance(mapping, dict):
+        return {}
+    targets = {}
+    for key, value in mapping.items():
+        if not isinstance(value, str):
+            continue
+        if value.startswith("#/"):
+            targets[key] = value
+        elif "/" not in value and not value.startswith("#"):
+            # A bare name refers to a schema
+            targets[key] = "#/components/schemas/" + value
+    return targets
+
+def _node_refs(node: Dict[str, Any]) -> Iterator[str]:
+    """Local refs held directly by a node: its $ref and any discriminator mapping"""
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#/"):
+        yield ref
+    yield from _mapping_targets(node).values()
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    """Yield every local $ref (and discriminator mapping target) in a document subtree"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield from _node_refs(current)
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+def _ref_for(container: Tuple[str, ...], name: str) -> str:
+    escaped = name.replace("~", "~0").replace("/", "~1")
+    return "#/" + "/".join(container + (escaped,))
+
+def _component_ref(ref: str) -> str:
+    """Reduce a ref to the component it points into ('#/components/schemas/Pet/properties/id' -> Pet)"""
+    parts = ref[2:].split("/")
+    for container in COMPONENT_CONTAINERS:
+        if tuple(parts[:len(container)]) == container and len(parts) > len(container):
+            return "#/" + "/".join(parts[:len(container) + 1])
+    return ref
+
+def _resolve(spec: Dict[str, Any], ref: str) -> Any:
+    node = spec
+    for part in ref[2:].split("/"):
+        part = part.replace("~1", "/").replace("~0", "~")
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+def _containers(spec: Dict[str, Any]) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """Yield (pointer prefix, mapping) for each component container present"""
+    for container in COMPONENT_CONTAINERS:
+        node = spec
+        for part in container:
+            node = node.get(part) if isinstance(node, dict) else None
+        if isinstance(node, dict):
+            yield container, node
+
+def _reachable_refs(spec: Dict[str, Any]) -> Set[str]:
+    """Components reachable from paths and other non-component sections"""
+    roots = [value for key, value in spec.items() if key not in ("components", "definitions", "parameters", "responses")]
+    reachable: Set[str] = set()
+    pending = [ref for root in roots for ref in _iter_refs(root)]
+    while pending:
+        # A ref into part of a component keeps the whole component
+        ref = _component_ref(pending.pop())
+        if ref in reachable:
+            continue
+        reachable.add(ref)
+        pending.extend(_iter_refs(_resolve(spec, ref)))
+    return reachable
+
+def _rewrite_refs(node: Any, mapping: Dict[str, str]):
+    """Point $refs and discriminator mappings at their replacement in-place"""
+    def replace(ref: str) -> Optional[str]:
+        component = _component_ref(ref)
+        if component in mapping:
+            return mapping[component] + ref[len(component):]
+        return None
+
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            replacement = replace(ref) if isinstance(ref, str) and ref.startswith("#/") else None
+            if replacement:
+                current["$ref"] = replacement
+            for key, target in _mapping_targets(current).items():
+                replacement = replace(target)
+                if replacement:
+                    current["discriminator"]["mapping"][key] = replacement
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+def prune_spec(spec: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Shrink a spec in-place before upload
+
+    Identical components within a container are collapsed onto the first
+    one (rewriting $refs to match), then components that are unreachable
+    from the paths are dropped. Security schemes are always kept since they
+    are referenced by name. Returns counts of what was removed.
+    """
+    stats = {"deduplicated": 0, "unused": 0}
+
+    mapping: Dict[str, str] = {}
+    for container, components in _containers(spec):
+        seen: Dict[str, str] = {}
+        for name, component in list(components.items()):
+            fingerprint = json.dumps(component, sort_keys=True, default=str)
+            if fingerprint in seen:
+                mapping[_ref_for(container, name)] = _ref_for(container, seen[fingerprint])
+                del components[name]
+                stats["deduplicated"] += 1
+            else:
+                seen[fingerprint] = name
+    if mapping:
+        _rewrite_refs(spec, mapping)
+
+    reachable = _reachable_refs(spec)
+    for container, components in _containers(spec):
+        for name in list(components):
+            if _ref_for(container, name) not in reachable:
+                del components[name]
+                stats["unused"] += 1
+    return stats
+
+
+def _digest(node: Any) -> str:
+    """sha256 of a node's canonical JSON (key order and whitespace don't matter)"""
+    canonical = json.dumps(node, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+def _operations(spec: Dict[str, Any]) -> Iterator[Tuple[str, str, str, Dict[str, Any]]]:
+    """Yield (key, path, method, operation) for every operation; keys look like 'GET /pets'"""
+    for path, item in (spec.get("paths") or {}).items():
+        if not isinstance(item, dict):
+            continue
+        for method in HTTP_METHODS:
+            if isinstance(item.get(method), dict):
+                yield f"{method.upper()} {path}", path, method, item[method]
+
+def operation_keys(spec: Dict[str, Any]) -> List[str]:
+    """Sorted operation keys ('GET /pets') of a spec"""
+    return sorted(key for key, _, _, _ in _operations(spec))
+
+def _closure_digests(spec: Dict[str, Any], roots: Iterable[str]) -> Dict[str, str]:
+    """
+    Map each ref reachable from roots to a hash of its node and everything it references
+
+    Every node is serialized once. Refs in a reference cycle share the hash
+    of their strongly connected component (found with iterative Tarjan), so
+    the work is linear in the size of the ref graph.
+    """
+    own: Dict[str, str] = {}
+    edges: Dict[str, List[str]] = {}
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    closure: Dict[str, str] = {}
+
+    def load(ref: str):
+        node = _resolve(spec, ref)
+        own[ref] = _digest(node)
+        edges[ref] = sorted(set(_iter_refs(node)))
+
+    for root in roots:
+        if root in index:
+            continue
+        load(root)
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            ref, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    load(child)
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges[child])))
+                elif child in on_stack:
+                    lowlink[ref] = min(lowlink[ref], index[child])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[ref])
+            if lowlink[ref] == index[ref]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    members.append(member)
+                    if member == ref:
+                        break
+                component = set(members)
+                digest = _digest({
+                    "nodes": {member: own[member] for member in members},
+                    "refs": sorted({closure[c] for m in members for c in edges[m] if c not in component}),
+                })
+                for member in members:
+                    closure[member] = digest
+    return closure
+
+def spec_hashes(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Content hashes of a normalized spec
+
+    ``spec`` covers the whole document, ``document`` everything except the
+    paths, and ``operations`` maps "GET /path" to a hash of the operation, its
+    path-level parameters and the closure hashes of the refs it uses, so
+    editing a shared schema marks the operations that use it as modified.
+    """
+    entries = []
+    for key, path, method, operation in _operations(spec):
+        shared = {k: v for k, v in spec["paths"][path].items() if k not in HTTP_METHODS}
+        entries.append((key, operation, shared, sorted({*_iter_refs(operation), *_iter_refs(shared)})))
+    closure = _closure_digests(spec, [ref for *_, refs in entries for ref in refs])
+
+    operations = {
+        key: _digest({
+            "operation": operation,
+            "shared": shared,
+            "refs": {ref: closure[ref] for ref in refs},
+        })
+        for key, operation, shared, refs in entries
+    }
+    return {
+        "spec": _digest(spec),
+        "document": _digest({k: v for k, v in spec.items() if k != "paths"}),
+        "operations": operations,
+    }
+
+def diff_operations(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Operation keys added, removed and modified between two operation hash maps"""
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "modified": sorted(k for k in new.keys() & old.keys() if new[k] != old[k]),
+    }
+
+def spec_patch(spec: Dict[str, Any], changes: Dict[str, List[str]], document_changed: bool) -> Dict[str, Any]:
+    """
+    The parts of a spec needed to apply ``changes`` on the server
+
+    ``paths`` holds only added and modified operations (with their path-level
+    fields); the rest of the document is included only if it changed.
+    """
+    wanted = set(changes["added"]) | set(changes["modified"])
+    paths: Dict[str, Dict[str, Any]] = {}
+    for key, path, method, operation in _operations(spec):
+        if key in wanted:
+            item = spec["paths"][path]
+            entry = paths.setdefault(path, {k: v for k, v in item.items() if k not in HTTP_METHODS})
+            entry[method] = operation
+    patch = {"paths": paths, "removed": changes["removed"]}
+    if document_changed:
+        patch["document"] = {k: v for k, v in spec.items() if k != "paths"}
+    return patch
+
+
+def find_specs(patterns: Iterable[str]) -> List[Path]:
+    """Expand files, directories (searched recursively) and glob patterns into spec files"""
+    found: Dict[Path, Path] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.suffix.lower() in SPEC_SUFFIXES and p.is_file())
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = sorted(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+        for match in matches:
+            found.setdefault(match.resolve(), match)
+    return [*found.values()]
+
+
+@dataclass
+class ParsedSpec:
+    """A spec file loaded (and optionally pruned) ready for upload"""
+    path: Path
+    spec: Optional[Dict[str, Any]] = None
+    parse_ms: float = 0.0
+    pruned: Optional[Dict[str, int]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def parse_spec(path: Path, prune: bool = False) -> ParsedSpec:
+    """Load one spec, capturing failures (runs in worker processes)"""
+    start = time.perf_counter()
+    try:
+        spec = load_spec(path)
+        if not isinstance(spec, dict):
+            raise ValueError("not an OpenAPI document")
+        pruned = prune_spec(spec) if prune else None
+    except Exception as e:
+        return ParsedSpec(path, error=f"{type(e).__name__}: {e}")
+    return ParsedSpec(path, spec, (time.perf_counter() - start) * 1000, pruned)
+
+def parse_specs(paths: List[Path], prune: bool = False, workers: int = None) -> Iterator[ParsedSpec]:
+    """Parse specs on a process pool, yielding each as soon as it's ready"""
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        for path in paths:
+            yield parse_spec(path, prune)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_spec, path, prune) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
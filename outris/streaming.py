@@ -0,0 +1,79 @@
+"""
+Streamed query responses
+
+``POST /api/v1/query/stream`` answers with Server-Sent Events (or chunked
+NDJSON with one ``{"event": ..., "data": ...}`` object per line):
+
+- ``stage``: progress, ``{"stage": "intent_resolved", "message": "..."}``
+- ``partial``: a fragment of the result as soon as it's available
+- ``result``: the final result, same shape as ``POST /api/v1/query``
+- ``error``: ``{"detail": "..."}``; the stream ends
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+STAGE_LABELS = {
+    "intent_resolved": "Intent resolved",
+    "api_selected": "API chosen",
+    "request_sent": "Request sent",
+    "response_received": "Response received",
+}
+
+
+@dataclass
+class QueryEvent:
+    """One event from a streamed query"""
+    type: str
+    data: Any
+
+
+class StreamError(Exception):
+    """The backend reported an error part-way through a stream"""
+
+
+def parse_sse(lines: Iterable[str]) -> Iterator[QueryEvent]:
+    """Parse Server-Sent Events lines into QueryEvents with JSON data"""
+    event_type, data_lines = "message", []
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield QueryEvent(event_type, json.loads("\n".join(data_lines)))
+            event_type, data_lines = "message", []
+            continue
+        if line.startswith(":"):
+            continue  # comment / keep-alive
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            event_type = value
+        elif field == "data":
+            data_lines.append(value)
+    if data_lines:
+        yield QueryEvent(event_type, json.loads("\n".join(data_lines)))
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[QueryEvent]:
+    """Parse chunked NDJSON lines into QueryEvents"""
+    for line in lines:
+        if line.strip():
+            item = json.loads(line)
+            yield QueryEvent(item["event"], item.get("data"))
+
+
+def encode_sse(event: QueryEvent) -> bytes:
+    """Serialize an event as an SSE frame"""
+    return f"event: {event.type}\ndata: {json.dumps(event.data)}\n\n".encode()
+
+
+def result_from_events(events: Iterable[QueryEvent], on_event: Callable[[QueryEvent], None] = None) -> Any:
+    """Consume a stream, passing each event to on_event, and return its final result"""
+    for event in events:
+        if on_event is not None:
+            on_event(event)
+        if event.type == "result":
+            return event.data
+        if event.type == "error":
+            raise StreamError(event.data.get("detail", "Query failed"))
+    raise StreamError("Stream ended without a result")
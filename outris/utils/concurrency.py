@@ -0,0 +1,76 @@
+"""
+Bounded concurrent execution helpers for bulk commands
+"""
+
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+@dataclass
+class Outcome:
+    """Result of running one work item"""
+    index: int
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed_ms: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def _timed_call(fn: Callable[[Any], Any], index: int, item: Any) -> Outcome:
+    """Run fn(item), capturing its result or exception and wall time"""
+    start = time.perf_counter()
+    try:
+        value = fn(item)
+        error = None
+    except Exception as e:
+        value, error = None, e
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return Outcome(index, item, value, error, elapsed_ms)
+
+def bounded_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 8,
+    ordered: bool = False,
+    window: int = None,
+) -> Iterator[Outcome]:
+    """
+    Run fn over items on a thread pool, yielding outcomes as they finish
+    
+    At most ``window`` items (default ``2 * workers``) are in flight at once and
+    ``items`` is consumed lazily, so memory stays flat on arbitrarily long inputs.
+    With ordered=True outcomes are yielded in input order. Each call runs in a
+    copy of the caller's context.
+    """
+    workers = max(1, workers)
+    window = max(workers, window or workers * 2)
+    source = enumerate(items)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if ordered:
+            queue = deque()
+            for index, item in source:
+                queue.append(pool.submit(contextvars.copy_context().run, _timed_call, fn, index, item))
+                if len(queue) >= window:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+            return
+        
+        pending = set()
+        for index, item in source:
+            pending.add(pool.submit(contextvars.copy_context().run, _timed_call, fn, index, item))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
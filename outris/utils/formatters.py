@@ -2,11 +2,18 @@
 Output formatting utilities
 """
 
+import csv
+import json
+import sys
 from rich.console import Console
 from rich.table import Table
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+ROW_FORMATS = ("ndjson", "csv")
 
 console = Console()
+# Diagnostics go to stderr so they never mix with ndjson/csv on stdout
+err_console = Console(stderr=True)
 
 def format_json(data: Dict[str, Any]):
     """Format JSON output with syntax highlighting"""
@@ -29,3 +36,71 @@ def format_table(data: List[Dict[str, Any]], title: str = "Results"):
         table.add_row(*[str(v) for v in item.values()])
     
     console.print(table)
+
+def parse_fields(fields: str) -> Optional[List[str]]:
+    """Split a --fields value like "id,name" into column names"""
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    return names or None
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'))
+    return value
+
+def write_rows(rows: Iterable[Dict[str, Any]], fmt: str, fields: Optional[List[str]] = None, out: TextIO = None) -> int:
+    """
+    Write rows as NDJSON or CSV one at a time, without Rich
+    
+    Columns come from ``fields`` or the first row's keys. Returns the number
+    of rows written.
+    """
+    out = out or sys.stdout
+    writer = None
+    count = 0
+    for row in rows:
+        if fields is None:
+            fields = [str(key) for key in row]
+        if fmt == "ndjson":
+            out.write(json.dumps({name: row.get(name) for name in fields}, separators=(',', ':')) + "\n")
+        else:
+            if writer is None:
+                writer = csv.writer(out)
+                writer.writerow(fields)
+            writer.writerow([_csv_value(row.get(name)) for name in fields])
+        count += 1
+    if fmt == "csv" and writer is None and fields:
+        csv.writer(out).writerow(fields)
+    out.flush()
+    return count
+
+def _format_bytes(size: float) -> str:
+    """Human-readable byte count"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def print_transfer_stats(stats: Dict[str, float]):
+    """Print byte counts, compression savings, retries, hedges and coalesced calls (--verbose)"""
+    raw, sent = stats.get("bytes_uncompressed", 0), stats.get("bytes_sent", 0)
+    decoded, received = stats.get("bytes_decoded", 0), stats.get("bytes_received", 0)
+    if raw:
+        err_console.print(f"[dim]Upload: {_format_bytes(sent)} on the wire, {_format_bytes(raw)} uncompressed "
+                          f"(saved {_format_bytes(raw - sent)})[/dim]")
+    if decoded:
+        err_console.print(f"[dim]Download: {_format_bytes(received)} on the wire, {_format_bytes(decoded)} decoded "
+                          f"(saved {_format_bytes(max(decoded - received, 0))})[/dim]")
+    if stats.get("retries"):
+        err_console.print(f"[dim]Retries: {stats['retries']:.0f} ({stats.get('retry_wait_s', 0):.1f}s waiting)[/dim]")
+    if stats.get("hedges_fired"):
+        err_console.print(f"[dim]Hedges: {stats['hedges_fired']} fired, {stats.get('hedges_won', 0)} won[/dim]")
+    if stats.get("coalesced"):
+        err_console.print(f"[dim]Coalesced: {stats['coalesced']} calls saved[/dim]")
+
+def print_download_summary(info: Dict[str, Any], dest: str):
+    """Print size and timing of a response saved with --output-file"""
+    encoding = f", {info['content_encoding']}" if info.get('content_encoding') else ""
+    err_console.print(f"[green]✓[/green] Saved {_format_bytes(info['bytes_written'])}{encoding} to [cyan]{dest}[/cyan] "
+                      f"in {info['elapsed_ms'] / 1000:.2f}s "
+                      f"[dim]({_format_bytes(info['bytes_received'])} on the wire)[/dim]")
@@ -0,0 +1,123 @@
+"""
+Size-aware rendering of query results
+
+Results are JSON-encoded incrementally, so output starts after at most
+``HIGHLIGHT_MAX_BYTES`` no matter how large the payload is. Small results get
+a highlighted Rich panel. Larger ones are streamed as plain text: to a pager
+on an interactive terminal, otherwise straight to the console, truncated at
+``max_bytes``. When stdout isn't a terminal the JSON is written as-is.
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TextIO
+
+from rich.console import Console
+
+HIGHLIGHT_MAX_BYTES = int(os.getenv("OUTRIS_HIGHLIGHT_MAX_BYTES", 64 * 1024))
+DEFAULT_MAX_RENDER_BYTES = int(os.getenv("OUTRIS_MAX_RENDER_BYTES", 1024 * 1024))
+
+def iter_json(data: Any, indent: Optional[int] = 2) -> Iterator[str]:
+    """Encode data as JSON piece by piece (ASCII, so characters are bytes)"""
+    return json.JSONEncoder(indent=indent).iterencode(data)
+
+def _use_pager(console: Console, pager: Optional[bool]) -> bool:
+    if pager is not None:
+        return pager
+    # Only page for a person at a real terminal, never for captured output
+    return console.file is sys.stdout and sys.stdout.isatty() and sys.stdin.isatty()
+
+@contextmanager
+def _pager_stream() -> Iterator[Optional[TextIO]]:
+    """Yield the stdin of $PAGER (default `less -FRX`), or None if it can't start"""
+    command = shlex.split(os.getenv("PAGER") or "less -FRX")
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, text=True)
+    except OSError:
+        yield None
+        return
+    try:
+        yield process.stdin
+    except BrokenPipeError:
+        # The user quit the pager early
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+
+def _write_limited(out: TextIO, chunks: Iterator[str], max_bytes: int) -> bool:
+    """Write chunks until max_bytes (0 = no limit), returning True if truncated"""
+    written = 0
+    truncated = False
+    for chunk in chunks:
+        if max_bytes and written + len(chunk) > max_bytes:
+            # Stop encoding here; the rest would never be shown
+            out.write(chunk[:max_bytes - written])
+            truncated = True
+            break
+        out.write(chunk)
+        written += len(chunk)
+    out.write("\n")
+    out.flush()
+    return truncated
+
+def render_json(
+    data: Any,
+    console: Console,
+    title: str = "",
+    max_bytes: Optional[int] = None,
+    pager: Optional[bool] = None,
+):
+    """
+    Print data as JSON, choosing the cheapest presentation for its size
+
+    max_bytes=None truncates only unpaged terminal output (at
+    DEFAULT_MAX_RENDER_BYTES); 0 never truncates. pager=None pages large
+    results automatically on an interactive terminal.
+    """
+    chunks = iter_json(data)
+    head, size = [], 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size > HIGHLIGHT_MAX_BYTES:
+            break
+    large = size > HIGHLIGHT_MAX_BYTES
+    remaining = _chain(head, chunks)
+
+    if not console.is_terminal:
+        _write_limited(console.file, remaining, max_bytes or 0)
+        return
+
+    if not large:
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
+        syntax = Syntax("".join(head), "json")
+        console.print(Panel(syntax, title=title, border_style="green") if title else syntax)
+        return
+
+    if title:
+        console.rule(f"[green]{title}[/green] [dim](large result, highlighting off)[/dim]")
+    if _use_pager(console, pager):
+        with _pager_stream() as stream:
+            if stream is not None:
+                _write_limited(stream, remaining, max_bytes or 0)
+                return
+
+    limit = DEFAULT_MAX_RENDER_BYTES if max_bytes is None else max_bytes
+    if _write_limited(console.file, remaining, limit):
+        console.print(f"[yellow]… truncated at {limit:,} bytes.[/yellow] "
+                      "[dim]Use --max-render-bytes 0, --pager or --output json > file for everything.[/dim]",
+                      highlight=False)
+
+def _chain(head: list, rest: Iterator[str]) -> Iterator[str]:
+    yield from head
+    yield from rest
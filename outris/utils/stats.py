@@ -0,0 +1,23 @@
+"""
+Latency statistics helpers
+"""
+
+import math
+from typing import Dict, Iterable, List
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (pct in 0-100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def latency_summary(values: Iterable[float]) -> Dict[str, float]:
+    """p50/p95/p99 of a latency sample"""
+    ordered = sorted(values)
+    return {
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+    }
@@ -0,0 +1,85 @@
+"""
+Shared fixtures for Outris CLI tests
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from outris import config
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """Point ~/.outris at a temporary directory"""
+    monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
+    config._set_cache(None, {})
+    return tmp_path
+
+
+class StubBackend:
+    """Programmable local HTTP server standing in for the Outris backend"""
+    
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args):
+                pass
+            
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path = urlsplit(self.path).path
+                stub.requests.append({
+                    "method": self.command, "path": self.path,
+                    "headers": dict(self.headers), "body": body,
+                })
+                handler = stub.routes.get((self.command, path))
+                if handler is None:
+                    status, headers, payload = 404, {}, {"detail": "Not found"}
+                else:
+                    status, headers, payload = handler(self, body)
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                if status == 304:
+                    data = b""
+                self.send_response(status)
+                headers = {"Content-Type": "application/json", **headers}
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+        
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+    
+    def route(self, method: str, path: str, handler):
+        """Register handler(request, body) -> (status, headers, payload)"""
+        self.routes[(method, path)] = handler
+    
+    def calls(self, method: str, path_prefix: str):
+        return [r for r in self.requests if r["method"] == method and r["path"].startswith(path_prefix)]
+
+
+@pytest.fixture
+def stub_backend():
+    """Run a StubBackend for the duration of a test"""
+    backend = StubBackend()
+    backend.thread.start()
+    yield backend
+    backend.server.shutdown()
+    backend.server.server_close()
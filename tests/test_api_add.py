@@ -0,0 +1,68 @@
+"""
+Tests for registering many specs with `api add`
+"""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from outris.commands.api import app
+
+runner = CliRunner(mix_stderr=False)
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+@pytest.fixture(autouse=True)
+def mock_backend(monkeypatch):
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+
+def _write_specs(directory, count):
+    directory.mkdir()
+    for i in range(count):
+        spec = {"openapi": "3.0.0", "info": {"title": f"Service {i}"}, "paths": {f"/r{i}": {"get": {}}}}
+        (directory / f"service{i}.json").write_text(json.dumps(spec))
+
+def test_add_directory_reports_each_spec(tmp_path):
+    """Test a directory registers every spec without prompting"""
+    _write_specs(tmp_path / "specs", 5)
+    result = runner.invoke(app, ["add", str(tmp_path / "specs"), "-j", "3", "--parse-jobs", "2"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.count("✓") == 5
+    assert "Registered 5 of 5 specs" in result.stdout
+    assert "upload" in result.stdout
+
+def test_add_glob_with_failures(tmp_path):
+    """Test unparseable specs are reported and fail the run"""
+    _write_specs(tmp_path / "specs", 2)
+    (tmp_path / "specs" / "broken.json").write_text("{not json")
+    result = runner.invoke(app, ["add", str(tmp_path / "specs" / "*.json")])
+    assert result.exit_code == 1
+    assert "Registered 2 of 3 specs" in result.stdout
+    assert "broken.json" in result.stdout.split("Failed (1):")[1]
+
+def test_add_single_spec_non_interactive(tmp_path):
+    """Test --yes skips the credentials prompt"""
+    _write_specs(tmp_path / "specs", 1)
+    result = runner.invoke(app, ["add", str(tmp_path / "specs" / "service0.json"), "--yes"])
+    assert result.exit_code == 0, result.stdout
+    assert "API registered: Service 0" in result.stdout
+    assert "credentials" not in result.stdout
+
+def test_name_requires_single_spec(tmp_path):
+    """Test --name is rejected for several specs"""
+    _write_specs(tmp_path / "specs", 2)
+    result = runner.invoke(app, ["add", str(tmp_path / "specs"), "--name", "X"])
+    assert result.exit_code == 1
+
+def test_rerun_skips_unchanged_specs(tmp_path):
+    """Test a second run over the same specs uploads nothing"""
+    _write_specs(tmp_path / "specs", 3)
+    runner.invoke(app, ["add", str(tmp_path / "specs")])
+    
+    result = runner.invoke(app, ["add", str(tmp_path / "specs")])
+    assert result.exit_code == 0, result.stdout
+    assert "Unchanged (skipped): 3" in result.stdout
+    
+    result = runner.invoke(app, ["add", str(tmp_path / "specs" / "service0.json"), "-y"])
+    assert "unchanged since it was last registered" in result.stdout
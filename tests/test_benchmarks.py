@@ -0,0 +1,19 @@
+"""
+Tests for the benchmark runner
+"""
+
+from benchmarks.run import BENCHMARKS, compare, summarize
+
+def test_compare_flags_regressions():
+    """Test medians slower than the threshold are reported"""
+    results = {"a": summarize([1.3, 1.3]), "b": summarize([1.0]), "new": summarize([5.0])}
+    baseline = {"a": {"median_ms": 1.0}, "b": {"median_ms": 1.0}}
+    
+    assert compare(results, baseline, threshold=0.2) == ["a"]
+    assert results["a"]["change"] == 0.3
+    assert "change" not in results["new"]
+
+def test_config_benchmark_runs():
+    """Test a benchmark case runs offline and returns per-run timings"""
+    timings = BENCHMARKS["config.load"](2)
+    assert len(timings) == 2
@@ -0,0 +1,94 @@
+"""
+Tests for the query result cache
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from outris import config
+from outris.commands import auth, query
+from outris.cache import QueryCache, cached_query, set_cache_ttl
+from outris.client import MockBackendClient
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+class CountingClient(MockBackendClient):
+    def __init__(self):
+        self.calls = 0
+    
+    def query(self, query_text, read_only=False):
+        self.calls += 1
+        return super().query(query_text, read_only)
+
+def test_only_opted_in_apis_are_cached():
+    """Test results are stored only for APIs with a TTL"""
+    client, cache = CountingClient(), QueryCache()
+    set_cache_ttl("Some Other API", 60)
+    
+    cached_query(client, "get weather", cache)
+    cached_query(client, "get weather", cache)
+    assert client.calls == 2
+    
+    set_cache_ttl("Mock Weather API", 60)
+    cached_query(client, "get weather", cache)
+    result = cached_query(client, "  GET   Weather ", cache)
+    assert client.calls == 3
+    assert result["cached"] is True
+    assert cache.stats()["hits"] == 1
+
+def test_disabled_api_is_not_served():
+    """Test disabling an API stops hits and purges its entries"""
+    client, cache = CountingClient(), QueryCache()
+    set_cache_ttl("Some Other API", 60)
+    set_cache_ttl("Mock Weather API", 60)
+    cached_query(client, "get weather", cache)
+    
+    # Turned off by editing config directly: the entry is left but not served
+    set_cache_ttl("Mock Weather API", None)
+    assert "cached" not in cached_query(client, "get weather", cache)
+    assert client.calls == 2
+    
+    set_cache_ttl("Mock Weather API", 60)
+    cached_query(client, "get weather", cache)
+    result = CliRunner().invoke(query.app, ["cache", "disable", "Mock Weather API"])
+    assert result.exit_code == 0, result.stdout
+    assert "1 cached results removed" in result.stdout
+    assert cache.stats()["entries"] == 0
+
+def test_login_keeps_cache_ttls(monkeypatch):
+    """Test logging in merges credentials into the config instead of replacing it"""
+    set_cache_ttl("Mock Weather API", 60)
+    answers = iter(["user@example.com", "123456"])
+    monkeypatch.setattr(auth.Prompt, "ask", lambda *args, **kwargs: next(answers))
+    
+    result = CliRunner().invoke(auth.app, ["login"])
+    assert result.exit_code == 0, result.stdout
+    stored = config.load_config()
+    assert stored["email"] == "user@example.com"
+    assert stored["cache_ttls"] == {"Mock Weather API": 60}
+
+def test_refresh_bypasses_lookup():
+    """Test --refresh re-queries and replaces the entry"""
+    client, cache = CountingClient(), QueryCache()
+    set_cache_ttl("Mock Weather API", 60)
+    cached_query(client, "get weather", cache)
+    result = cached_query(client, "get weather", cache, refresh=True)
+    assert client.calls == 2
+    assert "cached" not in result
+
+def test_expired_entries_miss():
+    """Test entries past their TTL are not served"""
+    cache = QueryCache()
+    cache.put("q", "org", {"api_used": "A"}, ttl=-1)
+    assert cache.get("q", "org") is None
+    assert cache.get("q", "other_org") is None
+
+def test_lru_eviction_by_size():
+    """Test least recently used entries are evicted over the size cap"""
+    cache = QueryCache(max_bytes=200)
+    for name in ("a", "b", "c"):
+        cache.put(name, None, {"data": "x" * 60}, ttl=60)
+        cache.get("a", None)
+    assert cache.get("a", None) is not None
+    assert cache.get("b", None) is None
+    assert cache.stats()["evictions"] >= 1
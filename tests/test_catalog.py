@@ -0,0 +1,86 @@
+"""
+Tests for the local API catalog index
+"""
+
+import pytest
+
+from outris.catalog import ApiCatalog
+from outris.client import RealBackendClient
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+APIS = {"count": 2, "apis": [
+    {"api_id": "api_1", "name": "Payments", "visibility": "org", "endpoints": 12},
+    {"api_id": "api_2", "name": "Weather", "visibility": "org", "endpoints": 5},
+]}
+
+@pytest.fixture
+def backend(stub_backend):
+    def list_apis(request, body):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"'}, APIS
+    
+    stub_backend.route("GET", "/api/v1/apis", list_apis)
+    stub_backend.route("POST", "/api/v1/apis/api_2/secrets",
+                       lambda request, body: (200, {}, {"message": "Secret stored"}))
+    return stub_backend
+
+def test_list_apis_revalidates_with_etag(backend):
+    """Test a second list sends If-None-Match and reuses the cached body on 304"""
+    client = RealBackendClient(base_url=backend.url)
+    assert client.list_apis("org") == APIS
+    assert client.list_apis("org") == APIS
+    
+    calls = backend.calls("GET", "/api/v1/apis")
+    assert "If-None-Match" not in calls[0]["headers"]
+    assert calls[1]["headers"]["If-None-Match"] == '"v1"'
+
+def test_add_secret_skips_catalog_download(backend):
+    """Test add_secret resolves the api_id locally once the catalog is known"""
+    RealBackendClient(base_url=backend.url).list_apis("org")
+    
+    client = RealBackendClient(base_url=backend.url)
+    for _ in range(3):
+        assert client.add_secret("Weather", "API_KEY", "secret")["message"] == "Secret stored"
+    assert len(backend.calls("GET", "/api/v1/apis")) == 1
+
+def test_add_secret_refreshes_stale_entry(backend):
+    """Test a 404 on a stale api_id refetches the catalog and retries"""
+    catalog = ApiCatalog()
+    catalog.store("org", {"count": 1, "apis": [{"api_id": "api_old", "name": "Weather"}]}, '"v0"')
+    
+    client = RealBackendClient(base_url=backend.url)
+    assert client.add_secret("Weather", "API_KEY", "secret")["message"] == "Secret stored"
+    assert len(backend.calls("POST", "/api/v1/apis/api_old")) == 1
+    assert len(backend.calls("POST", "/api/v1/apis/api_2")) == 1
+
+def test_add_secret_unknown_api(backend):
+    """Test an unknown name raises after one revalidation"""
+    client = RealBackendClient(base_url=backend.url)
+    with pytest.raises(ValueError):
+        client.add_secret("Missing", "API_KEY", "secret")
+
+def test_catalog_ignores_other_org(config_home):
+    """Test a catalog saved for one org isn't used by another"""
+    from outris import config
+    config.save_config({"org_id": "org_a"})
+    ApiCatalog().store("org", APIS, '"v1"')
+    assert ApiCatalog().lookup("Weather")["api_id"] == "api_2"
+    
+    config.save_config({"org_id": "org_b"})
+    assert ApiCatalog().lookup("Weather") is None
+
+def test_client_catalog_follows_org_switch(config_home):
+    """Test a long-lived client reloads its catalog after logging into another org"""
+    from outris import config
+    config.save_config({"org_id": "org_a"})
+    client = RealBackendClient(base_url="http://localhost:9")
+    client.catalog.store("org", APIS, '"v1"')
+    
+    config.update_config({"org_id": "org_b"})
+    assert client.catalog.lookup("Weather") is None
+    client.catalog.upsert({"api_id": "api_9", "name": "Maps"})
+    
+    config.update_config({"org_id": "org_a"})
+    assert ApiCatalog().lookup("Maps") is None
@@ -2,8 +2,16 @@
 Tests for backend client
 """
 
+import asyncio
+import gzip
+import json
 import pytest
-from outris.client import create_client, MockBackendClient, RealBackendClient
+import requests
+from outris.client import (
+    create_client, MockBackendClient, RealBackendClient,
+    AsyncMockBackendClient, AsyncBackendClient,
+)
+from outris.compression import choose_encoding
 import os
 
 def test_create_mock_client():
@@ -17,3 +25,138 @@ def test_create_real_client():
     os.environ["OUTRIS_USE_MOCK"] = "false"
     client = create_client()
     assert isinstance(client, RealBackendClient)
+
+def test_real_client_pool_settings_from_env(monkeypatch):
+    """Test pool size and timeouts are read from the environment"""
+    monkeypatch.setenv("OUTRIS_POOL_MAXSIZE", "32")
+    monkeypatch.setenv("OUTRIS_CONNECT_TIMEOUT", "2.5")
+    monkeypatch.setenv("OUTRIS_READ_TIMEOUT", "30")
+    client = RealBackendClient(base_url="http://localhost:9")
+    
+    adapter = client.session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 32
+    assert client.timeout == (2.5, 30.0)
+    assert client.session.get_adapter("http://example.com") is adapter
+
+def test_real_client_close():
+    """Test closing the client releases the pooled session"""
+    with RealBackendClient(base_url="http://localhost:9") as client:
+        assert client._finalizer.alive
+    assert not client._finalizer.alive
+
+def test_create_async_mock_client():
+    """Test async mock client creation and awaitable queries"""
+    client = create_client(use_mock=True, asynchronous=True)
+    assert isinstance(client, AsyncMockBackendClient)
+    
+    async def run():
+        return await asyncio.gather(*(client.query(f"q{i}") for i in range(50)))
+    
+    results = asyncio.run(run())
+    assert len(results) == 50
+    assert results[7]["result"]["message"] == "Mock result for: q7"
+
+def test_async_client_bounded_concurrency():
+    """Test async calls never exceed max_concurrency and honour timeouts"""
+    client = AsyncMockBackendClient(max_concurrency=3)
+    in_flight = 0
+    peak = 0
+    
+    async def slow():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+    
+    async def run():
+        await asyncio.gather(*(client._bounded(slow(), None) for _ in range(10)))
+        with pytest.raises(asyncio.TimeoutError):
+            await client._bounded(asyncio.sleep(1), 0.01)
+    
+    asyncio.run(run())
+    assert peak == 3
+
+def test_async_client_reused_across_event_loops():
+    """Test one client works from successive asyncio.run calls"""
+    client = AsyncMockBackendClient(max_concurrency=2)
+    
+    async def run():
+        return await asyncio.gather(*(client._bounded(asyncio.sleep(0.01, {}), None) for _ in range(5)))
+    
+    assert len(asyncio.run(run())) == 5
+    assert len(asyncio.run(run())) == 5
+
+def test_create_async_real_client():
+    """Test async real client creation"""
+    pytest.importorskip("httpx")
+    client = create_client(use_mock=False, asynchronous=True)
+    assert isinstance(client, AsyncBackendClient)
+    asyncio.run(client.aclose())
+
+def _echo_body(request, body):
+    """Stub handler that decodes a gzip request body and echoes its size"""
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return 200, {}, {"api_id": "api_1", "name": "Big", "received": len(body)}
+
+def test_large_body_is_gzipped(stub_backend, config_home):
+    """Test bodies above the threshold are compressed and counted"""
+    stub_backend.route("POST", "/api/v1/apis/register", _echo_body)
+    client = RealBackendClient(base_url=stub_backend.url, compression="gzip", compress_min_bytes=1024)
+    spec = {"paths": {f"/items/{i}": {"get": {"summary": "List items"}} for i in range(500)}}
+    
+    result = client.register_api(spec, "Big", "org")
+    request = stub_backend.calls("POST", "/api/v1/apis/register")[0]
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    assert result["received"] == client.stats["bytes_uncompressed"]
+    assert client.stats["bytes_sent"] < client.stats["bytes_uncompressed"] / 5
+
+def test_small_body_is_not_compressed(stub_backend, config_home):
+    """Test bodies below the threshold are sent as plain JSON"""
+    stub_backend.route("POST", "/api/v1/query", _echo_body)
+    client = RealBackendClient(base_url=stub_backend.url, compression="gzip")
+    client.query("weather")
+    assert "Content-Encoding" not in stub_backend.requests[0]["headers"]
+
+@pytest.mark.parametrize("status", [400, 415])
+def test_rejected_compression_falls_back(stub_backend, config_home, status):
+    """Test a compressed body rejected as undecodable is resent uncompressed and compression stops"""
+    def reject_compressed(request, body):
+        if request.headers.get("Content-Encoding"):
+            return status, {}, {"detail": "Could not decode body"}
+        return _echo_body(request, body)
+    
+    stub_backend.route("POST", "/api/v1/query", reject_compressed)
+    client = RealBackendClient(base_url=stub_backend.url, compression="gzip", compress_min_bytes=10)
+    assert client.query("x" * 100)["received"] > 100
+    client.query("y" * 100)
+    assert len(stub_backend.requests) == 3
+    assert client.compression is None
+
+def test_invalid_request_keeps_compression(stub_backend, config_home):
+    """Test a 400 that also fails uncompressed is raised and compression stays on"""
+    stub_backend.route("POST", "/api/v1/query", lambda request, body: (400, {}, {"detail": "bad query"}))
+    client = RealBackendClient(base_url=stub_backend.url, compression="gzip", compress_min_bytes=10)
+    with pytest.raises(requests.HTTPError):
+        client.query("x" * 100)
+    assert len(stub_backend.requests) == 2
+    assert client.compression == "gzip"
+
+def test_auto_compression_is_gzip():
+    """Test auto never picks zstd, which servers may not accept"""
+    assert choose_encoding("auto") == "gzip"
+    assert choose_encoding("none") is None
+
+def test_accepts_compressed_responses(stub_backend, config_home):
+    """Test responses are negotiated via Accept-Encoding and decoded"""
+    payload = json.dumps({"result": {"rows": ["x" * 50] * 200}}).encode()
+    stub_backend.route("POST", "/api/v1/query",
+                       lambda request, body: (200, {"Content-Encoding": "gzip"}, gzip.compress(payload)))
+    client = RealBackendClient(base_url=stub_backend.url)
+    
+    result = client.query("rows")
+    assert "gzip" in stub_backend.requests[0]["headers"]["Accept-Encoding"]
+    assert len(result["result"]["rows"]) == 200
+    assert client.stats["bytes_received"] < client.stats["bytes_decoded"]
@@ -0,0 +1,83 @@
+"""
+Tests for single-flight request coalescing
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from outris.client import RealBackendClient
+from outris.coalescing import SingleFlight
+from outris.mock_server import MockServer, MockServerConfig
+
+
+def _run_together(n, fn):
+    """Call fn from n threads released at the same moment"""
+    barrier = threading.Barrier(n)
+    def call():
+        barrier.wait()
+        return fn()
+    with ThreadPoolExecutor(n) as pool:
+        return [f.result() for f in [pool.submit(call) for _ in range(n)]]
+
+def test_concurrent_callers_share_one_call():
+    """Test identical in-flight calls run once and every caller gets the result"""
+    stats, calls = Counter(), []
+    flight = SingleFlight(count=lambda name: stats.update([name]))
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 42}
+
+    results = _run_together(5, lambda: flight.do("key", slow))
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 5
+    assert stats["coalesced"] == 4
+
+def test_waiters_get_independent_copies():
+    """Test a caller annotating its result doesn't change another's"""
+    flight = SingleFlight()
+    results = _run_together(2, lambda: flight.do("key", lambda: time.sleep(0.1) or {"a": 1}))
+    results[0]["cached"] = True
+    assert "cached" not in results[1]
+
+def test_errors_are_shared():
+    """Test waiters see the leader's exception"""
+    flight = SingleFlight()
+    def fail():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    errors = _run_together(3, lambda: pytest.raises(ValueError, flight.do, "key", fail))
+    assert all("boom" in str(e.value) for e in errors)
+
+def test_finished_calls_are_not_reused():
+    """Test sequential calls and different keys each run"""
+    flight, calls = SingleFlight(), Counter()
+    for key in ("a", "a", "b"):
+        flight.do(key, lambda: calls.update([key]))
+    assert calls == Counter({"a": 2, "b": 1})
+
+@pytest.mark.usefixtures("config_home")
+def test_client_coalesces_gets_and_read_only_queries():
+    """Test concurrent identical GETs and read-only queries hit the server once each"""
+    server = MockServer(config=MockServerConfig(latency="fixed:200")).start()
+    try:
+        client = RealBackendClient(base_url=server.url)
+        teams = _run_together(4, client.list_team)
+        assert server.stats["requests"] == 1
+        assert all(team["count"] == 3 for team in teams)
+
+        _run_together(4, lambda: client.query("weather", read_only=True))
+        assert server.stats["requests"] == 2
+        assert client.stats["coalesced"] == 6
+
+        # Queries that may change state are never shared
+        _run_together(2, lambda: client.query("weather"))
+        assert server.stats["requests"] == 4
+    finally:
+        server.stop()
@@ -0,0 +1,52 @@
+"""
+Tests for configuration management
+"""
+
+import json
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from outris import config
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+def test_load_config_is_cached(monkeypatch):
+    """Test the file is parsed once until it changes"""
+    config.save_config({"api_key": "sk_outris_first"})
+    config._set_cache(None, {})
+    
+    reads = []
+    real_read = config._read_config
+    monkeypatch.setattr(config, "_read_config", lambda: reads.append(1) or real_read())
+    
+    for _ in range(5):
+        assert config.get_api_key() == "sk_outris_first"
+    assert len(reads) == 1
+
+def test_external_change_invalidates_cache():
+    """Test a write from another process is picked up via mtime/size"""
+    config.save_config({"api_key": "sk_outris_first"})
+    assert config.get_api_key() == "sk_outris_first"
+    
+    config.CONFIG_FILE.write_text(json.dumps({"api_key": "sk_outris_second_longer"}))
+    assert config.get_api_key() == "sk_outris_second_longer"
+
+def test_save_config_is_atomic_and_private(config_home):
+    """Test save leaves no temp files and restricts permissions"""
+    config.save_config({"api_key": "sk_outris_abc"})
+    assert sorted(p.name for p in config_home.iterdir()) == ["config.json", "config.lock"]
+    assert os.stat(config.CONFIG_FILE).st_mode & 0o777 == 0o600
+
+def test_update_config_keeps_concurrent_changes():
+    """Test parallel read-modify-write updates are not lost"""
+    config.save_config({})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: config.update_config({f"k{i}": i}), range(20)))
+    assert len(config.load_config()) == 20
+
+def test_clear_config():
+    """Test logout removes the file and the cached copy"""
+    config.save_config({"api_key": "sk_outris_abc"})
+    config.clear_config()
+    assert config.load_config() == {}
@@ -0,0 +1,105 @@
+"""
+Tests for the background daemon and the thin launcher
+"""
+
+import json
+import stat
+import threading
+import time
+
+import pytest
+
+from outris import launcher
+from outris.daemon import DaemonServer
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+@pytest.fixture
+def daemon(monkeypatch):
+    """Run a DaemonServer on a background thread"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    server = DaemonServer(idle_timeout=30)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    launcher.request({"control": "stop"})
+    thread.join(5)
+
+def test_should_forward():
+    """Test only read-only, non-interactive commands are forwarded"""
+    assert launcher.should_forward(["ask", "weather", "--output", "json"], interactive=False)
+    assert launcher.should_forward(["api", "list", "--output", "csv"], interactive=False)
+    assert not launcher.should_forward(["ask", "weather"], interactive=True)
+    assert not launcher.should_forward(["api", "add", "spec.yaml"], interactive=False)
+    assert not launcher.should_forward(["ask", "weather", "--output-file=out.json"], interactive=False)
+    assert not launcher.should_forward(["query", "batch", "q.jsonl"], interactive=False)
+
+def test_forwarded_command_output(daemon, capsys):
+    """Test a forwarded command's stdout and exit code are replayed"""
+    assert launcher.forward(["team", "list", "--output", "ndjson"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert rows[0]["email"] == "alice@acme.com"
+    assert launcher.request({"control": "status"})["served"] == 1
+
+def test_forwarded_usage_error(daemon, capsys):
+    """Test click errors come back on stderr with their exit code"""
+    assert launcher.forward(["ask"]) == 2
+    assert "Missing argument" in capsys.readouterr().err
+
+def test_concurrent_commands_capture_separately(daemon):
+    """Test output from simultaneous commands doesn't interleave"""
+    results = {}
+    
+    def run(name):
+        results[name] = launcher.request({"argv": ["ask", name, "--output", "json"], "env": launcher.client_env()})
+    threads = [threading.Thread(target=run, args=(f"query {i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for name, response in results.items():
+        assert response["exit"] == 0
+        assert response["stdout"].count("Mock result for") == 1
+        assert f"Mock result for: {name}" in response["stdout"]
+
+def test_command_stats_are_per_command(stub_backend):
+    """Test a shared client reports each command's own traffic, including bulk work"""
+    from outris.client import RealBackendClient, command_stats
+    from outris.scheduler import scheduler_for
+    stub_backend.route("GET", "/api/v1/team/members", lambda request, body: (200, {}, {"members": [], "count": 0}))
+    client = RealBackendClient(base_url=stub_backend.url)
+    client.list_team()
+    one = client.stats["bytes_decoded"]
+    
+    with command_stats():
+        assert client.stats["bytes_decoded"] == 0
+        list(scheduler_for(client, 1).map(lambda _: client.list_team(), range(3)))
+        assert client.stats["bytes_decoded"] == 3 * one
+    assert client.stats["bytes_decoded"] == 4 * one
+
+def test_environment_mismatch_falls_back(daemon, monkeypatch):
+    """Test commands run locally when the caller's settings differ"""
+    monkeypatch.setenv("OUTRIS_API_URL", "http://elsewhere")
+    assert launcher.forward(["team", "list"]) is None
+
+def test_socket_is_private(daemon):
+    """Test the socket is owner-only"""
+    mode = launcher.socket_path().stat().st_mode
+    assert stat.S_ISSOCK(mode)
+    assert stat.S_IMODE(mode) == 0o600
+
+def test_no_daemon_means_local(tmp_path):
+    """Test a missing socket or a regular file is never used"""
+    assert launcher.forward(["team", "list"]) is None
+    fake = tmp_path / "fake.sock"
+    fake.write_text("")
+    assert launcher.request({"control": "status"}, fake) is None
+
+def test_idle_shutdown(monkeypatch):
+    """Test the daemon exits and removes its socket after the idle timeout"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    server = DaemonServer(idle_timeout=0.2)
+    start = time.monotonic()
+    server.serve()
+    assert time.monotonic() - start < 2
+    assert not launcher.socket_path().exists()
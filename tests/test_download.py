@@ -0,0 +1,84 @@
+"""
+Tests for streaming responses straight to disk
+"""
+
+import gzip
+import json
+import tracemalloc
+
+import pytest
+import requests
+from typer.testing import CliRunner
+
+from outris.client import RealBackendClient
+from outris.main import app
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+runner = CliRunner()
+
+def _big_body(size: int) -> bytes:
+    return json.dumps({"result": {"padding": "x" * size}}).encode()
+
+def test_download_keeps_memory_flat(stub_backend, tmp_path):
+    """Test a 20 MB body is written to disk without being held in memory"""
+    body = _big_body(20 * 1024 * 1024)
+    stub_backend.route("POST", "/api/v1/query", lambda request, _: (200, {}, body))
+    client = RealBackendClient(base_url=stub_backend.url)
+    dest = tmp_path / "result.json"
+    
+    tracemalloc.start()
+    try:
+        info = client.query_to_file("export everything", dest)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    assert dest.read_bytes() == body
+    assert info["bytes_written"] == len(body)
+    assert peak < 8 * 1024 * 1024
+    assert not (tmp_path / "result.json.part").exists()
+
+def test_download_decompresses_or_keeps_encoding(stub_backend, tmp_path):
+    """Test gzip bodies are decoded by default and kept as-is with decompress=False"""
+    body = _big_body(100_000)
+    stub_backend.route("GET", "/api/v1/team/members",
+                       lambda request, _: (200, {"Content-Encoding": "gzip"}, gzip.compress(body)))
+    client = RealBackendClient(base_url=stub_backend.url)
+    
+    info = client.export_to_file("team", tmp_path / "team.json")
+    assert (tmp_path / "team.json").read_bytes() == body
+    assert info["bytes_received"] < info["bytes_written"]
+    
+    info = client.export_to_file("team", tmp_path / "team.json.gz", decompress=False)
+    assert gzip.decompress((tmp_path / "team.json.gz").read_bytes()) == body
+    assert info["content_encoding"] == "gzip"
+
+def test_failed_download_leaves_no_file(stub_backend, tmp_path):
+    """Test HTTP errors don't create the destination file"""
+    stub_backend.route("GET", "/api/v1/marketplace", lambda request, _: (403, {}, {"detail": "no"}))
+    client = RealBackendClient(base_url=stub_backend.url)
+    out_dir = tmp_path / "exports"
+    out_dir.mkdir()
+    with pytest.raises(requests.HTTPError):
+        client.export_to_file("marketplace", out_dir / "m.json")
+    assert list(out_dir.iterdir()) == []
+
+@pytest.mark.parametrize("args", [["ask", "weather"], ["api", "list"], ["team", "list"], ["marketplace", "browse"]])
+def test_output_file_option(args, tmp_path, monkeypatch):
+    """Test --output-file saves JSON and prints only a summary"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    dest = tmp_path / "out.json"
+    result = runner.invoke(app, [*args, "--output-file", str(dest)])
+    assert result.exit_code == 0
+    assert "Saved" in result.stdout
+    assert isinstance(json.loads(dest.read_text()), dict)
+
+def test_category_with_output_file_is_rejected(tmp_path, monkeypatch):
+    """Test marketplace browse refuses a filter it can't apply to a raw download"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    dest = tmp_path / "out.json"
+    result = runner.invoke(app, ["marketplace", "browse", "--category", "Payments", "--output-file", str(dest)])
+    assert result.exit_code == 1
+    assert "--category" in result.stdout
+    assert not dest.exists()
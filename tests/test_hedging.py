@@ -0,0 +1,118 @@
+"""
+Tests for hedged read-only queries
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from outris.client import RealBackendClient
+from outris.hedging import Hedger
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+def _slow_then_fast(slow_seconds: float):
+    """Call whose first invocation is slow and the rest are instant"""
+    state = {"calls": 0}
+    lock = threading.Lock()
+    
+    def call():
+        with lock:
+            state["calls"] += 1
+            number = state["calls"]
+        if number == 1:
+            time.sleep(slow_seconds)
+            return "slow"
+        return "fast"
+    return call, state
+
+def test_fast_call_is_not_hedged():
+    """Test calls finishing within the delay never fire a hedge"""
+    stats = Counter()
+    hedger = Hedger(initial_delay_ms=200, count=stats.update)
+    assert hedger.run(lambda: "ok") == "ok"
+    assert stats == Counter()
+
+def test_slow_call_is_hedged_and_hedge_wins():
+    """Test a slow primary is raced by a hedge that answers first"""
+    stats = Counter()
+    hedger = Hedger(initial_delay_ms=20, count=lambda name: stats.update([name]))
+    call, state = _slow_then_fast(0.5)
+    
+    start = time.perf_counter()
+    assert hedger.run(call) == "fast"
+    assert time.perf_counter() - start < 0.4
+    assert state["calls"] == 2
+    assert stats == Counter({"hedges_fired": 1, "hedges_won": 1})
+
+def test_time_queued_for_a_thread_does_not_trigger_hedges():
+    """Test the delay starts when a call runs, so a saturated pool doesn't fire hedges"""
+    stats = Counter()
+    hedger = Hedger(initial_delay_ms=50, max_workers=1, count=lambda name: stats.update([name]))
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: hedger.run(lambda: time.sleep(0.03) or "ok"), range(4)))
+    assert results == ["ok"] * 4
+    assert stats["hedges_fired"] == 0
+
+def test_reserve_grows_the_pool():
+    """Test reserving for more concurrency lets that many calls run at once"""
+    hedger = Hedger(max_workers=2, initial_delay_ms=1000)
+    hedger.reserve(8)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: hedger.run(lambda: time.sleep(0.1)), range(8)))
+    assert time.perf_counter() - start < 0.2
+
+def test_hedge_budget_caps_extra_load():
+    """Test hedges stop firing once they exceed the budget"""
+    stats = Counter()
+    hedger = Hedger(initial_delay_ms=1, budget=0.1, count=lambda name: stats.update([name]))
+    for _ in range(20):
+        hedger.run(lambda: time.sleep(0.01))
+    # One burst hedge plus 10% of 20 calls
+    assert stats["hedges_fired"] <= 3
+
+def test_delay_tracks_recent_latency():
+    """Test the hedge delay switches to the latency percentile once warmed up"""
+    hedger = Hedger(initial_delay_ms=500, delay_percentile=90, min_samples=10)
+    assert hedger.delay() == 0.5
+    for latency in range(1, 11):
+        hedger.observe(latency * 10)
+    assert hedger.delay() == pytest.approx(0.09)
+
+def test_failed_primary_falls_back_to_hedge():
+    """Test an error from one copy doesn't fail the call if the other succeeds"""
+    hedger = Hedger(initial_delay_ms=10)
+    state = {"calls": 0}
+    
+    def call():
+        state["calls"] += 1
+        if state["calls"] == 1:
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+        time.sleep(0.1)
+        return "ok"
+    assert hedger.run(call) == "ok"
+
+def test_read_only_query_is_hedged(stub_backend, monkeypatch):
+    """Test RealBackendClient hedges read-only queries only"""
+    monkeypatch.setenv("OUTRIS_HEDGE_DELAY_MS", "50")
+    state = {"calls": 0}
+    
+    def handler(request, body):
+        state["calls"] += 1
+        if state["calls"] == 1:
+            time.sleep(0.5)
+        return 200, {}, {"result": {}, "api_used": "Stub"}
+    stub_backend.route("POST", "/api/v1/query", handler)
+    
+    with RealBackendClient(base_url=stub_backend.url) as client:
+        assert client.query("weather", read_only=True)["api_used"] == "Stub"
+        assert client.stats["hedges_fired"] == 1
+        assert client.stats["hedges_won"] == 1
+        
+        client.query("weather")
+        assert client.stats["hedges_fired"] == 1
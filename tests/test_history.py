@@ -0,0 +1,102 @@
+"""
+Tests for the local query history store
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from outris.client import MockBackendClient
+from outris.commands.query import app
+from outris.history import HistoryStore
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+runner = CliRunner()
+
+@pytest.fixture(autouse=True)
+def mock_backend(monkeypatch):
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+
+class PagedHistoryClient(MockBackendClient):
+    """Serves server-side history like the backend: latest first, honouring limit, since and until"""
+    
+    def __init__(self, count=1200, timestamp=None):
+        timestamp = timestamp or (lambda i: f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}Z")
+        self.entries = [
+            {"id": f"h{i}", "query": f"query number {i}", "api": "Weather" if i % 2 else "Payments",
+             "timestamp": timestamp(i)}
+            for i in range(count)
+        ]
+        self.calls = []
+    
+    def get_history(self, limit=10, since=None, until=None):
+        self.calls.append((since, until))
+        matching = [e for e in reversed(self.entries)
+                    if (since is None or e["timestamp"] > since) and (until is None or e["timestamp"] <= until)]
+        return {"count": len(matching[:limit]), "queries": matching[:limit]}
+
+def test_incremental_sync():
+    """Test sync pages back through history once and then only fetches new entries"""
+    client, store = PagedHistoryClient(), HistoryStore()
+    assert store.sync(client) == 1200
+    assert len(client.calls) == 3
+    
+    client.calls.clear()
+    assert store.sync(client) == 0
+    assert client.calls == [("2025-01-01T00:19:58Z", None)]
+
+def test_sync_pages_newest_first_with_shared_timestamps():
+    """Test a latest-first server with small pages and shared timestamps loses nothing"""
+    # Pairs of entries share a timestamp, so page boundaries split them
+    client = PagedHistoryClient(12, timestamp=lambda i: f"2025-01-01T00:00:{i // 2:02d}Z")
+    store = HistoryStore()
+    assert store.sync(client, page_size=5) == 12
+    
+    # New entries, one sharing the last synced timestamp
+    client.entries.append({"id": "late", "query": "late arrival", "timestamp": "2025-01-01T00:00:05Z"})
+    client.entries.append({"id": "new", "query": "newer", "timestamp": "2025-01-01T00:01:00Z"})
+    assert store.sync(client, page_size=5) == 2
+    assert len(store.search(limit=100)) == 14
+
+def test_sync_replaces_local_copy():
+    """Test a query run here isn't listed twice once the server's copy syncs"""
+    store = HistoryStore()
+    store.record("get weather in SF", {"api_used": "Mock Weather API", "execution_time_ms": 123})
+    
+    class RecentHistoryClient(MockBackendClient):
+        def get_history(self, limit=10, since=None, until=None):
+            item = {"id": "srv1", "query": "get weather in SF", "api": "Mock Weather",
+                    "timestamp": store.search()[0]["timestamp"]}
+            return {"count": 1, "queries": [] if until else [item]}
+    
+    assert store.sync(RecentHistoryClient()) == 0
+    rows = store.search(grep="weather")
+    assert len(rows) == 1
+    assert rows[0]["remote_key"] == "srv1" and rows[0]["source"] == "local"
+
+def test_search_filters():
+    """Test full-text, API and since filters with paging"""
+    store = HistoryStore()
+    store.sync(PagedHistoryClient())
+    
+    assert [r["query"] for r in store.search(grep="number 1199")] == ["query number 1199"]
+    weather = store.search(api="Weather", limit=5)
+    assert len(weather) == 5 and all(r["api"] == "Weather" for r in weather)
+    assert store.search(api="Weather", limit=5, offset=5)[0]["timestamp"] < weather[-1]["timestamp"]
+    assert len(store.search(since="2025-01-01T00:19:00Z", limit=100)) == 60
+
+def test_local_queries_are_recorded():
+    """Test ask records the query with its result metadata"""
+    result = runner.invoke(app, ["ask", "weather in Paris"])
+    assert result.exit_code == 0
+    
+    rows = HistoryStore().search(grep="paris")
+    assert rows[0]["source"] == "local"
+    assert rows[0]["api"] == "Mock Weather API"
+    assert rows[0]["execution_time_ms"] == 123
+
+def test_history_command_syncs_and_searches():
+    """Test the history command shows synced server entries"""
+    result = runner.invoke(app, ["history", "--grep", "charge"])
+    assert result.exit_code == 0
+    assert "create charge $50" in result.stdout
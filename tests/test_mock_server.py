@@ -0,0 +1,86 @@
+"""
+Tests for the local stand-in backend
+"""
+
+import pytest
+import requests
+
+from outris.client import RealBackendClient
+from outris.mock_server import MockServer, MockServerConfig, parse_latency
+from outris.retry import CircuitBreaker, RetryPolicy
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+@pytest.fixture
+def serve():
+    servers = []
+    
+    def start(**options):
+        server = MockServer(config=MockServerConfig(**options)).start()
+        servers.append(server)
+        return server
+    
+    yield start
+    for server in servers:
+        server.stop()
+
+def test_real_client_against_every_route(serve):
+    """Test each RealBackendClient method round-trips through HTTP"""
+    server = serve()
+    client = RealBackendClient(base_url=server.url, compress_min_bytes=10)
+    
+    assert client.signup("a@b.co", "Acme")["expires_in"] == 300
+    assert client.verify_otp("a@b.co", "123456")["api_key"].startswith("sk_outris_")
+    assert client.login("a@b.co")["expires_in"] == 300
+    assert client.register_api({"paths": {"/a": {}}}, "A", "org")["endpoints"] == 1
+    assert client.list_apis("org")["count"] == 3
+    assert "stored" in client.add_secret("Mock Weather API", "KEY", "v")["message"]
+    assert client.query("weather")["api_used"] == "Mock Weather API"
+    assert client.get_history(5)["count"] == 2
+    assert "Invitation" in client.invite_member("c@b.co", "member")["message"]
+    assert client.accept_invitation("tok", "c@b.co", "123456")["role"] == "member"
+    assert client.list_team()["count"] == 3
+    assert client.get_marketplace()["count"] == 5
+    assert client.install_from_marketplace("Stripe Demo")["api_id"]
+    assert server.stats.get("status_404") is None
+
+def test_fault_injection(serve):
+    """Test configured 503 and 429 rates surface as HTTP errors"""
+    server = serve(error_rate=0.5, rate_limit_rate=0.5, retry_after=0.05, seed=1)
+    client = RealBackendClient(base_url=server.url, retry_policy=RetryPolicy(max_attempts=1),
+                               breaker=CircuitBreaker(failure_threshold=100))
+    
+    statuses = []
+    for _ in range(20):
+        with pytest.raises(requests.HTTPError) as e:
+            client.list_team()
+        statuses.append(e.value.response.status_code)
+        if statuses[-1] == 429:
+            assert e.value.response.headers["Retry-After"] == "0.05"
+    assert set(statuses) == {503, 429}
+
+def test_retries_absorb_injected_faults(serve, monkeypatch):
+    """Test transient 503/429s are retried through to success"""
+    monkeypatch.setenv("OUTRIS_IDEMPOTENCY_KEYS", "true")
+    server = serve(error_rate=0.2, rate_limit_rate=0.1, retry_after=0, seed=3)
+    client = RealBackendClient(base_url=server.url, retry_policy=RetryPolicy(max_attempts=8, base_delay=0.001))
+    
+    for i in range(20):
+        assert client.query(f"q{i}")["api_used"]
+    assert client.stats["retries"] == server.stats["status_503"] + server.stats["status_429"]
+
+def test_payload_padding_and_chunked_streaming(serve):
+    """Test padded query results are delivered over a chunked response"""
+    server = serve(payload_bytes=50_000, chunk_size=4096)
+    result = RealBackendClient(base_url=server.url).query("big")
+    assert len(result["result"]["padding"]) == 50_000
+
+def test_parse_latency():
+    """Test latency specs produce samplers in seconds"""
+    import random
+    rng = random.Random(0)
+    assert parse_latency("50")(rng) == 0.05
+    assert 0.01 <= parse_latency("uniform:10,20")(rng) <= 0.02
+    assert parse_latency("lognormal:50,0.5")(rng) > 0
+    with pytest.raises(ValueError):
+        parse_latency("weibull:1,2")
@@ -0,0 +1,83 @@
+"""
+Tests for streaming NDJSON/CSV output modes
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from outris.main import app
+from outris.utils.formatters import parse_fields, print_download_summary, print_transfer_stats, write_rows
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+runner = CliRunner()
+
+@pytest.fixture(autouse=True)
+def mock_backend(monkeypatch):
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+
+def test_write_rows_ndjson_uses_first_row_columns():
+    """Test NDJSON rows share the first row's columns"""
+    out = io.StringIO()
+    count = write_rows(iter([{"a": 1, "b": 2}, {"a": 3, "c": 4}]), "ndjson", out=out)
+    assert count == 2
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {"a": 1, "b": 2}, {"a": 3, "b": None},
+    ]
+
+def test_write_rows_csv_with_fields_and_nested_values():
+    """Test CSV honours --fields and JSON-encodes nested values"""
+    out = io.StringIO()
+    write_rows([{"id": 1, "tags": ["x", "y"], "skip": True}], "csv", parse_fields("id, tags"), out=out)
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == [["id", "tags"], ["1", '["x","y"]']]
+
+def test_write_rows_is_incremental():
+    """Test rows are consumed lazily, one at a time"""
+    seen = []
+    
+    def rows():
+        for i in range(3):
+            seen.append(i)
+            yield {"i": i}
+    out = io.StringIO()
+    write_rows(rows(), "ndjson", out=out)
+    assert seen == [0, 1, 2]
+    assert out.getvalue().count("\n") == 3
+
+@pytest.mark.parametrize("args, first_field", [
+    (["api", "list"], "name"),
+    (["team", "list"], "email"),
+    (["marketplace", "browse"], "name"),
+])
+def test_list_commands_emit_ndjson(args, first_field):
+    """Test list commands write one JSON object per row and nothing else"""
+    result = runner.invoke(app, [*args, "--output", "ndjson"])
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert rows and first_field in rows[0]
+
+def test_ask_csv_flattens_list_results():
+    """Test ask --output csv writes only CSV"""
+    result = runner.invoke(app, ["ask", "weather", "--output", "csv", "--fields", "message"])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["message", "Mock result for: weather"]
+
+def test_history_csv():
+    """Test query history exports selected columns"""
+    result = runner.invoke(app, ["query", "history", "--output", "csv", "--fields", "query,api"])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "query,api"
+    assert "get weather in SF,Mock Weather" in lines
+
+def test_diagnostics_go_to_stderr(capsys):
+    """Test --verbose stats and download summaries never land on stdout"""
+    print_transfer_stats({"bytes_uncompressed": 2048, "bytes_sent": 512, "retries": 1})
+    print_download_summary({"bytes_written": 10, "bytes_received": 10, "elapsed_ms": 5}, "out.json")
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Upload" in captured.err and "Saved" in captured.err
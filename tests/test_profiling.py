@@ -0,0 +1,77 @@
+"""
+Tests for client-side timing instrumentation
+"""
+
+import json
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from outris import profiling
+from outris.client import RealBackendClient
+from outris.main import app
+from outris.mock_server import MockServer
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+runner = CliRunner()
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    yield
+    profiling.disable()
+
+def test_span_is_noop_when_disabled():
+    """Test spans record nothing unless profiling is enabled"""
+    with profiling.span("work"):
+        pass
+    assert profiling.get_tracer() is None
+
+def test_summary_and_chrome_trace():
+    """Test span aggregation and trace-event export"""
+    tracer = profiling.enable()
+    for _ in range(2):
+        with profiling.span("work", size=1):
+            time.sleep(0.001)
+    profiling.annotate(server_time_ms=12)
+
+    summary = tracer.summary()
+    assert summary["work"]["count"] == 2
+    assert summary["work"]["mean_ms"] >= 1
+
+    trace = tracer.to_chrome_trace()
+    events = [event for event in trace["traceEvents"] if event["name"] == "work"]
+    assert [event["ph"] for event in events] == ["X", "X"]
+    assert events[0]["args"] == {"size": 1}
+    assert trace["otherData"] == {"server_time_ms": 12}
+
+def test_real_client_records_network_phases():
+    """Test connect, TTFB, download and decode spans for a real request"""
+    server = MockServer().start()
+    try:
+        tracer = profiling.enable()
+        with RealBackendClient(base_url=server.url) as client:
+            client.list_team()
+            client.list_team()
+    finally:
+        server.stop()
+
+    summary = tracer.summary()
+    # The second request reuses the pooled connection
+    assert summary["connect"]["count"] == 1
+    assert summary["dns"]["count"] == 1
+    for name in ("http.request", "http.ttfb", "http.download", "json.decode"):
+        assert summary[name]["count"] == 2
+
+def test_profile_flag_writes_trace(tmp_path, monkeypatch):
+    """Test --profile prints a breakdown and --trace-file writes Chrome JSON"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    trace_file = tmp_path / "trace.json"
+    result = runner.invoke(app, ["--profile", "--trace-file", str(trace_file), "ask", "weather", "--output", "json"])
+
+    assert result.exit_code == 0
+    assert "render" in result.output
+    trace = json.loads(trace_file.read_text())
+    assert any(event["name"] == "render" for event in trace["traceEvents"])
+    assert trace["otherData"]["server_time_ms"] == 123
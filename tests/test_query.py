@@ -0,0 +1,101 @@
+"""
+Tests for query commands
+"""
+
+import json
+import pytest
+from typer.testing import CliRunner
+
+from outris.commands.query import app
+from outris.utils.concurrency import bounded_map
+from outris.utils.stats import latency_summary
+
+runner = CliRunner(mix_stderr=False)
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+@pytest.fixture(autouse=True)
+def mock_backend(monkeypatch):
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+
+def test_batch_jsonl_ordered(tmp_path):
+    """Test batch streams one NDJSON record per query in input order"""
+    queries = tmp_path / "queries.jsonl"
+    queries.write_text('"weather in SF"\n{"id": "q2", "query": "weather in NYC"}\n')
+    
+    result = runner.invoke(app, ["batch", str(queries), "-j", "4", "--ordered"])
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["index"] for r in records] == [0, 1]
+    assert records[1]["id"] == "q2"
+    assert records[1]["result"]["result"]["message"] == "Mock result for: weather in NYC"
+    assert "q/s" in result.stderr
+
+def test_batch_csv(tmp_path):
+    """Test batch reads queries from the query column of a CSV file"""
+    queries = tmp_path / "queries.csv"
+    queries.write_text("id,query\na,first\nb,second\n")
+    
+    result = runner.invoke(app, ["batch", str(queries)])
+    assert result.exit_code == 0
+    assert sorted(json.loads(l)["id"] for l in result.stdout.splitlines()) == ["a", "b"]
+
+def test_bounded_map_captures_errors():
+    """Test failures are reported per item instead of aborting the run"""
+    def fn(x):
+        if x == 3:
+            raise ValueError("boom")
+        return x * 2
+    
+    outcomes = list(bounded_map(fn, range(6), workers=2, ordered=True))
+    assert [o.value for o in outcomes if o.ok] == [0, 2, 4, 8, 10]
+    assert str(outcomes[3].error) == "boom"
+
+def test_latency_summary():
+    """Test nearest-rank percentiles"""
+    summary = latency_summary(range(1, 101))
+    assert summary == {"p50": 50, "p95": 95, "p99": 99}
+
+def test_pipe_one_result_per_line():
+    """Test pipe writes compact JSON lines in input order"""
+    result = runner.invoke(app, ["pipe", "-j", "4"], input="first\n\nsecond\nthird\n")
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert [json.loads(l)["query"] for l in lines] == ["first", "second", "third"]
+    assert ", " not in lines[0]
+
+def test_pipe_exits_quietly_when_reader_goes_away(tmp_path):
+    """Test `pipe | head -1` exits 0 without a BrokenPipeError at interpreter shutdown"""
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+    
+    env = dict(os.environ, OUTRIS_USE_MOCK="true", HOME=str(tmp_path),
+               PYTHONPATH=str(Path(__file__).resolve().parent.parent))
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from outris.main import app; app()", "query", "pipe", "-j", "4"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
+    )
+    proc.stdin.write("".join(f"q{i}\n" for i in range(5000)).encode())
+    proc.stdin.close()
+    assert json.loads(proc.stdout.readline())["query"] == "q0"
+    proc.stdout.close()
+    stderr = proc.stderr.read().decode()
+    assert proc.wait(30) == 0, stderr
+    assert "BrokenPipeError" not in stderr
+
+def test_bounded_map_window_limits_reads():
+    """Test input is consumed lazily, never more than the window ahead"""
+    consumed = []
+    
+    def source():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+    
+    outcomes = bounded_map(lambda x: x, source(), workers=2, ordered=True, window=4)
+    first = next(outcomes)
+    assert first.value == 0
+    assert len(consumed) <= 5
+    outcomes.close()
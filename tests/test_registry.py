@@ -0,0 +1,98 @@
+"""
+Tests for incremental spec re-registration
+"""
+
+import json
+
+import pytest
+
+from outris.client import MockBackendClient, RealBackendClient
+from outris.registry import SpecRegistry, register_spec
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets"},
+    "paths": {
+        "/pets": {"get": {"summary": "List pets"}, "post": {"summary": "Add a pet"}},
+        "/owners": {"get": {"summary": "List owners"}},
+    },
+}
+
+class CountingClient(MockBackendClient):
+    def __init__(self):
+        self.calls = []
+    
+    def register_api(self, spec, name, visibility):
+        self.calls.append(("register", spec))
+        return super().register_api(spec, name, visibility)
+    
+    def update_api_spec(self, api_id, patch):
+        self.calls.append(("patch", patch))
+        return super().update_api_spec(api_id, patch)
+
+def _edited():
+    spec = json.loads(json.dumps(SPEC))
+    spec["paths"]["/pets"]["get"]["summary"] = "List all pets"
+    del spec["paths"]["/owners"]
+    return spec
+
+def test_unchanged_spec_is_skipped():
+    """Test a second identical registration never contacts the backend"""
+    client, registry = CountingClient(), SpecRegistry()
+    assert register_spec(client, SPEC, "Pets", "org", registry)["change"]["mode"] == "new"
+    registry.save()
+    
+    # A fresh registry reads the hashes back from disk
+    result = register_spec(client, json.loads(json.dumps(SPEC)), "Pets", "org", SpecRegistry())
+    assert result["change"]["mode"] == "unchanged"
+    assert result["api_id"] == "api_mock_456"
+    assert [kind for kind, _ in client.calls] == ["register"]
+
+def test_save_writes_once_and_merges_concurrent_commands():
+    """Test puts stay in memory until save, which keeps entries saved by other registries"""
+    first, second = SpecRegistry(), SpecRegistry()
+    register_spec(CountingClient(), SPEC, "Pets", "org", first)
+    register_spec(CountingClient(), SPEC, "Shop", "org", second)
+    assert not first.path.exists()
+    
+    first.save()
+    second.save()
+    stored = SpecRegistry()
+    assert stored.get("Pets", "org") is not None
+    assert stored.get("Shop", "org") is not None
+
+def test_changed_spec_sends_patch():
+    """Test only changed operations are sent, with the base hash"""
+    client, registry = CountingClient(), SpecRegistry()
+    register_spec(client, SPEC, "Pets", "org", registry)
+    base = registry.get("Pets", "org")["hashes"]["spec"]
+    
+    result = register_spec(client, _edited(), "Pets", "org", registry)
+    assert result["change"] == {"mode": "patched", "added": [], "modified": ["GET /pets"], "removed": ["GET /owners"]}
+    kind, patch = client.calls[-1]
+    assert kind == "patch" and patch["base_hash"] == base
+    assert patch["paths"] == {"/pets": {"get": {"summary": "List all pets"}}}
+    assert "document" not in patch
+
+def test_force_uploads_in_full():
+    """Test --force bypasses the stored hashes"""
+    client, registry = CountingClient(), SpecRegistry()
+    register_spec(client, SPEC, "Pets", "org", registry)
+    assert register_spec(client, SPEC, "Pets", "org", registry, force=True)["change"]["mode"] == "new"
+    assert [kind for kind, _ in client.calls] == ["register", "register"]
+
+def test_backend_without_patch_falls_back(stub_backend):
+    """Test a 404 on PATCH falls back to a full upload and isn't retried for later specs"""
+    stub_backend.route("POST", "/api/v1/apis/register", lambda request, body: (200, {}, {
+        "api_id": "api_1", "name": "Pets", "endpoints": 2, "intent_mappings": 3, "visibility": "org"}))
+    client, registry = RealBackendClient(base_url=stub_backend.url), SpecRegistry()
+    
+    register_spec(client, SPEC, "Pets", "org", registry)
+    result = register_spec(client, _edited(), "Pets", "org", registry)
+    assert result["change"]["mode"] == "full"
+    assert result["change"]["modified"] == ["GET /pets"]
+    assert not registry.patch_supported
+    assert len(stub_backend.calls("PATCH", "/api/v1/apis/api_1/spec")) == 1
+    assert len(stub_backend.calls("POST", "/api/v1/apis/register")) == 2
@@ -0,0 +1,60 @@
+"""
+Tests for size-aware result rendering
+"""
+
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from outris.utils import render
+from outris.utils.render import render_json
+
+def _console(terminal: bool) -> Console:
+    return Console(file=io.StringIO(), width=100, force_terminal=terminal)
+
+def _big(rows: int = 5000) -> dict:
+    return {"data": [{"id": i, "name": f"item {i}"} for i in range(rows)]}
+
+def test_small_result_is_highlighted_in_a_panel():
+    """Test small results keep the Rich panel on a terminal"""
+    console = _console(terminal=True)
+    render_json({"a": 1}, console, title="Result")
+    output = console.file.getvalue()
+    assert "Result" in output
+    assert "╭" in output
+    assert "\x1b[" in output
+
+def test_large_result_streams_without_highlighting():
+    """Test large terminal output is plain text and truncated at max_bytes"""
+    console = _console(terminal=True)
+    render_json(_big(), console, title="Result", max_bytes=10_000, pager=False)
+    output = console.file.getvalue()
+    body = output.split("\n", 1)[1]
+    assert '"id": 0' in body
+    assert "truncated at 10,000 bytes" in output
+    assert len(output) < 12_000
+
+def test_default_truncation_limit(monkeypatch):
+    """Test unpaged terminal output defaults to DEFAULT_MAX_RENDER_BYTES"""
+    monkeypatch.setattr(render, "DEFAULT_MAX_RENDER_BYTES", 100_000)
+    console = _console(terminal=True)
+    render_json(_big(20_000), console, pager=False)
+    assert len(console.file.getvalue()) < 101_000
+
+def test_non_terminal_output_is_complete_plain_json():
+    """Test piped output skips Rich and is never truncated by default"""
+    console = _console(terminal=False)
+    data = _big()
+    render_json(data, console, title="Result")
+    assert json.loads(console.file.getvalue()) == data
+
+def test_pager_receives_large_results(tmp_path, monkeypatch):
+    """Test --pager streams the full result into $PAGER"""
+    paged = tmp_path / "paged.json"
+    monkeypatch.setenv("PAGER", f"tee {paged}")
+    console = _console(terminal=True)
+    data = _big()
+    render_json(data, console, pager=True)
+    assert json.loads(paged.read_text()) == data
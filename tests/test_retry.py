@@ -0,0 +1,161 @@
+"""
+Tests for retries, backoff and the circuit breaker
+"""
+
+import socket
+
+import pytest
+import requests
+
+from outris.client import RealBackendClient
+from outris.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+def _fast_policy(**options) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **options)
+
+def _flaky(failures: int, status: int = 503, headers: dict = None):
+    """Route handler failing `failures` times before succeeding"""
+    state = {"calls": 0}
+    
+    def handler(request, body):
+        state["calls"] += 1
+        if state["calls"] <= failures:
+            return status, headers or {}, {"detail": "try again"}
+        return 200, {}, {"members": [], "count": 0}
+    return handler
+
+def test_parse_retry_after():
+    """Test delta-seconds, HTTP dates and garbage"""
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+def test_backoff_is_jittered_and_capped():
+    """Test full-jitter exponential backoff and Retry-After capping"""
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    assert all(0 <= policy.backoff(1) <= 1.0 for _ in range(20))
+    assert all(0 <= policy.backoff(10) <= 4.0 for _ in range(20))
+    assert policy.backoff(1, retry_after=2.0) == 2.0
+    assert policy.backoff(1, retry_after=60.0) == 4.0
+
+def test_post_retry_requires_idempotency_key():
+    """Test POSTs are only retried on 5xx when they carry an idempotency key"""
+    policy = RetryPolicy()
+    assert policy.should_retry_status(503, "GET", {})
+    assert not policy.should_retry_status(503, "POST", {})
+    assert policy.should_retry_status(503, "POST", {"Idempotency-Key": "k"})
+    assert policy.should_retry_status(429, "POST", {})
+    assert not policy.should_retry_status(400, "GET", {})
+
+def test_get_retries_until_success(stub_backend):
+    """Test transient 503s are retried and counted"""
+    stub_backend.route("GET", "/api/v1/team/members", _flaky(2))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy())
+    
+    assert client.list_team()["count"] == 0
+    assert len(stub_backend.calls("GET", "/api/v1/team/members")) == 3
+    assert client.stats["retries"] == 2
+    assert client.stats["retry_wait_s"] > 0
+
+def test_gives_up_after_max_attempts(stub_backend):
+    """Test the final failure is raised once attempts run out"""
+    stub_backend.route("GET", "/api/v1/team/members", _flaky(10))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy(max_attempts=3),
+                               breaker=CircuitBreaker(failure_threshold=100))
+    
+    with pytest.raises(requests.HTTPError):
+        client.list_team()
+    assert len(stub_backend.calls("GET", "/api/v1/team/members")) == 3
+
+def test_retry_after_is_honoured(stub_backend):
+    """Test the Retry-After header sets the wait on 429"""
+    stub_backend.route("POST", "/api/v1/team/invite", _flaky(1, 429, {"Retry-After": "0.05"}))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=RetryPolicy(max_delay=1.0))
+    
+    client.invite_member("a@b.co", "member")
+    assert client.stats["retry_wait_s"] == pytest.approx(0.05)
+
+def test_post_reuses_idempotency_key(stub_backend, monkeypatch):
+    """Test every attempt of a POST sends the same idempotency key"""
+    monkeypatch.setenv("OUTRIS_IDEMPOTENCY_KEYS", "true")
+    stub_backend.route("POST", "/api/v1/team/invite", _flaky(1, 502))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy())
+    
+    client.invite_member("a@b.co", "member")
+    keys = {r["headers"]["Idempotency-Key"] for r in stub_backend.calls("POST", "/api/v1/team/invite")}
+    assert len(keys) == 1
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_query_is_not_resent_by_default(stub_backend, status):
+    """Test a POST query without an idempotency key fails on the first 5xx"""
+    stub_backend.route("POST", "/api/v1/query", _flaky(1, status))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy())
+    
+    with pytest.raises(requests.HTTPError):
+        client.query("weather")
+    calls = stub_backend.calls("POST", "/api/v1/query")
+    assert len(calls) == 1
+    assert "Idempotency-Key" not in calls[0]["headers"]
+
+def test_query_is_resent_with_idempotency_keys(stub_backend, monkeypatch):
+    """Test opting in to idempotency keys makes a POST query retryable"""
+    monkeypatch.setenv("OUTRIS_IDEMPOTENCY_KEYS", "true")
+    stub_backend.route("POST", "/api/v1/query", _flaky(1, 503))
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy())
+    
+    client.query("weather")
+    assert len(stub_backend.calls("POST", "/api/v1/query")) == 2
+    assert client.stats["retries"] == 1
+
+def test_connection_refused_is_retried():
+    """Test connect failures are retried and then raised"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    client = RealBackendClient(base_url=f"http://127.0.0.1:{port}", retry_policy=_fast_policy(max_attempts=3))
+    
+    with pytest.raises(requests.ConnectionError):
+        client.query("weather")
+    assert client.stats["retries"] == 2
+
+def test_circuit_breaker_fails_fast(stub_backend):
+    """Test the circuit opens after repeated failures and recovers after the reset timeout"""
+    stub_backend.route("GET", "/api/v1/team/members", _flaky(2))
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy(), breaker=breaker)
+    
+    with pytest.raises(CircuitOpenError):
+        client.list_team()
+    assert breaker.state == "open"
+    assert client.stats["circuit_opened"] == 1
+    assert len(stub_backend.calls("GET", "/api/v1/team/members")) == 2
+    
+    import time
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    assert client.list_team()["count"] == 0
+    assert breaker.state == "closed"
+
+def test_unexpected_error_ends_half_open_trial(stub_backend):
+    """Test a trial call failing with an unexpected error doesn't wedge the breaker"""
+    calls = {"n": 0}
+
+    def handler(request, body):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return 200, {"Content-Encoding": "gzip"}, b"not gzip"
+        return 200, {}, {"members": [], "count": 0}
+    stub_backend.route("GET", "/api/v1/team/members", handler)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=_fast_policy(), breaker=breaker)
+    breaker.record_failure()
+    
+    import time
+    time.sleep(0.02)
+    with pytest.raises(requests.exceptions.ContentDecodingError):
+        client.list_team()
+    assert client.list_team()["count"] == 0
+    assert breaker.state == "closed"
@@ -0,0 +1,169 @@
+"""
+Tests for the adaptive bulk scheduler
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+from typer.testing import CliRunner
+
+from outris import profiling
+from outris.client import RealBackendClient
+from outris.retry import RetryPolicy
+from outris.scheduler import AdaptiveScheduler, TokenBucket, parse_rate_limit
+
+runner = CliRunner(mix_stderr=False)
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+def _overloaded() -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = 503
+    return requests.HTTPError(response=response)
+
+def test_parse_rate_limit():
+    """Test X-RateLimit-*, RateLimit-* and epoch resets"""
+    assert parse_rate_limit({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "40",
+                             "X-RateLimit-Reset": "10"}) == (100.0, 40.0, 10.0)
+    limit, remaining, reset = parse_rate_limit({"RateLimit-Remaining": "5",
+                                                "RateLimit-Reset": str(time.time() + 30)})
+    assert (limit, remaining) == (5.0, 5.0) and 29 < reset <= 30
+    assert parse_rate_limit({"Content-Type": "application/json"}) is None
+
+def test_token_bucket_paces_to_remaining_quota():
+    """Test the advertised quota is spread over the window and exhaustion pauses"""
+    bucket = TokenBucket()
+    assert bucket.reserve() == 0.0
+    bucket.update(limit=10, remaining=10, reset=1.0, demand=20)
+    waits = [bucket.reserve() for _ in range(3)]
+    assert waits[0] == 0.0
+    assert waits[2] == pytest.approx(0.2, abs=0.02)
+
+    bucket.update(limit=10, remaining=0, reset=0.5)
+    assert bucket.reserve() > 0.4
+
+def test_token_bucket_unpaced_while_quota_covers_demand():
+    """Test a large remaining quota doesn't slow anything down"""
+    bucket = TokenBucket()
+    bucket.update(limit=5000, remaining=4999, reset=3600, demand=48)
+    assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+
+def test_aimd_halves_on_overload_and_grows_on_success():
+    """Test multiplicative decrease on overload errors and additive increase after"""
+    scheduler = AdaptiveScheduler(max_concurrency=16, initial_concurrency=8)
+    with pytest.raises(requests.HTTPError):
+        scheduler.run(lambda _: (_ for _ in ()).throw(_overloaded()), None)
+    assert scheduler.concurrency == 4
+
+    for _ in range(20):
+        scheduler.run(lambda _: None, None)
+    assert scheduler.concurrency > 4
+    assert scheduler.snapshot()["decreases"] == 1
+
+def test_mixed_latency_without_errors_keeps_full_concurrency():
+    """Test widely varying latencies alone never lower the limit"""
+    scheduler = AdaptiveScheduler(max_concurrency=16)
+    delays = [0.001, 0.04, 0.002, 0.03, 0.001, 0.05, 0.003, 0.02] * 20
+    started = time.perf_counter()
+    outcomes = list(scheduler.map(time.sleep, delays))
+    elapsed = time.perf_counter() - started
+    
+    assert all(outcome.ok for outcome in outcomes)
+    state = scheduler.snapshot()
+    assert state["decreases"] == 0
+    assert state["concurrency"] == 16 and state["peak_concurrency"] >= 15
+    # Serialized these would take ~3s; at 16 wide it's ~0.2s
+    assert elapsed < 1.0
+
+def test_client_errors_do_not_reduce_concurrency():
+    """Test errors unrelated to load leave the limit alone"""
+    scheduler = AdaptiveScheduler(max_concurrency=8)
+    with pytest.raises(ValueError):
+        scheduler.run(lambda _: (_ for _ in ()).throw(ValueError("bad spec")), None)
+    assert scheduler.concurrency == 8
+
+def test_map_never_exceeds_concurrency():
+    """Test tasks beyond the limit queue until a slot frees up"""
+    scheduler = AdaptiveScheduler(max_concurrency=3)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work(item):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return item * 2
+
+    outcomes = list(scheduler.map(work, range(12), ordered=True))
+    assert [o.value for o in outcomes] == [i * 2 for i in range(12)]
+    assert peak[0] <= 3
+    assert scheduler.snapshot()["in_flight"] == 0
+
+def test_client_honours_retry_after_across_requests(stub_backend):
+    """Test a 429 pauses the endpoint for bulk work and counts a throttle event"""
+    calls = []
+
+    def handler(request, body):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {"Retry-After": "0.2"}, {"detail": "slow down"}
+        return 200, {}, {"members": [], "count": 0}
+    stub_backend.route("GET", "/api/v1/team/members", handler)
+
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(requests.HTTPError):
+        client.scheduler.run(lambda _: client.list_team(), None)
+    client.scheduler.run(lambda _: client.list_team(), None)
+    assert calls[1] - calls[0] >= 0.19
+    assert client.scheduler.snapshot()["throttle_events"] == 1
+
+def test_interactive_requests_are_not_paced(stub_backend):
+    """Test calls outside scheduler tasks ignore the endpoint's pause"""
+    calls = []
+
+    def handler(request, body):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {"Retry-After": "0.5"}, {"detail": "slow down"}
+        return 200, {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "60"}, \
+            {"members": [], "count": 0}
+    stub_backend.route("GET", "/api/v1/team/members", handler)
+
+    client = RealBackendClient(base_url=stub_backend.url, retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(requests.HTTPError):
+        client.list_team()
+    for _ in range(3):
+        client.list_team()
+    assert calls[-1] - calls[0] < 0.3
+
+def test_profile_records_scheduler_state():
+    """Test --profile sees concurrency and queue depth counters"""
+    tracer = profiling.enable()
+    try:
+        scheduler = AdaptiveScheduler(max_concurrency=2)
+        list(scheduler.map(lambda item: time.sleep(0.01), range(6)))
+    finally:
+        profiling.disable()
+    counters = [e for e in tracer.to_chrome_trace()["traceEvents"] if e["ph"] == "C"]
+    assert counters and all(e["args"]["in_flight"] <= 2 for e in counters)
+    assert max(e["args"]["queue_depth"] for e in counters) > 0
+    assert tracer.metadata["scheduler.peak_concurrency"] == 2
+
+def test_bulk_invite_and_install(monkeypatch, tmp_path):
+    """Test invite and install take many targets and report each"""
+    from outris.commands import marketplace, team
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    emails = tmp_path / "emails.txt"
+    emails.write_text("b@acme.com\nc@acme.com\n")
+
+    result = runner.invoke(team.app, ["invite", "a@acme.com", "--from-file", str(emails)])
+    assert result.exit_code == 0, result.stdout
+    assert "Invited 3 of 3 as member" in result.stdout
+
+    result = runner.invoke(marketplace.app, ["install", "Stripe Demo", "GitHub Demo"])
+    assert result.exit_code == 0, result.stdout
+    assert "Installed 2 of 2" in result.stdout
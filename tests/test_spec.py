@@ -0,0 +1,148 @@
+"""
+Tests for OpenAPI spec loading and pruning
+"""
+
+import json
+
+from outris.spec import (
+    detect_format, diff_operations, find_specs, load_spec, parse_specs, prune_spec, spec_hashes, spec_patch,
+)
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets"},
+    "paths": {
+        "/pets": {"get": {"responses": {"200": {"content": {"application/json": {
+            "schema": {"$ref": "#/components/schemas/PetList"}}}}}}},
+        "/owners": {"get": {"responses": {"200": {"content": {"application/json": {
+            "schema": {"$ref": "#/components/schemas/Owner"}}}}}}},
+    },
+    "components": {
+        "schemas": {
+            "PetList": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+            "Pet": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Unused": {"type": "string"},
+        },
+        "securitySchemes": {"key": {"type": "apiKey", "in": "header", "name": "X-Key"}},
+    },
+}
+
+def test_detect_format_by_content(tmp_path):
+    """Test JSON is detected even with a .yaml extension, and vice versa"""
+    json_file = tmp_path / "spec.yaml"
+    json_file.write_text("\n  " + json.dumps(SPEC))
+    yaml_file = tmp_path / "spec.json"
+    yaml_file.write_text("openapi: 3.0.0\ninfo:\n  title: Pets\npaths: {}\n")
+    
+    assert detect_format(json_file) == "json"
+    assert load_spec(json_file) == SPEC
+    assert detect_format(yaml_file) == "yaml"
+    assert load_spec(yaml_file)["info"]["title"] == "Pets"
+
+def test_prune_spec():
+    """Test unused components are dropped and duplicates collapsed"""
+    spec = json.loads(json.dumps(SPEC))
+    stats = prune_spec(spec)
+    
+    schemas = spec["components"]["schemas"]
+    assert sorted(schemas) == ["Pet", "PetList"]
+    assert stats == {"deduplicated": 1, "unused": 1}
+    owners = spec["paths"]["/owners"]["get"]["responses"]["200"]["content"]["application/json"]
+    assert owners["schema"]["$ref"] == "#/components/schemas/Pet"
+    assert "key" in spec["components"]["securitySchemes"]
+
+def test_prune_keeps_components_behind_deep_refs():
+    """Test a ref into part of a component keeps (and dedupes) the whole component"""
+    spec = {"paths": {"/pets/{id}": {"get": {"parameters": [
+        {"name": "id", "in": "path", "schema": {"$ref": "#/components/schemas/Pet/properties/id"}},
+        {"name": "tag", "in": "query", "schema": {"$ref": "#/components/schemas/Animal/properties/id"}},
+    ]}}}, "components": {"schemas": {
+        "Pet": {"type": "object", "properties": {"id": {"type": "integer"}}},
+        "Animal": {"type": "object", "properties": {"id": {"type": "integer"}}},
+    }}}
+    stats = prune_spec(spec)
+    
+    assert stats == {"deduplicated": 1, "unused": 0}
+    assert list(spec["components"]["schemas"]) == ["Pet"]
+    params = spec["paths"]["/pets/{id}"]["get"]["parameters"]
+    assert params[1]["schema"]["$ref"] == "#/components/schemas/Pet/properties/id"
+
+def test_prune_keeps_discriminator_mapping_targets():
+    """Test schemas named only in a discriminator mapping survive pruning"""
+    spec = {"paths": {"/pets": {"get": {"responses": {"200": {"content": {"application/json": {"schema": {
+        "oneOf": [{"$ref": "#/components/schemas/Cat"}],
+        "discriminator": {"propertyName": "kind", "mapping": {"cat": "#/components/schemas/Cat", "dog": "Dog"}},
+    }}}}}}}}, "components": {"schemas": {
+        "Cat": {"type": "object", "properties": {"meows": {"type": "boolean"}}},
+        "Dog": {"type": "object", "properties": {"barks": {"type": "boolean"}}},
+        "Unused": {"type": "string"},
+    }}}
+    assert prune_spec(spec) == {"deduplicated": 0, "unused": 1}
+    assert sorted(spec["components"]["schemas"]) == ["Cat", "Dog"]
+
+def test_find_specs_expands_directories_and_globs(tmp_path):
+    """Test directories are searched recursively and globs expanded, without duplicates"""
+    (tmp_path / "svc" / "nested").mkdir(parents=True)
+    for name in ("svc/a.yaml", "svc/nested/b.json", "svc/README.md", "c.yml"):
+        (tmp_path / name).write_text("openapi: 3.0.0\n")
+    
+    found = find_specs([str(tmp_path / "svc"), str(tmp_path / "*.yml"), str(tmp_path / "svc" / "a.yaml")])
+    assert [p.name for p in found] == ["a.yaml", "b.json", "c.yml"]
+    assert find_specs([str(tmp_path / "missing-*.yaml")]) == []
+
+def test_parse_specs_in_parallel(tmp_path):
+    """Test specs parse on a process pool and failures are captured per file"""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"spec{i}.json"
+        path.write_text(json.dumps({**SPEC, "info": {"title": f"Pets {i}"}}))
+        paths.append(path)
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("openapi: [unclosed\n")
+    
+    parsed = {p.path.name: p for p in parse_specs(paths + [bad], prune=True, workers=2)}
+    assert len(parsed) == 5
+    assert parsed["spec3.json"].spec["info"]["title"] == "Pets 3"
+    assert parsed["spec0.json"].pruned == {"deduplicated": 1, "unused": 1}
+    assert not parsed["bad.yaml"].ok and "Error" in parsed["bad.yaml"].error
+
+def test_spec_hashes_ignore_key_order_and_follow_refs():
+    """Test hashes are order-insensitive and a shared schema edit marks its users modified"""
+    reordered = json.loads(json.dumps(SPEC, sort_keys=True))
+    assert spec_hashes(reordered) == spec_hashes(SPEC)
+    
+    edited = json.loads(json.dumps(SPEC))
+    edited["components"]["schemas"]["Pet"]["properties"]["age"] = {"type": "integer"}
+    edited["paths"]["/vets"] = {"get": {}}
+    del edited["paths"]["/owners"]
+    before, after = spec_hashes(SPEC), spec_hashes(edited)
+    assert before["spec"] != after["spec"] and before["document"] != after["document"]
+    assert diff_operations(before["operations"], after["operations"]) == {
+        "added": ["GET /vets"], "removed": ["GET /owners"], "modified": ["GET /pets"],
+    }
+
+def test_spec_hashes_follow_reference_cycles():
+    """Test an edit anywhere in a ref cycle marks the operations that reach it"""
+    spec = {"paths": {
+        "/a": {"get": {"schema": {"$ref": "#/components/schemas/A"}}},
+        "/c": {"get": {"schema": {"$ref": "#/components/schemas/C"}}},
+    }, "components": {"schemas": {
+        "A": {"properties": {"b": {"$ref": "#/components/schemas/B"}}},
+        "B": {"properties": {"a": {"$ref": "#/components/schemas/A"}, "c": {"$ref": "#/components/schemas/C"}}},
+        "C": {"type": "string"},
+    }}}
+    edited = json.loads(json.dumps(spec))
+    edited["components"]["schemas"]["B"]["description"] = "changed"
+    assert diff_operations(spec_hashes(spec)["operations"], spec_hashes(edited)["operations"])["modified"] == ["GET /a"]
+    
+    edited["components"]["schemas"]["C"]["format"] = "email"
+    assert diff_operations(spec_hashes(spec)["operations"], spec_hashes(edited)["operations"])["modified"] == [
+        "GET /a", "GET /c"]
+
+def test_spec_patch_holds_only_changes():
+    """Test a patch carries changed operations and the document only when it changed"""
+    changes = {"added": ["GET /owners"], "removed": ["DELETE /pets"], "modified": []}
+    patch = spec_patch(SPEC, changes, document_changed=False)
+    assert patch == {"paths": {"/owners": SPEC["paths"]["/owners"]}, "removed": ["DELETE /pets"]}
+    assert "components" in spec_patch(SPEC, changes, document_changed=True)["document"]
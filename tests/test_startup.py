@@ -0,0 +1,64 @@
+"""
+Startup-time budget for the outris entry point
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time of outris.main, in ms. It measures ~180ms, nearly all
+# typer and rich, so this catches any heavy import creeping back in; raise it
+# with OUTRIS_STARTUP_BUDGET_MS on slow CI machines.
+STARTUP_BUDGET_MS = int(os.getenv("OUTRIS_STARTUP_BUDGET_MS", "300"))
+
+HEAVY_MODULES = ["yaml", "requests", "httpx"]
+
+ENTRY_SCRIPT = """
+import atexit, sys
+atexit.register(lambda: sys.stderr.write("MODULES " + " ".join(sys.modules) + "\\n"))
+from outris.main import app
+app()
+"""
+
+def _run_outris(*args):
+    """Run the outris entry point, returning (result, loaded modules, import times in us)"""
+    env = dict(os.environ, OUTRIS_USE_MOCK="true", PYTHONPATH=str(REPO_ROOT), HOME=tempfile.mkdtemp())
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_SCRIPT, *args],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    modules, import_times = set(), {}
+    for line in result.stderr.splitlines():
+        if line.startswith("MODULES "):
+            modules = set(line.split()[1:])
+        elif line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                import_times[name.strip()] = int(cumulative)
+    return result, modules, import_times
+
+def test_help_does_not_import_commands():
+    """Test `outris --help` doesn't load command modules or their dependencies"""
+    result, modules, _ = _run_outris("--help")
+    assert result.returncode == 0
+    assert "ask" in result.stdout
+    loaded = [m for m in HEAVY_MODULES if m in modules]
+    loaded += [m for m in modules if m.startswith("outris.commands.")]
+    assert loaded == []
+
+def test_ask_only_imports_query_command():
+    """Test `outris ask` loads the query module but not unrelated commands"""
+    result, modules, _ = _run_outris("ask", "weather in SF")
+    assert result.returncode == 0, result.stderr
+    assert "outris.commands.query" in modules
+    for module in ["outris.commands.api", "outris.commands.team"] + HEAVY_MODULES:
+        assert module not in modules
+
+def test_startup_budget():
+    """Test cold import of the entry point stays within the startup budget"""
+    _, _, import_times = _run_outris("--help")
+    assert import_times["outris.main"] / 1000 < STARTUP_BUDGET_MS
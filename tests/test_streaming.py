@@ -0,0 +1,82 @@
+"""
+Tests for streamed query responses
+"""
+
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from outris.client import RealBackendClient
+from outris.main import app
+from outris.mock_server import MockServer, MockServerConfig
+from outris.streaming import QueryEvent, StreamError, parse_ndjson, parse_sse, result_from_events
+
+pytestmark = pytest.mark.usefixtures("config_home")
+
+runner = CliRunner()
+
+def test_parse_sse():
+    """Test event names, multi-line data, comments and the final unterminated event"""
+    lines = [
+        ": keep-alive", "event: stage", 'data: {"stage": "api_selected",', 'data:  "message": "Weather"}', "",
+        "event: result", 'data: {"ok": true}',
+    ]
+    assert list(parse_sse(lines)) == [
+        QueryEvent("stage", {"stage": "api_selected", "message": "Weather"}),
+        QueryEvent("result", {"ok": True}),
+    ]
+
+def test_parse_ndjson():
+    """Test chunked NDJSON events"""
+    lines = ['{"event": "partial", "data": [1]}', "", '{"event": "result", "data": {"ok": true}}']
+    assert [e.type for e in parse_ndjson(lines)] == ["partial", "result"]
+
+def test_result_from_events_raises_stream_errors():
+    """Test error events and missing results surface as StreamError"""
+    with pytest.raises(StreamError, match="planner failed"):
+        result_from_events([QueryEvent("error", {"detail": "planner failed"})])
+    with pytest.raises(StreamError):
+        result_from_events([QueryEvent("stage", {})])
+
+def test_events_arrive_progressively():
+    """Test the first stage is seen well before the final result"""
+    server = MockServer(config=MockServerConfig(chunk_delay=0.1)).start()
+    try:
+        client = RealBackendClient(base_url=server.url)
+        start = time.perf_counter()
+        arrivals = [(event.type, time.perf_counter() - start) for event in client.query_stream("weather")]
+    finally:
+        server.stop()
+    
+    assert [kind for kind, _ in arrivals] == ["stage", "stage", "stage", "partial", "result"]
+    assert arrivals[0][1] < 0.1
+    assert arrivals[-1][1] >= 0.35
+
+def test_closing_stream_aborts_early():
+    """Test abandoning the generator stops reading the response"""
+    server = MockServer(config=MockServerConfig(chunk_delay=0.2)).start()
+    try:
+        client = RealBackendClient(base_url=server.url)
+        events = client.query_stream("weather")
+        start = time.perf_counter()
+        assert next(events).type == "stage"
+        events.close()
+        assert time.perf_counter() - start < 0.2
+    finally:
+        server.stop()
+
+def test_falls_back_without_stream_endpoint(stub_backend):
+    """Test backends without /query/stream get a plain query"""
+    stub_backend.route("POST", "/api/v1/query", lambda request, body: (200, {}, {"result": {}, "api_used": "Stub"}))
+    client = RealBackendClient(base_url=stub_backend.url)
+    events = list(client.query_stream("weather"))
+    assert events == [QueryEvent("result", {"result": {}, "api_used": "Stub"})]
+
+def test_ask_stream_shows_stages(monkeypatch):
+    """Test ask --stream prints stage progress before the result"""
+    monkeypatch.setenv("OUTRIS_USE_MOCK", "true")
+    result = runner.invoke(app, ["ask", "weather", "--stream"])
+    assert result.exit_code == 0
+    assert result.stdout.index("Intent resolved") < result.stdout.index("API used")
+    assert "API chosen" in result.stdout